@@ -89,10 +89,19 @@ from .functions import (
     RTOL,
     abspath,
     atol,
+    block_cache_size,
+    cdl_cache_size,
+    close_files,
     configuration,
     environment,
+    index_cache_size,
+    lazy,
     log_level,
+    max_open_files,
+    open_files,
+    reduction_block_size,
     rtol,
+    write_block_size,
     _log_level,
     _disable_logging,
     _reset_log_emergence_level,
@@ -113,6 +122,7 @@ from .constructs import Constructs
 from .data import (Data,
                    Array,
                    CompressedArray,
+                   DeferredArray,
                    NumpyArray,
                    NetCDFArray,
                    GatheredArray,
@@ -147,6 +157,8 @@ from .cfdmimplementation import (CFDMImplementation,
                                  implementation)
 
 from .read_write import (read,
+                         read_many,
+                         scan,
                          write)
 
 from .examplefield import example_field
@@ -84,6 +84,52 @@ class CellMeasure(mixin.NetCDFVariable,
 
         self._initialise_netcdf(source)
 
+    def _equals_fingerprint(self, ignore_data_type=False,
+                            ignore_fill_value=False,
+                            ignore_compression=False,
+                            ignore_properties=(), digest=False):
+        '''Return a structural fingerprint for testing equality.
+
+    Two instances can only be equal if their fingerprints, created
+    with the same parameters, are equal. In addition to the properties
+    and data, the fingerprint records the measure.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `equals`
+
+    :Parameters:
+
+        ignore_data_type: `bool`, optional
+            As for the `equals` method.
+
+        ignore_fill_value: `bool`, optional
+            As for the `equals` method.
+
+        ignore_compression: `bool`, optional
+            As for the `equals` method.
+
+        ignore_properties: sequence of `str`, optional
+            As for the `equals` method.
+
+        digest: `bool`, optional
+            If True then include a digest of the positions of the
+            missing values of the data.
+
+    :Returns:
+
+        `tuple`
+            The fingerprint.
+
+        '''
+        return (super()._equals_fingerprint(
+                    ignore_data_type=ignore_data_type,
+                    ignore_fill_value=ignore_fill_value,
+                    ignore_compression=ignore_compression,
+                    ignore_properties=ignore_properties,
+                    digest=digest),
+                self.get_measure(None))
+
     def creation_commands(self, representative_data=False,
                           namespace=None, indent=0, string=True,
                           name='c', data_name='data', header=True):
@@ -25,11 +25,48 @@ retrieve and set the values with the dedicated get-and-set functions.
     LOG_LEVEL : str
       The minimal level of seriousness for which log messages are shown.
       See `cfdm.log_level`.
+
+    MAX_OPEN_FILES : int
+      The maximum number of netCDF files that may be kept open for
+      reading data. See `cfdm.max_open_files`.
+
+    BLOCK_CACHE_SIZE : int
+      The maximum amount of memory, in bytes, used to cache blocks of
+      data read from netCDF files. See `cfdm.block_cache_size`.
+
+    WRITE_BLOCK_SIZE : int
+      The maximum amount of memory, in bytes, used to write each block
+      of a data array to a netCDF file. See `cfdm.write_block_size`.
+
+    CDL_CACHE_SIZE : int
+      The maximum amount of disk space, in bytes, used to cache netCDF
+      files converted from CDL files. See `cfdm.cdl_cache_size`.
+
+    REDUCTION_BLOCK_SIZE : int
+      The maximum amount of memory, in bytes, used to read each block
+      of a data array when calculating reductions, such as the
+      maximum, of data that is not in memory. See
+      `cfdm.reduction_block_size`.
+
+    LAZY : bool
+      Whether or not operations on data that is not in memory are
+      deferred until its values are required. See `cfdm.lazy`.
+
+    INDEX_CACHE_SIZE : int
+      The maximum amount of memory, in bytes, used to cache the index
+      tables of each compressed array. See `cfdm.index_cache_size`.
 """
 CONSTANTS = {
     'ATOL': sys.float_info.epsilon,
     'RTOL': sys.float_info.epsilon,
     'LOG_LEVEL': logging.getLevelName(logging.getLogger().level),
+    'MAX_OPEN_FILES': 16,
+    'BLOCK_CACHE_SIZE': 0,
+    'WRITE_BLOCK_SIZE': 134217728,
+    'CDL_CACHE_SIZE': 0,
+    'REDUCTION_BLOCK_SIZE': 134217728,
+    'LAZY': False,
+    'INDEX_CACHE_SIZE': 134217728,
 }
 
 
@@ -1,5 +1,7 @@
 import logging
+from collections import Counter
 from copy import deepcopy
+from operator import is_
 
 from . import core
 from . import mixin
@@ -416,6 +418,835 @@ class Constructs(mixin.Container,
 
         return True
 
+    def _equals_fingerprints(self, ignore_data_type=False,
+                             ignore_fill_value=False,
+                             ignore_compression=True, digest=False):
+        '''Return structural fingerprints of the constructs with data.
+
+    Two constructs can only be equal if their fingerprints, created
+    with the same parameters, are equal.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `equals`
+
+    :Parameters:
+
+        ignore_data_type: `bool`, optional
+            As for the `equals` method.
+
+        ignore_fill_value: `bool`, optional
+            As for the `equals` method.
+
+        ignore_compression: `bool`, optional
+            As for the `equals` method.
+
+        digest: `bool`, optional
+            If True then include digests of the data in the
+            fingerprints. Computing the digests may require the data
+            to be read, but the digests are cached.
+
+    :Returns:
+
+        `dict`
+            The fingerprint of each construct that could contain
+            data, keyed by its construct identifier. A fingerprint is
+            `None` if the construct can not create one.
+
+    **Examples:**
+
+    >>> c = {{package}}.example_field(0).constructs
+    >>> c._equals_fingerprints()['dimensioncoordinate2']
+    (((('standard_name', 'time'), ('units', 'days since 2018-12-01')),
+      ((1,), 'days since 2018-12-01', None, dtype('float64'))),
+     None,
+     None,
+     None)
+
+        '''
+        out = {}
+        for construct_type in self._array_constructs:
+            if construct_type in self._ignore:
+                continue
+
+            for cid, construct in self._constructs.get(construct_type,
+                                                       {}).items():
+                fingerprint = getattr(construct, '_equals_fingerprint',
+                                      None)
+                if fingerprint is not None:
+                    fingerprint = fingerprint(
+                        ignore_data_type=ignore_data_type,
+                        ignore_fill_value=ignore_fill_value,
+                        ignore_compression=ignore_compression,
+                        digest=digest)
+
+                out[cid] = fingerprint
+        # --- End: for
+
+        return out
+
+    def _construct_state(self, construct, state=None):
+        '''Return the objects that define a construct's identities.
+
+    The construct's components are recorded, apart from its data and
+    custom components. The contents of dictionary, set, tuple and list
+    components are recorded in place of the components themselves,
+    and the components of nested containers (such as bounds or a
+    datum) are recorded recursively. Two states that contain the same
+    objects, in the same order, indicate that the construct has not
+    been changed in a way that might alter its identities.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `_index`
+
+    :Parameters:
+
+        construct:
+            The construct.
+
+        state: `list`, optional
+            A list to be extended with the state of the construct. By
+            default a new list is created.
+
+    :Returns:
+
+        `list`
+            The state of the construct.
+
+        '''
+        if state is None:
+            state = []
+
+        for name, value in construct._components.items():
+            if name in ('custom', 'data'):
+                continue
+
+            state.append(name)
+            if isinstance(value, dict):
+                for item in value.items():
+                    state.extend(item)
+            elif isinstance(value, (set, tuple, list)):
+                state.extend(value)
+            elif isinstance(value, core.abstract.Container):
+                self._construct_state(value, state)
+            else:
+                state.append(value)
+        # --- End: for
+
+        return state
+
+    def _del_construct(self, key, default=ValueError()):
+        '''Remove a metadata construct.
+
+    The index of construct attribute values is invalidated.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `_index`, `_set_construct`
+
+    :Parameters:
+
+        key: `str`
+            The key of the construct to be removed.
+
+        default: optional
+            Return the value of the *default* parameter if the
+            construct can not be removed, or does not exist.
+
+            {{default Exception}}
+
+    :Returns:
+
+            The removed construct.
+
+        '''
+        self._construct_index = None
+        return super()._del_construct(key, default=default)
+
+    def _filter(self, name, history, *args, **kwargs):
+        '''Return constructs selected by a filter.
+
+    The filter is applied in-place to a single shallow copy of the
+    constructs.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `filters_applied`, `unfilter`
+
+    :Parameters:
+
+        name: `str`
+            The name of the filter method, e.g. ``'filter_by_type'``.
+
+        history:
+            The description of the filter to be recorded by
+            `filters_applied`.
+
+        args, kwargs: optional
+            The arguments of the in-place filter method, e.g.
+            `_filter_by_type`.
+
+    :Returns:
+
+        `Constructs`
+            The selected constructs and their construct keys.
+
+        '''
+        if name == 'filter_by_type' and args:
+            # Omit unwanted construct types from the copy, rather than
+            # removing them afterwards
+            ignore = set(self._key_base).difference(args)
+            ignore.update(self._ignore)
+            out = self.shallow_copy(_ignore=ignore)
+        else:
+            out = self.shallow_copy()
+            getattr(out, '_' + name)(*args, **kwargs)
+
+        filters_applied = getattr(self, '_filters_applied', None)
+        if filters_applied is None:
+            # Take a snapshot of the unfiltered constructs, which is
+            # unaffected by subsequent changes to this object
+            out._prefiltered = self.shallow_copy()
+            filters_applied = ()
+        else:
+            # Constructs returned by a filter are never modified
+            # in-place, so may be shared
+            out._prefiltered = self
+
+        out._filters_applied = filters_applied + ({name: history},)
+
+        return out
+
+    def _filter_by_axis(self, mode=None, *axes):
+        '''Select metadata constructs by axes, in-place.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `filter_by_axis`
+
+        '''
+        # The mode parameter has already been checked by
+        # filter_by_axis
+        _or = mode == 'or'
+        _exact = mode == 'exact'
+        _subset = mode == 'subset'
+
+        self._filter_by_data()
+        constructs_data_axes = self.data_axes()
+
+        axes = set(axes)
+
+        if not axes:
+            return
+
+        # Still here?
+        for cid in tuple(self):
+
+            x = constructs_data_axes.get(cid)
+            if x is None:
+                # This construct does not have data axes
+                self._pop(cid)
+                continue
+
+            ok = True
+            if _exact:
+                if set(x) != axes:
+                    ok = False
+            elif _subset:
+                if not set(x).issubset(axes):
+                    ok = False
+            else:
+                for axis_key in axes:
+                    ok = axis_key in x
+                    if _or:
+                        if ok:
+                            break
+                    elif not ok:
+                        break
+            # --- End: if
+
+            if not ok:
+                # This construct ..
+                self._pop(cid)
+        # --- End: for
+
+    def _filter_by_data(self):
+        '''Select metadata constructs that could contain data, in-place.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `filter_by_data`
+
+        '''
+        for cid in tuple(self):
+            if self._construct_type[cid] not in self._array_constructs:
+                # This construct can not have data
+                self._pop(cid)
+        # --- End: for
+
+    def _filter_by_identity(self, *identities):
+        '''Select metadata constructs by identity, in-place.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `filter_by_identity`
+
+        '''
+        # Return all constructs if no identities have been provided
+        if not identities:
+            return
+
+        keys = self._indexed_keys('identity', identities)
+        if keys is not None:
+            for cid in tuple(self):
+                if cid not in keys:
+                    # This construct does not match any of the
+                    # identities
+                    self._pop(cid)
+            # --- End: for
+
+            return
+
+        for cid, construct in tuple(self.items()):
+            ok = False
+            for value0 in identities:
+                for value1 in ['key%'+cid] + construct.identities():
+                    ok = self._matching_values(value0, construct, value1)
+                    if ok:
+                        break
+                # --- End: for
+
+                if ok:
+                    break
+            # --- End: for
+
+            if not ok:
+                # This construct does not match any of the identities
+                self._pop(cid)
+        # --- End: for
+
+    def _filter_by_key(self, *keys):
+        '''Select metadata constructs by key, in-place.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `filter_by_key`
+
+        '''
+        if not keys:
+            return
+
+        for cid in tuple(self):
+            if cid not in keys:
+                self._pop(cid)
+        # --- End: for
+
+    def _filter_by_measure(self, *measures):
+        '''Select cell measure constructs by measure, in-place.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `filter_by_measure`
+
+        '''
+        keys = None
+        if measures:
+            keys = self._indexed_keys('measure', measures)
+
+        if keys is not None:
+            for cid in tuple(self):
+                if cid not in keys:
+                    # This construct does not match any of the
+                    # measures
+                    self._pop(cid)
+            # --- End: for
+
+            return
+
+        for cid, construct in tuple(self.items()):
+            try:
+                get_measure = construct.get_measure
+            except AttributeError:
+                # This construct doesn't have a "get_measure" method
+                self._pop(cid)
+                continue
+
+            if not measures:
+                continue
+
+            ok = False
+            for value0 in measures:
+                value1 = construct.get_measure(None)
+                ok = self._matching_values(value0, construct, value1)
+                if ok:
+                    break
+            # --- End: for
+
+            if not ok:
+                # This construct does not match any of the measures
+                self._pop(cid)
+        # --- End: for
+
+    def _filter_by_method(self, *methods):
+        '''Select cell method constructs by method, in-place.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `filter_by_method`
+
+        '''
+        keys = None
+        if methods:
+            keys = self._indexed_keys('method', methods)
+
+        if keys is not None:
+            for cid in tuple(self):
+                if cid not in keys:
+                    # This construct does not match any of the methods
+                    self._pop(cid)
+            # --- End: for
+
+            return
+
+        for cid, construct in tuple(self.items()):
+            try:
+                get_method = construct.get_method
+            except AttributeError:
+                # This construct doesn't have a "get_method" method
+                self._pop(cid)
+                continue
+
+            if not methods:
+                continue
+
+            ok = False
+            for value0 in methods:
+                value1 = get_method(None)
+                ok = self._matching_values(value0, construct, value1)
+                if ok:
+                    break
+            # --- End: for
+
+            if not ok:
+                # This construct does not match any of the methods
+                self._pop(cid)
+        # --- End: for
+
+    def _filter_by_naxes(self, *naxes):
+        '''Select metadata constructs by number of axes, in-place.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `filter_by_naxes`
+
+        '''
+        self._filter_by_data()
+        constructs_data_axes = self.data_axes()
+
+        for key in tuple(self):
+            x = constructs_data_axes.get(key)
+            if x is None:
+                continue
+
+            ok = True
+            for n in naxes:
+                if n == len(x):
+                    ok = True
+                    break
+
+                ok = False
+
+            if not ok:
+                # This construct does not have the right number of axes
+                self._pop(key)
+        # --- End: for
+
+    def _filter_by_ncdim(self, *ncdims):
+        '''Select metadata constructs by netCDF dimension name, in-place.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `filter_by_ncdim`
+
+        '''
+        keys = None
+        if ncdims:
+            keys = self._indexed_keys('ncdim', ncdims)
+
+        if keys is not None:
+            for cid in tuple(self):
+                if cid not in keys:
+                    # This construct does not match any of the
+                    # netCDF dimension names
+                    self._pop(cid)
+            # --- End: for
+
+            return
+
+        for cid, construct in tuple(self.items()):
+            try:
+                nc_get_dimension = construct.nc_get_dimension
+            except AttributeError:
+                # This construct doesn't have a "nc_get_dimension"
+                # method
+                self._pop(cid)
+                continue
+
+            if not ncdims:
+                continue
+
+            ok = False
+            for value0 in ncdims:
+                value1 = nc_get_dimension(None)
+                ok = self._matching_values(value0, construct, value1)
+                if ok:
+                    break
+            # --- End: for
+
+            if not ok:
+                # This construct does not match any of the netCDF
+                # dimension names
+                self._pop(cid)
+        # --- End: for
+
+    def _filter_by_ncvar(self, *ncvars):
+        '''Select metadata constructs by netCDF variable name, in-place.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `filter_by_ncvar`
+
+        '''
+        keys = None
+        if ncvars:
+            keys = self._indexed_keys('ncvar', ncvars)
+
+        if keys is not None:
+            for cid in tuple(self):
+                if cid not in keys:
+                    # This construct does not match any of the
+                    # netCDF variable names
+                    self._pop(cid)
+            # --- End: for
+
+            return
+
+        for cid, construct in tuple(self.items()):
+            try:
+                nc_get_variable = construct.nc_get_variable
+            except AttributeError:
+                # This construct doesn't have a "nc_get_variable"
+                # method
+                self._pop(cid)
+                continue
+
+            if not ncvars:
+                continue
+
+            ok = False
+            for value0 in ncvars:
+                value1 = nc_get_variable(None)
+                ok = self._matching_values(value0, construct, value1)
+                if ok:
+                    break
+            # --- End: for
+
+            if not ok:
+                # This construct does not match any of the netCDF
+                # variable names
+                self._pop(cid)
+        # --- End: for
+
+    def _filter_by_property(self, *mode, **properties):
+        '''Select metadata constructs by property, in-place.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `filter_by_property`
+
+        '''
+        # The mode parameter has already been checked by
+        # filter_by_property
+        _or = mode == ('or',)
+
+        if properties:
+            keys = None
+            for name, value0 in properties.items():
+                name_keys = self._indexed_keys(('property', name),
+                                               (value0,))
+                if name_keys is None:
+                    keys = None
+                    break
+
+                if keys is None:
+                    keys = name_keys
+                elif _or:
+                    keys.update(name_keys)
+                else:
+                    keys.intersection_update(name_keys)
+            # --- End: for
+
+            if keys is not None:
+                for cid in tuple(self):
+                    if cid not in keys:
+                        # This construct does not match any of the
+                        # sets of properties
+                        self._pop(cid)
+                # --- End: for
+
+                return
+        # --- End: if
+
+        for cid, construct in tuple(self.items()):
+            try:
+                get_property = construct.get_property
+            except AttributeError:
+                # This construct doesn't have a "get_property" method
+                self._pop(cid)
+                continue
+
+            if not properties:
+                continue
+
+            ok = True
+            for name, value0 in properties.items():
+                value1 = get_property(name, None)
+                ok = self._matching_values(value0, construct, value1)
+
+                if _or:
+                    if ok:
+                        break
+                elif not ok:
+                    break
+            # --- End: for
+
+            if not ok:
+                # This construct does not match any of the sets of
+                # properties
+                self._pop(cid)
+        # --- End: for
+
+    def _filter_by_size(self, *sizes):
+        '''Select domain axis constructs by size, in-place.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `filter_by_size`
+
+        '''
+        for cid, construct in tuple(self.items()):
+            try:
+                get_size = construct.get_size
+            except AttributeError:
+                # This construct doesn't have a "get_size" method
+                self._pop(cid)
+                continue
+
+            if not sizes:
+                continue
+
+            ok = False
+            value0 = construct.get_size(None)
+            for value1 in sizes:
+                ok = self._matching_values(value1, construct, value0)
+                if ok:
+                    break
+            # --- End: for
+
+            if not ok:
+                # This construct does not match any of the sizes
+                self._pop(cid)
+        # --- End: for
+
+    def _filter_by_type(self, *types):
+        '''Select metadata constructs by type, in-place.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `filter_by_type`
+
+        '''
+        if not types:
+            return
+
+        for construct_type in tuple(self._constructs):
+            if construct_type in types:
+                continue
+
+            for cid in self._constructs.pop(construct_type):
+                self._construct_type.pop(cid, None)
+                self._construct_axes.pop(cid, None)
+        # --- End: for
+
+    def _index(self):
+        '''Return the index of construct attribute values.
+
+    The index maps the identities, netCDF variable names, netCDF
+    dimension names, measures, methods and string-valued properties
+    of the constructs to their construct keys, so that exact matches
+    may be found with dictionary lookups.
+
+    The index is created when it is first needed and is shared with
+    shallow copies, including the results of filters. It is
+    invalidated when a construct is set or removed, and recreated if
+    any construct has since been replaced or changed.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `_indexed_keys`
+
+    :Returns:
+
+        `dict`
+            The index. Each value, apart from that of the ``'state'``
+            key, is a tuple containing a dictionary of string
+            attribute values to construct keys, and a tuple of the
+            ``(key, construct, value)`` tuples of the attribute values
+            that are not strings.
+
+        '''
+        holder = getattr(self, '_construct_index', None)
+        if holder is None:
+            holder = [None]
+            self._construct_index = holder
+
+        index = holder[0]
+        if index is not None:
+            states = index['state']
+            for key, construct in self.items():
+                state = states.get(key)
+                if state is None or state[0] is not construct:
+                    index = None
+                    break
+
+                state = state[1]
+                new_state = self._construct_state(construct)
+                if (len(new_state) != len(state)
+                        or not all(map(is_, new_state, state))):
+                    index = None
+                    break
+        # --- End: if
+
+        if index is not None:
+            return index
+
+        index = {}
+
+        def _add(kind, key, construct, value):
+            exact, other = index.setdefault(kind, ({}, []))
+            if isinstance(value, str):
+                exact.setdefault(value, []).append(key)
+            elif value is not None:
+                other.append((key, construct, value))
+        # --- End: def
+
+        states = {}
+        for key, construct in self.items():
+            states[key] = (construct, self._construct_state(construct))
+
+            _add('identity', key, construct, 'key%' + key)
+            for value in construct.identities():
+                _add('identity', key, construct, value)
+
+            for kind, method in (('ncvar', 'nc_get_variable'),
+                                 ('ncdim', 'nc_get_dimension'),
+                                 ('measure', 'get_measure'),
+                                 ('method', 'get_method')):
+                method = getattr(construct, method, None)
+                if method is not None:
+                    _add(kind, key, construct, method(None))
+            # --- End: for
+
+            properties = getattr(construct, 'properties', None)
+            if properties is not None:
+                for prop, value in properties().items():
+                    _add(('property', prop), key, construct, value)
+        # --- End: for
+
+        index = {kind: (exact, tuple(other))
+                 for kind, (exact, other) in index.items()}
+        index['state'] = states
+
+        holder[0] = index
+        return index
+
+    def _indexed_keys(self, kind, values):
+        '''Return the keys of constructs with any of the given values.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `_index`
+
+    :Parameters:
+
+        kind: `str` or `tuple`
+            The kind of attribute value. One of ``'identity'``,
+            ``'ncvar'``, ``'ncdim'``, ``'measure'``, ``'method'``, or
+            ``('property', name)`` for the property called *name*.
+
+        values: sequence
+            The values to be matched.
+
+    :Returns:
+
+        `set` or `None`
+            The keys of the constructs which have any of the values,
+            or `None` if any of the values is not a string, in which
+            case the index can not be used.
+
+        '''
+        if not all([isinstance(value, str) for value in values]):
+            return
+
+        exact, other = self._index().get(kind, ({}, ()))
+
+        keys = set()
+        for value0 in values:
+            keys.update(exact.get(value0, ()))
+            for key, construct, value1 in other:
+                if self._matching_values(value0, construct, value1):
+                    keys.add(key)
+        # --- End: for
+
+        return keys
+
+    def _set_construct(self, construct, key=None, axes=None,
+                       copy=True):
+        '''Set a metadata construct.
+
+    The index of construct attribute values is invalidated.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `_del_construct`, `_index`
+
+    :Parameters:
+
+        construct:
+            The metadata construct to be inserted.
+
+        key: `str`, optional
+            The construct identifier to be used for the construct.
+
+        axes: sequence of `str`, optional
+            The construct identifiers of the domain axis constructs
+            spanned by the data array.
+
+        copy: `bool`, optional
+            If True then return a copy of the unique selected
+            construct.
+
+    :Returns:
+
+        `str`
+            The construct identifier for the construct.
+
+        '''
+        self._construct_index = None
+        return super()._set_construct(construct, key=key, axes=axes,
+                                      copy=copy)
+
     # ----------------------------------------------------------------
     # Methods
     # ----------------------------------------------------------------
@@ -639,6 +1470,45 @@ class Constructs(mixin.Container,
         # ------------------------------------------------------------
         # Constructs with arrays
         # ------------------------------------------------------------
+        # Find the structural fingerprints of the constructs. Only
+        # constructs with equal fingerprints can be equal, so full
+        # equality checks are only made between such pairs.
+        fingerprint_kwargs = {'ignore_data_type': ignore_data_type,
+                              'ignore_fill_value': ignore_fill_value,
+                              'ignore_compression': ignore_compression}
+        fingerprints0 = self._equals_fingerprints(**fingerprint_kwargs)
+        fingerprints1 = other._equals_fingerprints(**fingerprint_kwargs)
+
+        if (not _return_axis_map
+                and None not in fingerprints0.values()
+                and None not in fingerprints1.values()):
+            # Every construct in self must have a counterpart of the
+            # same type, and with the same fingerprint, in other
+            counts1 = Counter([(other._construct_type[cid], fingerprint)
+                               for cid, fingerprint in fingerprints1.items()])
+            counts0 = Counter([(self._construct_type[cid], fingerprint)
+                               for cid, fingerprint in fingerprints0.items()])
+            for x, n in counts0.items():
+                if counts1[x] < n:
+                    logger.info(
+                        "{0}: Can't match {1!r}".format(
+                            self.__class__.__name__, x[0])
+                    )
+                    return False
+        # --- End: if
+
+        def _plausible(fingerprint0, fingerprint1):
+            '''Whether two constructs could be equal.'''
+            return (fingerprint0 is None or fingerprint1 is None
+                    or fingerprint0 == fingerprint1)
+        # --- End: def
+
+        # Fingerprints that include digests of the data, which are
+        # only created when more than one construct is a plausible
+        # match
+        digests0 = {}
+        digests1 = {}
+
         log = []
         axes_to_constructs0 = self._axes_to_constructs()
         axes_to_constructs1 = other._axes_to_constructs()
@@ -684,7 +1554,41 @@ class Constructs(mixin.Container,
                     matched_construct = True
                     for key0, item0 in role_constructs0.items():
                         matched_construct = False
-                        for key1, item1 in tuple(role_constructs1.items()):
+
+                        fingerprint0 = fingerprints0[key0]
+                        candidates = [
+                            key1 for key1 in role_constructs1
+                            if _plausible(fingerprint0, fingerprints1[key1])
+                        ]
+                        if len(candidates) > 1 and fingerprint0 is not None:
+                            # Several constructs are plausible matches,
+                            # so also compare digests of their data
+                            if key0 not in digests0:
+                                digests0[key0] = item0._equals_fingerprint(
+                                    digest=True, **fingerprint_kwargs)
+
+                            for key1 in candidates:
+                                if key1 not in digests1:
+                                    item1 = role_constructs1[key1]
+                                    digest1 = getattr(
+                                        item1, '_equals_fingerprint', None)
+                                    if digest1 is not None:
+                                        digest1 = digest1(
+                                            digest=True,
+                                            **fingerprint_kwargs)
+
+                                    digests1[key1] = digest1
+                            # --- End: for
+
+                            candidates = [
+                                key1 for key1 in candidates
+                                if _plausible(digests0[key0],
+                                              digests1[key1])
+                            ]
+                        # --- End: if
+
+                        for key1 in candidates:
+                            item1 = role_constructs1[key1]
                             logger.debug(
                                 "{}: Comparing {!r}, {!r}: ".format(
                                     self.__class__.__name__, item0, item1)
@@ -861,95 +1765,24 @@ class Constructs(mixin.Container,
     >>> d = c.filter_by_axis('and', 'domainaxis2').inverse_filter()
 
     Select constructs whose data spans the "domainaxis1", but not the
-    "domainaxis2" domain axis constructs:
-
-    >>> d = c.filter_by_axis('and', 'domainaxis1')
-    >>> d = d.filter_by_axis('and', 'domainaxis2')
-    >>> d  = d.inverse_filter(1)
-
-    Select constructs whose data spans the "domainaxis1" or the
-    "domainaxis2" domain axis constructs:
-
-    >>> d = c.filter_by_axis('or', 'domainaxis1', 'domainaxis2')
-
-        '''
-        out = self.shallow_copy()
-
-        out._prefiltered = self.shallow_copy()
-        out._filters_applied = (self.filters_applied() +
-                                ({'filter_by_axis': (mode, axes)},))
-
-        # Parse the mode parameter
-        _and = False
-        _or = False
-        _exact = False
-        _subset = False
-
-        if not axes and mode is None:
-            mode = 'and'
-
-        if mode == 'and':
-            _and = True
-        elif mode == 'or':
-            _or = True
-        elif mode == 'and':
-            _and = True
-        elif mode == 'exact':
-            _exact = True
-        elif mode == 'subset':
-            _subset = True
-        else:
-            raise ValueError(
-                "mode parameter must be one of 'and', 'or', 'exact', subset'")
-
-        data_constructs = self.filter_by_data()
-        constructs_data_axes = self.data_axes()
-
-        axes = set(axes)
-
-        if not axes:
-            for cid in tuple(out):
-                if cid not in data_constructs:
-                    out._pop(cid)
-            # --- End: for
-
-            return out
-
-        # Still here?
-        for cid in tuple(out):
-            if cid not in data_constructs:
-                out._pop(cid)
-                continue
-
-            x = constructs_data_axes.get(cid)
-            if x is None:
-                # This construct does not have data axes
-                out._pop(cid)
-                continue
-
-            ok = True
-            if _exact:
-                if set(x) != axes:
-                    ok = False
-            elif _subset:
-                if not set(x).issubset(axes):
-                    ok = False
-            else:
-                for axis_key in axes:
-                    ok = axis_key in x
-                    if _or:
-                        if ok:
-                            break
-                    elif not ok:
-                        break
-            # --- End: if
+    "domainaxis2" domain axis constructs:
 
-            if not ok:
-                # This construct ..
-                out._pop(cid)
-        # --- End: for
+    >>> d = c.filter_by_axis('and', 'domainaxis1')
+    >>> d = d.filter_by_axis('and', 'domainaxis2')
+    >>> d  = d.inverse_filter(1)
 
-        return out
+    Select constructs whose data spans the "domainaxis1" or the
+    "domainaxis2" domain axis constructs:
+
+    >>> d = c.filter_by_axis('or', 'domainaxis1', 'domainaxis2')
+
+        '''
+        if (axes or mode is not None) and mode not in ('and', 'or',
+                                                       'exact', 'subset'):
+            raise ValueError(
+                "mode parameter must be one of 'and', 'or', 'exact', subset'")
+
+        return self._filter('filter_by_axis', (mode, axes), mode, *axes)
 
     def filter_by_data(self):
         '''Select metadata constructs by whether they could contain data.
@@ -979,19 +1812,7 @@ class Constructs(mixin.Container,
     >>> d = c.filter_by_data()
 
         '''
-        out = self.shallow_copy()
-
-        out._prefiltered = self.shallow_copy()
-        out._filters_applied = (self.filters_applied() +
-                                ({'filter_by_data': ()},))
-
-        for cid in tuple(out):
-            if out._construct_type[cid] not in self._array_constructs:
-                # This construct can not have data
-                out._pop(cid)
-        # --- End: for
-
-        return out
+        return self._filter('filter_by_data', ())
 
     def filter_by_identity(self, *identities):
         '''Select metadata constructs by identity.
@@ -1064,35 +1885,7 @@ class Constructs(mixin.Container,
     >>> d = c.filter_by_identity('ncvar%time')
 
         '''
-        out = self.shallow_copy()
-
-        out._prefiltered = self.shallow_copy()
-        out._filters_applied = (self.filters_applied() +
-                                ({'filter_by_identity': identities},))
-
-        # Return all constructs if no identities have been provided
-        if not identities:
-            return out
-
-        for cid, construct in tuple(out.items()):
-            ok = False
-            for value0 in identities:
-                for value1 in ['key%'+cid] + construct.identities():
-                    ok = self._matching_values(value0, construct, value1)
-                    if ok:
-                        break
-                # --- End: for
-
-                if ok:
-                    break
-            # --- End: for
-
-            if not ok:
-                # This construct does not match any of the identities
-                out._pop(cid)
-        # --- End: for
-
-        return out
+        return self._filter('filter_by_identity', identities, *identities)
 
     def filter_by_key(self, *keys):
         '''Select metadata constructs by key.
@@ -1134,21 +1927,7 @@ class Constructs(mixin.Container,
     >>> d = c.filter_by_key('dimensioncoordinate1', 'fieldancillary0')
 
         '''
-        out = self.shallow_copy()
-
-        out._prefiltered = self.shallow_copy()
-        out._filters_applied = (self.filters_applied() +
-                                ({'filter_by_key': keys},))
-
-        if not keys:
-            return out
-
-        for cid in tuple(out):
-            if cid not in keys:
-                out._pop(cid)
-        # --- End: for
-
-        return out
+        return self._filter('filter_by_key', keys, *keys)
 
     def filter_by_measure(self, *measures):
         '''Select cell measure constructs by measure.
@@ -1218,37 +1997,7 @@ class Constructs(mixin.Container,
      'cellmeasure1': <{{repr}}CellMeasure: measure:volume(3, 9, 10) m3>}
 
         '''
-        out = self.shallow_copy()
-
-        out._prefiltered = self.shallow_copy()
-        out._filters_applied = (self.filters_applied() +
-                                ({'filter_by_measure': measures},))
-
-        for cid, construct in tuple(out.items()):
-            try:
-                get_measure = construct.get_measure
-            except AttributeError:
-                # This construct doesn't have a "get_measure" method
-                out._pop(cid)
-                continue
-
-            if not measures:
-                continue
-
-            ok = False
-            for value0 in measures:
-                value1 = construct.get_measure(None)
-                ok = self._matching_values(value0, construct, value1)
-                if ok:
-                    break
-            # --- End: for
-
-            if not ok:
-                # This construct does not match any of the measures
-                out._pop(cid)
-        # --- End: for
-
-        return out
+        return self._filter('filter_by_measure', measures, *measures)
 
     def filter_by_method(self, *methods):
         '''Select cell method constructs by method.
@@ -1318,37 +2067,7 @@ class Constructs(mixin.Container,
      'cellmethod1': <{{repr}}CellMethod: domainaxis3: maximum>}
 
         '''
-        out = self.shallow_copy()
-
-        out._prefiltered = self.shallow_copy()
-        out._filters_applied = (self.filters_applied() +
-                                ({'filter_by_method': methods},))
-
-        for cid, construct in tuple(out.items()):
-            try:
-                get_method = construct.get_method
-            except AttributeError:
-                # This construct doesn't have a "get_method" method
-                out._pop(cid)
-                continue
-
-            if not methods:
-                continue
-
-            ok = False
-            for value0 in methods:
-                value1 = get_method(None)
-                ok = self._matching_values(value0, construct, value1)
-                if ok:
-                    break
-            # --- End: for
-
-            if not ok:
-                # This construct does not match any of the methods
-                out._pop(cid)
-        # --- End: for
-
-        return out
+        return self._filter('filter_by_method', methods, *methods)
 
     def filter_by_naxes(self, *naxes):
         '''Select metadata constructs by the number of domain axis constructs
@@ -1394,38 +2113,7 @@ class Constructs(mixin.Container,
     >>> d = c.filter_by_ncdim(1, 2)
 
         '''
-        out = self.shallow_copy()
-
-        out._prefiltered = self.shallow_copy()
-        out._filters_applied = (self.filters_applied() +
-                                ({'filter_by_naxes': naxes},))
-
-        data_constructs = self.filter_by_data()
-        constructs_data_axes = self.data_axes()
-
-        for key in tuple(out):
-            if key not in data_constructs:
-                out._pop(key)
-                continue
-
-            x = constructs_data_axes.get(key)
-            if x is None:
-                continue
-
-            ok = True
-            for n in naxes:
-                if n == len(x):
-                    ok = True
-                    break
-
-                ok = False
-
-            if not ok:
-                # This construct does not have the right number of axes
-                out._pop(key)
-        # --- End: for
-
-        return out
+        return self._filter('filter_by_naxes', naxes, *naxes)
 
     def filter_by_ncdim(self, *ncdims):
         '''Select domain axis constructs by netCDF dimension name.
@@ -1473,39 +2161,7 @@ class Constructs(mixin.Container,
     >>> d = c.filter_by_ncdim('time', 'lat')
 
         '''
-        out = self.shallow_copy()
-
-        out._prefiltered = self.shallow_copy()
-        out._filters_applied = (self.filters_applied() +
-                                ({'filter_by_ncdim': ncdims},))
-
-        for cid, construct in tuple(out.items()):
-            try:
-                nc_get_dimension = construct.nc_get_dimension
-            except AttributeError:
-                # This construct doesn't have a "nc_get_dimension"
-                # method
-                out._pop(cid)
-                continue
-
-            if not ncdims:
-                continue
-
-            ok = False
-            for value0 in ncdims:
-                value1 = nc_get_dimension(None)
-                ok = self._matching_values(value0, construct, value1)
-                if ok:
-                    break
-            # --- End: for
-
-            if not ok:
-                # This construct does not match any of the netCDF
-                # dimension names
-                out._pop(cid)
-        # --- End: for
-
-        return out
+        return self._filter('filter_by_ncdim', ncdims, *ncdims)
 
     def filter_by_ncvar(self, *ncvars):
         '''Select domain axis constructs by netCDF variable name.
@@ -1551,39 +2207,7 @@ class Constructs(mixin.Container,
     >>> d = c.filter_by_ncvar('time', 'lat')
 
         '''
-        out = self.shallow_copy()
-
-        out._prefiltered = self.shallow_copy()
-        out._filters_applied = (self.filters_applied() +
-                                ({'filter_by_ncvar': ncvars},))
-
-        for cid, construct in tuple(out.items()):
-            try:
-                nc_get_variable = construct.nc_get_variable
-            except AttributeError:
-                # This construct doesn't have a "nc_get_variable"
-                # method
-                out._pop(cid)
-                continue
-
-            if not ncvars:
-                continue
-
-            ok = False
-            for value0 in ncvars:
-                value1 = nc_get_variable(None)
-                ok = self._matching_values(value0, construct, value1)
-                if ok:
-                    break
-            # --- End: for
-
-            if not ok:
-                # This construct does not match any of the netCDF
-                # variable names
-                out._pop(cid)
-        # --- End: for
-
-        return out
+        return self._filter('filter_by_ncvar', ncvars, *ncvars)
 
     def _matching_values(self, value0, construct, value1):
         '''Whether or not two values are the same.
@@ -1671,56 +2295,18 @@ class Constructs(mixin.Container,
     >>> d = c.filter_by_property(standard_name=re.compile('^air'))
 
         '''
-        out = self.shallow_copy()
-
-        out._prefiltered = self.shallow_copy()
-        out._filters_applied = (self.filters_applied() +
-                                ({'filter_by_property': (mode, properties)},))
-
-        _or = False
         if mode:
             if len(mode) > 1:
                 raise ValueError(
                     "Can provide at most one positional argument")
 
-            x = mode[0]
-            if x == 'or':
-                _or = True
-            elif x != 'and':
+            if mode[0] not in ('and', 'or'):
                 raise ValueError("Positional argument, if provided, "
                                  "must be 'or' or 'and'")
         # --- End: if
 
-        for cid, construct in tuple(out.items()):
-            try:
-                get_property = construct.get_property
-            except AttributeError:
-                # This construct doesn't have a "get_property" method
-                out._pop(cid)
-                continue
-
-            if not properties:
-                continue
-
-            ok = True
-            for name, value0 in properties.items():
-                value1 = get_property(name, None)
-                ok = self._matching_values(value0, construct, value1)
-
-                if _or:
-                    if ok:
-                        break
-                elif not ok:
-                    break
-            # --- End: for
-
-            if not ok:
-                # This construct does not match any of the sets of
-                # properties
-                out._pop(cid)
-        # --- End: for
-
-        return out
+        return self._filter('filter_by_property', (mode, properties),
+                            *mode, **properties)
 
     def filter_by_size(self, *sizes):
         '''Select domain axis constructs by size.
@@ -1762,37 +2348,7 @@ class Constructs(mixin.Container,
     >>> d = c.filter_by_size(1, 96)
 
         '''
-        out = self.shallow_copy()
-
-        out._prefiltered = self.shallow_copy()
-        out._filters_applied = (self.filters_applied() +
-                                ({'filter_by_size': sizes},))
-
-        for cid, construct in tuple(out.items()):
-            try:
-                get_size = construct.get_size
-            except AttributeError:
-                # This construct doesn't have a "get_size" method
-                out._pop(cid)
-                continue
-
-            if not sizes:
-                continue
-
-            ok = False
-            value0 = construct.get_size(None)
-            for value1 in sizes:
-                ok = self._matching_values(value1, construct, value0)
-                if ok:
-                    break
-            # --- End: for
-
-            if not ok:
-                # This construct does not match any of the sizes
-                out._pop(cid)
-        # --- End: for
-
-        return out
+        return self._filter('filter_by_size', sizes, *sizes)
 
     def filter_by_type(self, *types):
         '''Select metadata constructs by type.
@@ -1843,13 +2399,7 @@ class Constructs(mixin.Container,
     >>> d = c.filter_by_type('dimension_coordinate', 'field_ancillary')
 
         '''
-        out = super().filter_by_type(*types)
-
-        out._prefiltered = self.shallow_copy()
-        out._filters_applied = (self.filters_applied() +
-                                ({'filter_by_type': types},))
-
-        return out
+        return self._filter('filter_by_type', types, *types)
 
     def filters_applied(self):
         '''A history of filters that have been applied.
@@ -2100,9 +2650,21 @@ class Constructs(mixin.Container,
         '''
         out = super().shallow_copy(_ignore=_ignore)
 
+        # Share the index of construct attribute values, so that an
+        # index created for any of the copies may be used by all of
+        # them
+        holder = getattr(self, '_construct_index', None)
+        if holder is None:
+            holder = [None]
+            self._construct_index = holder
+
+        out._construct_index = holder
+
+        # Share the constructs that existed prior to previous
+        # filters, which are never modified in-place
         prefiltered = getattr(self, '_prefiltered', None)
         if prefiltered is not None:
-            out._prefiltered = prefiltered.shallow_copy()
+            out._prefiltered = prefiltered
             out._filters_applied = self._filters_applied
 
         return out
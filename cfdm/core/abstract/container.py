@@ -127,11 +127,20 @@ class Container(metaclass=DocstringRewriteMeta):
 
         '''
         if isinstance(default, Exception):
+            # Raise a copy of the exception, so that the traceback
+            # (and therefore the frames that it references) is not
+            # kept alive by a default exception that is shared
+            # between calls
+            error = copy(default)
             if message is not None and not default.args:
-                default = copy(default)
-                default.args = (message,)
+                error.args = (message,)
 
-            raise default
+            try:
+                raise error
+            finally:
+                # Break the reference cycle between this frame and
+                # the exception's traceback
+                del error
 
         return default
 
@@ -174,6 +183,9 @@ class Container(metaclass=DocstringRewriteMeta):
         try:
             return self._components.pop(component)
         except KeyError:
+            if not isinstance(default, Exception):
+                return default
+
             return self._default(
                 default, "{!r} has no {!r} component".format(
                     self.__class__.__name__, component)
@@ -245,6 +257,9 @@ class Container(metaclass=DocstringRewriteMeta):
         try:
             return self._components[component]
         except KeyError:
+            if not isinstance(default, Exception):
+                return default
+
             return self._default(default,
                                  "{!r} has no {!r} component".format(
                                      self.__class__.__name__, component))
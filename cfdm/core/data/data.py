@@ -366,12 +366,12 @@ class Data(abstract.Container):
     None
 
         '''
-        try:
+        if self._has_component('calendar'):
             return self._del_component('calendar')
-        except ValueError:
-            return self._default(default,
-                                 "{!r} has no calendar".format(
-                                     self.__class__.__name__))
+
+        return self._default(default,
+                             "{!r} has no calendar".format(
+                                 self.__class__.__name__))
 
     def del_fill_value(self, default=ValueError()):
         '''Delete the fill value.
@@ -412,12 +412,12 @@ class Data(abstract.Container):
     False
 
         '''
-        try:
+        if self._has_component('fill_value'):
             return self._del_component('fill_value')
-        except ValueError:
-            return self._default(default,
-                                 "{!r} has no fill value".format(
-                                     self.__class__.__name__))
+
+        return self._default(default,
+                             "{!r} has no fill value".format(
+                                 self.__class__.__name__))
 
     def del_units(self, default=ValueError()):
         '''Delete the units.
@@ -455,12 +455,12 @@ class Data(abstract.Container):
     None
 
         '''
-        try:
+        if self._has_component('units'):
             return self._del_component('units')
-        except ValueError:
-            return self._default(default,
-                                 "{!r} has no units".format(
-                                     self.__class__.__name__))
+
+        return self._default(default,
+                             "{!r} has no units".format(
+                                 self.__class__.__name__))
 
     def get_calendar(self, default=ValueError()):
         '''Return the calendar.
@@ -499,12 +499,12 @@ class Data(abstract.Container):
     None
 
         '''
-        try:
+        if self._has_component('calendar'):
             return self._get_component('calendar')
-        except ValueError:
-            return self._default(default,
-                                 "{!r} has no calendar".format(
-                                     self.__class__.__name__))
+
+        return self._default(default,
+                             "{!r} has no calendar".format(
+                                 self.__class__.__name__))
 
     def _get_Array(self, default=ValueError()):
         '''Return the array object.
@@ -528,12 +528,12 @@ class Data(abstract.Container):
     >>> a = d._get_Array(None)
 
         '''
-        try:
+        if self._has_component('array'):
             return self._get_component('array')
-        except ValueError:
-            return self._default(default,
-                                 "{!r} has no array".format(
-                                     self.__class__.__name__))
+
+        return self._default(default,
+                             "{!r} has no array".format(
+                                 self.__class__.__name__))
 
     def get_fill_value(self, default=ValueError()):
         '''Return the missing data value.
@@ -576,12 +576,12 @@ class Data(abstract.Container):
     False
 
         '''
-        try:
+        if self._has_component('fill_value'):
             return self._get_component('fill_value')
-        except ValueError:
-            return self._default(default,
-                                 "{!r} has no fill value".format(
-                                     self.__class__.__name__))
+
+        return self._default(default,
+                             "{!r} has no fill value".format(
+                                 self.__class__.__name__))
 
     def get_units(self, default=ValueError()):
         '''Return the units.
@@ -619,12 +619,12 @@ class Data(abstract.Container):
     None
 
         '''
-        try:
+        if self._has_component('units'):
             return self._get_component('units')
-        except ValueError:
-            return self._default(default,
-                                 "{!r} has no units".format(
-                                     self.__class__.__name__))
+
+        return self._default(default,
+                             "{!r} has no units".format(
+                                 self.__class__.__name__))
 
     def has_units(self):
         '''Whether units have been set.
@@ -1,6 +1,7 @@
 from .abstract import (Array,
                        CompressedArray)
 
+from .deferredarray                import DeferredArray
 from .gatheredarray                import GatheredArray
 from .netcdfarray                  import NetCDFArray
 from .numpyarray                   import NumpyArray
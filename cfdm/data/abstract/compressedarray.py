@@ -2,6 +2,8 @@ import numpy
 
 from .array import Array
 
+from ...functions import index_cache_size
+
 
 class CompressedArray(Array):
     '''Mixin class for a container of an underlying compressed array.
@@ -46,6 +48,388 @@ class CompressedArray(Array):
 
         self._set_compressed_Array(compressed_array, copy=False)
 
+    def __getitem__(self, indices):
+        '''x.__getitem__(indices) <==> x[indices]
+
+    Returns an subspace of the uncompressed data as an independent
+    numpy array.
+
+    The indices that define the subspace are relative to the
+    uncompressed data and must be either `Ellipsis` or a sequence that
+    contains an index for each dimension. In the latter case, each
+    dimension's index must either be a `slice` object or a sequence of
+    two or more integers.
+
+    Indexing is similar to numpy indexing. The only difference to
+    numpy indexing (given the restrictions on the type of indices
+    allowed) is:
+
+      * When two or more dimension's indices are sequences of integers
+        then these indices work independently along each dimension
+        (similar to the way vector subscripts work in Fortran).
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+        '''
+        # ------------------------------------------------------------
+        # Method: Translate the requested uncompressed indices into
+        #         the positions of the required samples in the
+        #         compressed array, read only those samples, and then
+        #         arrange them into the uncompressed subspace.
+        # ------------------------------------------------------------
+        shape = self.shape
+
+        if indices is Ellipsis:
+            indices = [slice(None)] * self.ndim
+        else:
+            indices = list(indices)
+            indices.extend([slice(None)] * (self.ndim - len(indices)))
+
+        compressed_dimension = self.get_compressed_dimension()
+        compressed_axes = self.get_compressed_axes()
+        first = compressed_axes[0]
+        last = compressed_axes[-1] + 1
+
+        # The indices of the subspace along the uncompressed axes that
+        # are not compressed, which are the same as the indices of
+        # the compressed array's uncompressed dimensions.
+        pre_indices = indices[:first]
+        post_indices = indices[last:]
+
+        if all([isinstance(indices[i], slice)
+                and indices[i].indices(shape[i]) == (0, shape[i], 1)
+                for i in compressed_axes]):
+            # --------------------------------------------------------
+            # The whole of each compressed axis has been requested,
+            # so scatter all of the samples into the uncompressed
+            # array, if possible.
+            # --------------------------------------------------------
+            sample_flat = self._flat_uncompressed_indices()
+            if sample_flat is not None:
+                n_samples = sample_flat.size
+
+                array = self._get_compressed_subspace(
+                    tuple(pre_indices)
+                    + (slice(0, n_samples),)
+                    + tuple(post_indices))
+
+                # Scatter the data and mask separately, with a single
+                # index into the flattened compressed axes, which is
+                # much faster than assigning to a masked array with
+                # an index for each compressed axis
+                compressed_shape = tuple([shape[i]
+                                          for i in compressed_axes])
+                pre_shape = array.shape[:compressed_dimension]
+                post_shape = array.shape[compressed_dimension+1:]
+
+                flat_shape = (pre_shape
+                              + (int(numpy.prod(compressed_shape)),)
+                              + post_shape)
+                flat_index = ((slice(None),) * compressed_dimension
+                              + (sample_flat,))
+
+                data = numpy.empty(flat_shape, dtype=self.dtype)
+                data[flat_index] = numpy.ma.getdata(array)
+
+                mask = numpy.ones(flat_shape, dtype=bool)
+                mask[flat_index] = numpy.ma.getmaskarray(array)
+
+                uarray = numpy.ma.array(data, mask=mask, copy=False)
+
+                return uarray.reshape(pre_shape + compressed_shape
+                                      + post_shape)
+        # --- End: if
+
+        # Find the sample dimension positions of each element of the
+        # requested subspace of the compressed axes, with -1 for
+        # elements that are missing from the compressed array.
+        positions = self._sample_positions(
+            [self._index_positions(indices[i], shape[i])
+             for i in compressed_axes])
+
+        valid = positions >= 0
+        samples = positions[valid]
+
+        if not samples.size:
+            # No elements of the subspace are in the compressed array
+            out_shape = (
+                tuple([self._index_positions(index, n).size
+                       for index, n in zip(pre_indices, shape[:first])])
+                + positions.shape
+                + tuple([self._index_positions(index, n).size
+                         for index, n in zip(post_indices, shape[last:])])
+            )
+            return numpy.ma.masked_all(out_shape, dtype=self.dtype)
+
+        if samples.size == 1 or (samples[1:] > samples[:-1]).all():
+            unique_samples = samples
+        else:
+            unique_samples = numpy.unique(samples)
+
+        start = int(unique_samples[0])
+        stop = int(unique_samples[-1]) + 1
+        n_samples = unique_samples.size
+
+        if stop - start <= 2 * n_samples:
+            # The required samples are contiguous, or densely packed,
+            # so read all of the samples that span them with a single
+            # slice
+            sample_index = slice(start, stop)
+            take = positions
+            if start:
+                take -= start
+        else:
+            sample_index = unique_samples
+            take = numpy.searchsorted(unique_samples, positions)
+
+        missing = ~valid
+        if missing.any():
+            take[missing] = 0
+        else:
+            missing = None
+
+        array = self._get_compressed_subspace(
+            tuple(pre_indices) + (sample_index,) + tuple(post_indices))
+
+        # Arrange the samples into the uncompressed subspace
+        if numpy.ma.isMA(array):
+            uarray = numpy.ma.take(array, take, axis=compressed_dimension)
+        else:
+            uarray = numpy.ma.array(
+                numpy.take(array, take, axis=compressed_dimension),
+                copy=False)
+
+        if missing is not None:
+            # Mask the elements that are not in the compressed array
+            missing = missing.reshape(
+                (1,) * compressed_dimension
+                + missing.shape
+                + (1,) * (array.ndim - compressed_dimension - 1))
+            uarray[numpy.broadcast_to(missing, uarray.shape)] = \
+                numpy.ma.masked
+
+        return uarray
+
+    @staticmethod
+    def _element_positions(instances):
+        '''Return the position of each sample within its instance.
+
+    Samples of the same instance are numbered in the order in which
+    they appear in the sample dimension. The positions are found by
+    sorting the samples by instance, rather than by searching for the
+    samples of each instance in turn.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        instances: `numpy.ndarray`
+            The instance of each sample, in sample dimension order.
+
+    :Returns:
+
+        `numpy.ndarray`
+            The position of each sample within its instance.
+
+    **Examples:**
+
+    >>> a._element_positions(numpy.array([1, 0, 1, 1, 0]))
+    array([0, 0, 1, 2, 1])
+
+        '''
+        order = numpy.argsort(instances, kind='stable')
+        sorted_instances = instances[order]
+
+        # The sorted position of the first sample of each sample's
+        # instance
+        starts = numpy.searchsorted(sorted_instances, sorted_instances)
+
+        positions = numpy.empty(instances.size, dtype=int)
+        positions[order] = numpy.arange(instances.size) - starts
+        return positions
+
+    def _flat_uncompressed_indices(self):
+        '''Return the flattened uncompressed index of every sample.
+
+    The result is memoized (see `_memoize`).
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Returns:
+
+        `numpy.ndarray` or `None`
+            The position of each sample in the flattened compressed
+            dimensions of the uncompressed array, in sample dimension
+            order, or `None` if `_uncompressed_indices` is not
+            implemented.
+
+        '''
+        def flat_uncompressed_indices():
+            uncompressed_indices = self._uncompressed_indices()
+            if uncompressed_indices is None:
+                return None
+
+            shape = self.shape
+            return numpy.ravel_multi_index(
+                uncompressed_indices,
+                [shape[i] for i in self.get_compressed_axes()])
+
+        return self._memoize('flat', flat_uncompressed_indices)
+
+    def _lookup_table(self):
+        '''Return a table for looking up samples by uncompressed position.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Returns:
+
+        `tuple` or `None`
+            The sample dimension positions that sort the flattened
+            uncompressed indices of the samples (see
+            `_flat_uncompressed_indices`), and the sorted flattened
+            uncompressed indices. `None` if `_uncompressed_indices` is
+            not implemented.
+
+        '''
+        sample_flat = self._flat_uncompressed_indices()
+        if sample_flat is None:
+            return None
+
+        order = numpy.argsort(sample_flat, kind='stable')
+        return (order, sample_flat[order])
+
+    def _memoize(self, name, function):
+        '''Return a memoized index table, creating it if required.
+
+    Index tables depend only on the count, index and list variables
+    of the compressed array, and so are kept until the compressed
+    array is replaced (see `_set_compressed_Array`). This makes
+    repeated subspacing of the same compressed array much faster.
+
+    A table is only kept if it and the tables already kept together
+    use no more memory than the index cache size (see
+    `{{package}}.index_cache_size`).
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        name: `str`
+            The name of the index table.
+
+        function: function
+            The function that creates the index table when called
+            with no arguments.
+
+    :Returns:
+
+            The index table.
+
+    **Examples:**
+
+    >>> lookup = a._memoize('lookup', a._lookup_table)
+
+        '''
+        def nbytes(table):
+            if isinstance(table, tuple):
+                return sum([t.nbytes for t in table])
+
+            return table.nbytes
+
+        tables = self._get_component('index_tables', None)
+        if tables is None:
+            tables = {}
+            self._set_component('index_tables', tables, copy=False)
+        elif name in tables:
+            return tables[name]
+
+        table = function()
+
+        if table is not None:
+            total = nbytes(table) + sum(map(nbytes, tables.values()))
+            if total <= index_cache_size():
+                tables[name] = table
+        # --- End: if
+
+        return table
+
+    def _sample_positions(self, axis_positions):
+        '''Return the positions of uncompressed elements in the sample
+    dimension.
+
+    By default, the positions are found by looking up the requested
+    elements in the uncompressed positions of every sample, as given
+    by `_uncompressed_indices`. If a position occurs for more than one
+    sample then the last of these samples is used.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        axis_positions: `list` of `numpy.ndarray`
+            For each uncompressed dimension that is compressed, the
+            positions along that dimension of the required elements.
+
+    :Returns:
+
+        `numpy.ndarray`
+            The positions in the sample dimension of the compressed
+            array of each combination of the given dimension
+            positions, with one dimension for each element of
+            *axis_positions*. Combinations which do not correspond to
+            a sample (i.e. which are missing from the uncompressed
+            array) have position -1.
+
+        '''
+        lookup = self._memoize('lookup', self._lookup_table)
+        if lookup is None:
+            raise NotImplementedError(
+                "Subclasses of cfdm.data.abstract.CompressedArray "
+                "must implement '_sample_positions' or "
+                "'_uncompressed_indices'"
+            )  # pragma: no cover
+
+        order, sorted_flat = lookup
+
+        shape = self.shape
+        compressed_shape = [shape[i] for i in self.get_compressed_axes()]
+
+        # Flattened positions of the requested elements
+        flat = numpy.ravel_multi_index(numpy.ix_(*axis_positions),
+                                       compressed_shape)
+        if not sorted_flat.size:
+            return numpy.full(flat.shape, -1, dtype=int)
+
+        # Find each requested position amongst the samples. If a
+        # position appears more than once then the last occurrence is
+        # used.
+        i = numpy.searchsorted(sorted_flat, flat, side='right') - 1
+        i = numpy.clip(i, 0, None)
+        found = sorted_flat[i] == flat
+
+        return numpy.where(found, order[i], -1)
+
+    def _uncompressed_indices(self):
+        '''Return the uncompressed indices of every sample.
+
+    Subclasses may override this method to provide a fast way of
+    uncompressing the whole array, by assigning every sample of the
+    compressed array to its uncompressed position with a single
+    scatter. By default `None` is returned, in which case the whole
+    array is uncompressed in the same way as any other subspace.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Returns:
+
+        `tuple` of `numpy.ndarray` or `None`
+            For each uncompressed dimension that is compressed, the
+            position along that dimension of each sample, in sample
+            dimension order.
+
+        '''
+        return None
+
     def _get_compressed_Array(self, default=ValueError()):
         '''Return the compressed array.
 
@@ -67,6 +451,42 @@ class CompressedArray(Array):
         '''
         return self._get_component('compressed_Array', default)
 
+    def _get_compressed_subspace(self, indices):
+        '''Return a subspace of the compressed array as a numpy array.
+
+    Any missing values in the compressed array are retained in the
+    returned array, regardless of whether the compressed array is
+    stored as an `Array` or as a `Data` instance.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        indices:
+            The indices that define the subspace of the compressed
+            array, as accepted by the compressed array's
+            `__getitem__` method.
+
+    :Returns:
+
+        `numpy.ndarray`
+            The subspace of the compressed array.
+
+    **Examples:**
+
+    >>> n = a._get_compressed_subspace((slice(0, 5),))
+
+        '''
+        array = self._get_compressed_Array()[indices]
+        if not isinstance(array, numpy.ndarray):
+            # The compressed array is a Data instance, so convert its
+            # subspace to a numpy array (retaining any mask). The
+            # subspace is already independent, so it is not copied
+            # again.
+            array = array.view_array()
+
+        return array
+
     def _set_compressed_Array(self, array, copy=True):
         '''Set the compressed array.
 
@@ -91,6 +511,9 @@ class CompressedArray(Array):
 
         self._set_component('compressed_Array', array, copy=False)
 
+        # Discard the memoized index tables of the old array
+        self._del_component('index_tables', None)
+
     # ----------------------------------------------------------------
     # Attributes
     # ----------------------------------------------------------------
@@ -1,6 +1,7 @@
 import itertools
 import logging
 
+import cftime
 import numpy
 import netCDF4
 
@@ -10,7 +11,7 @@ from ..mixin.container import Container
 from ..mixin.netcdf import NetCDFHDF5
 
 from ..constants import masked as cfdm_masked
-from ..functions import abspath
+from ..functions import abspath, lazy, reduction_block_size, _block_shape
 
 from ..decorators import (
     _inplace_enabled,
@@ -19,11 +20,37 @@ from ..decorators import (
 )
 
 from . import abstract
-from . import NumpyArray
+from . import DeferredArray, NumpyArray
 
 
 logger = logging.getLogger(__name__)
 
+# The number of microseconds in each of the time units for which
+# reference times may be converted to date-times arithmetically
+_microseconds = {}
+for _units, _n in (
+        (('microseconds', 'microsecond', 'microsecs', 'microsec'), 1),
+        (('milliseconds', 'millisecond', 'millisecs', 'millisec',
+          'msecs', 'msec', 'ms'), 1000),
+        (('seconds', 'second', 'secs', 'sec', 's'), 1000000),
+        (('minutes', 'minute', 'mins', 'min'), 60000000),
+        (('hours', 'hour', 'hrs', 'hr', 'h'), 3600000000),
+        (('days', 'day', 'd'), 86400000000)):
+    _microseconds.update(dict.fromkeys(_units, _n))
+
+# The date-time classes for each of the calendars for which reference
+# times may be converted to date-times arithmetically
+_datetime_classes = {
+    'standard': cftime.DatetimeGregorian,
+    'gregorian': cftime.DatetimeGregorian,
+    'proleptic_gregorian': cftime.DatetimeProlepticGregorian,
+    'noleap': cftime.DatetimeNoLeap,
+    '365_day': cftime.DatetimeNoLeap,
+    'all_leap': cftime.DatetimeAllLeap,
+    '366_day': cftime.DatetimeAllLeap,
+    '360_day': cftime.Datetime360Day,
+}
+
 
 class Data(Container,
            NetCDFHDF5,
@@ -261,7 +288,11 @@ class Data(Container,
         if array is None:
             raise ValueError("No array!!")
 
-        array = array[indices]
+        deferred = self._deferred_Array()
+        if deferred is not None:
+            array = deferred.subspace(indices)
+        else:
+            array = array[indices]
 
         out = self.copy(array=False)
         out._set_Array(array, copy=False)
@@ -284,7 +315,7 @@ class Data(Container,
                 "Python scalars. Got {}".format(
                     self))
 
-        return int(self.array)
+        return int(self.view_array())
 
     def __iter__(self):
         '''Called when an iterator is required.
@@ -322,7 +353,7 @@ class Data(Container,
                 "Iteration over 0-d {}".format(self.__class__.__name__))
 
         if ndim == 1:
-            i = iter(self.array)
+            i = iter(self.view_array())
             while 1:
                 try:
                     yield next(i)
@@ -403,10 +434,53 @@ class Data(Container,
 
     x.__str__() <==> str(x)
 
+    The string is cached, and is reused until the underlying array,
+    the units or the calendar are changed.
+
         '''
         units = self.get_units(None)
         calendar = self.get_calendar(None)
 
+        array = self._get_Array(None)
+        summary = self._custom.get('str_summary')
+        if summary is not None:
+            summary_array, units_calendar, out = summary
+            if (summary_array is array
+                    and units_calendar == (units, calendar)):
+                return out
+        # --- End: if
+
+        out = self._str(units, calendar)
+
+        if array is not None:
+            self._custom['str_summary'] = (array, (units, calendar), out)
+
+        return out
+
+    # ----------------------------------------------------------------
+    # Private methods
+    # ----------------------------------------------------------------
+    def _str(self, units, calendar):
+        '''Return the string representation of the data.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `__str__`
+
+    :Parameters:
+
+        units: `str` or `None`
+            The units of the data.
+
+        calendar: `str` or `None`
+            The calendar of the data.
+
+    :Returns:
+
+        `str`
+            The string representation.
+
+        '''
         if units is not None:
             isreftime = ('since' in units)
         else:
@@ -504,9 +578,207 @@ class Data(Container,
 
         return out
 
-    # ----------------------------------------------------------------
-    # Private methods
-    # ----------------------------------------------------------------
+    def _deferred_Array(self):
+        '''Return the array as a deferred array, if operations are deferred.
+
+    Operations are deferred when the lazy setting is True (see
+    `{{package}}.lazy`) and the data array is not in memory.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Returns:
+
+        `DeferredArray` or `None`
+            The deferred array, or `None` if operations are not to be
+            deferred.
+
+    **Examples:**
+
+    >>> d._deferred_Array()
+    <DeferredArray(1, 10, 9): >
+
+        '''
+        if not lazy():
+            return None
+
+        array = self._get_Array(None)
+        if array is None or isinstance(array, NumpyArray):
+            return None
+
+        if not isinstance(array, DeferredArray):
+            array = DeferredArray(array)
+
+        return array
+
+    def _equals_compression(self, other):
+        '''Whether two compressed arrays are compressed in the same way.
+
+    The compressed arrays are compressed in the same way if the same
+    axes are compressed into the same compressed dimension, and they
+    have equal count, index and list variables, as appropriate. If
+    so, then their uncompressed arrays are equal if and only if their
+    compressed arrays are equal.
+
+    It is assumed, but not checked, that the two arrays have the same
+    shape and compression type.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `equals`
+
+    :Parameters:
+
+        other: `{{class}}`
+            The data to compare with.
+
+    :Returns:
+
+        `bool`
+            Whether or not the two arrays are compressed in the same
+            way.
+
+        '''
+        if (self.get_compressed_axes() != other.get_compressed_axes()
+                or self.get_compressed_dimension(None)
+                != other.get_compressed_dimension(None)):
+            return False
+
+        for name in ('count', 'index', 'list'):
+            x = getattr(self, 'get_' + name)(None)
+            y = getattr(other, 'get_' + name)(None)
+            if x is None and y is None:
+                continue
+
+            if x is None or y is None:
+                return False
+
+            x = x.get_data(None)
+            y = y.get_data(None)
+            if x is None or y is None:
+                return False
+
+            # The variables contain integers, and so must be
+            # identical
+            x = x.view_array()
+            y = y.view_array()
+            if not (numpy.array_equal(numpy.ma.getmaskarray(x),
+                                      numpy.ma.getmaskarray(y))
+                    and numpy.array_equal(numpy.ma.filled(x, 0),
+                                          numpy.ma.filled(y, 0))):
+                return False
+        # --- End: for
+
+        return True
+
+    def _equals_fingerprint(self, ignore_data_type=False,
+                            ignore_compression=False, digest=False):
+        '''Return a structural fingerprint for testing equality.
+
+    Two instances can only be equal if their fingerprints, created
+    with the same parameters, are equal. The fingerprint records the
+    shape, units, calendar, data type and compression type.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `equals`, `_mask_digest`
+
+    :Parameters:
+
+        ignore_data_type: `bool`, optional
+            As for the `equals` method.
+
+        ignore_compression: `bool`, optional
+            As for the `equals` method.
+
+        digest: `bool`, optional
+            If True then also record the digest of the positions of
+            the missing values, as returned by `_mask_digest`.
+
+    :Returns:
+
+        `tuple`
+            The fingerprint.
+
+    **Examples:**
+
+    >>> d = {{package}}.{{class}}([1, 2], 'm')
+    >>> d._equals_fingerprint()
+    ((2,), 'm', None, dtype('int64'), '')
+    >>> d._equals_fingerprint(ignore_data_type=True,
+    ...                       ignore_compression=True, digest=True)
+    ((2,), 'm', None, (0, 0))
+
+        '''
+        out = [self.shape, self.get_units(None), self.get_calendar(None)]
+
+        if not ignore_data_type:
+            out.append(self.dtype)
+
+        if not ignore_compression:
+            out.append(self.get_compression_type())
+
+        if digest:
+            out.append(self._mask_digest())
+
+        return tuple(out)
+
+    def _equals_values(self, other, rtol=None, atol=None):
+        '''Whether two data arrays have the same values.
+
+    If either data array is not in memory, and is larger than the
+    reduction block size (see `{{package}}.reduction_block_size`),
+    then the arrays are compared block by block, reading the same
+    block from each one, and the comparison stops at the first block
+    that differs. Otherwise the whole arrays are compared at once.
+
+    It is assumed, but not checked, that the two arrays have the same
+    shape.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `equals`, `_reduction_blocks`
+
+    :Parameters:
+
+        other: `{{class}}`
+            The data to compare with.
+
+        {{atol: number, optional}}
+
+        {{rtol: number, optional}}
+
+    :Returns:
+
+        `bool`
+            Whether or not the two arrays have the same values.
+
+    **Examples:**
+
+    >>> d = {{package}}.{{class}}([1, 2, 3])
+    >>> d._equals_values({{package}}.{{class}}([1, 2, 3]))
+    True
+    >>> d._equals_values({{package}}.{{class}}([1, 2, 4]))
+    False
+
+        '''
+        blocks = self._reduction_blocks()
+        if blocks is None:
+            blocks = other._reduction_blocks()
+
+        if blocks is None:
+            return self._equals(self.view_array(), other.view_array(),
+                                rtol=rtol, atol=atol)
+
+        array0 = self._get_Array()
+        array1 = other._get_Array()
+        for indices in blocks:
+            if not self._equals(array0[indices], array1[indices],
+                                rtol=rtol, atol=atol):
+                return False
+        # --- End: for
+
+        return True
+
     def _item(self, index):
         '''Return an element of the data as a scalar.
 
@@ -536,7 +808,9 @@ class Data(Container,
     masked
 
         '''
-        array = self[index].array
+        # Read the element directly from the underlying array, which
+        # only reads or uncompresses the one element
+        array = self._get_Array()[index]
 
         if not numpy.ma.isMA(array):
             return array.item()
@@ -547,6 +821,247 @@ class Data(Container,
 
         return numpy.ma.masked
 
+    def _mask_digest(self):
+        '''Return a digest of the positions of the missing values.
+
+    Data with different digests can not be equal. The digest is
+    cached, and is reused until the underlying array is changed.
+
+    If the data array is not in memory, and is larger than the
+    reduction block size (see `{{package}}.reduction_block_size`),
+    then the digest is calculated block by block, so that the whole
+    array is never in memory at once.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `_equals_fingerprint`
+
+    :Returns:
+
+        `tuple`
+            The number of missing values, and the sum, modulo 2**64,
+            of their positions in the flattened array.
+
+    **Examples:**
+
+    >>> d = {{package}}.{{class}}(numpy.ma.array([1, 2, 3, 4],
+    ...                                 mask=[0, 1, 0, 1]))
+    >>> d._mask_digest()
+    (2, 4)
+
+        '''
+        array = self._get_Array(None)
+        cached = self._custom.get('mask_digest')
+        if cached is not None:
+            cached_array, digest = cached
+            if cached_array is array:
+                return digest
+        # --- End: if
+
+        count = 0
+        total = 0
+
+        blocks = self._reduction_blocks()
+        if blocks is None:
+            positions = numpy.flatnonzero(
+                numpy.ma.getmaskarray(self.view_array()))
+            count = positions.size
+            total = int(positions.sum(dtype='uint64'))
+        else:
+            shape = self.shape
+            for indices in blocks:
+                positions = numpy.nonzero(
+                    numpy.ma.getmaskarray(array[indices]))
+                if not positions[0].size:
+                    continue
+
+                positions = numpy.ravel_multi_index(
+                    [p + index.start for p, index in zip(positions,
+                                                         indices)],
+                    shape)
+                count += positions.size
+                total += int(positions.sum(dtype='uint64'))
+        # --- End: if
+
+        digest = (count, total % 2**64)
+
+        if array is not None:
+            self._custom['mask_digest'] = (array, digest)
+
+        return digest
+
+    @staticmethod
+    def _num2date(array, units, calendar):
+        '''Convert reference times to date-time objects.
+
+    Reference times that are whole numbers of microseconds in units of
+    days, hours, minutes, seconds, milliseconds or microseconds, in
+    any CF calendar other than "julian", are converted arithmetically:
+    the date and time components of all of the date-times are
+    calculated together from the reference date of the units, and
+    then the date-time objects are created directly from them. If
+    the reference times are regularly spaced, then the date-times are
+    calculated from the first time and the spacing, and only one
+    date-time object is created for each distinct time. Reference
+    times in the "360_day" calendar are only converted arithmetically
+    when they are regularly spaced.
+
+    All other reference times are converted with the
+    `netCDF4.num2date` function. Both methods give identical results.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `datetime_array`
+
+    :Parameters:
+
+        array: `numpy.ndarray`
+            The reference times. Must not contain missing values.
+
+        units: `str` or `None`
+            The reference time units.
+
+        calendar: `str`
+            The calendar.
+
+    :Returns:
+
+        `numpy.ndarray`
+            The date-time objects, with the same shape as *array*.
+
+    **Examples:**
+
+    >>> d = {{package}}.{{class}}._num2date(
+    ...     numpy.array([0, 24, 48]), 'hours since 2000-12-30', '360_day')
+    >>> print(d)
+    [cftime.Datetime360Day(2000-12-30 00:00:00)
+     cftime.Datetime360Day(2001-01-01 00:00:00)
+     cftime.Datetime360Day(2001-01-02 00:00:00)]
+
+        '''
+        factor = None
+        datetime_class = _datetime_classes.get(calendar)
+        if (datetime_class is not None and isinstance(units, str)
+                and array.size and array.dtype.kind in 'iuf'):
+            factor = _microseconds.get(
+                units.partition(' since ')[0].strip().lower())
+
+        if factor is not None:
+            # Convert the reference times to integer numbers of
+            # microseconds, provided that this can be done exactly
+            scaled = array.astype(float) * factor
+            microseconds = numpy.round(scaled)
+            if (abs(microseconds).max() >= 2**53
+                    or not (microseconds == scaled).all()):
+                factor = None
+        # --- End: if
+
+        if factor is not None:
+            microseconds = microseconds.astype('int64').ravel()
+
+            # If the reference times are regularly spaced, such as
+            # the cell bounds of a regular time axis, then only one
+            # date-time is created for each distinct time, by stepping
+            # from the first time.
+            first = microseconds.min()
+            steps = microseconds - first
+            step = numpy.gcd.reduce(steps)
+            if step:
+                steps //= step
+
+            index = None
+            n_steps = int(steps.max()) + 1
+            if n_steps < microseconds.size:
+                microseconds = first + step * numpy.arange(n_steps)
+                index = steps
+            elif calendar == '360_day':
+                # netCDF4.num2date is at least as fast as creating
+                # each date-time directly for this calendar
+                factor = None
+        # --- End: if
+
+        if factor is not None:
+            reference = netCDF4.num2date(0, units=units, calendar=calendar,
+                                         only_use_cftime_datetimes=True)
+
+            day, time = numpy.divmod(
+                microseconds
+                + ((reference.hour * 60 + reference.minute) * 60
+                   + reference.second) * 1000000
+                + reference.microsecond,
+                86400000000)
+
+            if calendar == '360_day':
+                day += (reference.year * 360 + (reference.month - 1) * 30
+                        + reference.day - 1)
+                year, day = numpy.divmod(day, 360)
+                month, day = numpy.divmod(day, 30)
+                month += 1
+                day += 1
+            elif calendar in ('noleap', '365_day', 'all_leap', '366_day'):
+                month_lengths = [31, 28, 31, 30, 31, 30,
+                                 31, 31, 30, 31, 30, 31]
+                if calendar in ('all_leap', '366_day'):
+                    month_lengths[1] = 29
+
+                month_starts = numpy.cumsum([0] + month_lengths[:-1])
+                year_length = sum(month_lengths)
+
+                day += (reference.year * year_length
+                        + month_starts[reference.month - 1]
+                        + reference.day - 1)
+                year, day = numpy.divmod(day, year_length)
+                month = numpy.searchsorted(month_starts, day, side='right')
+                day -= month_starts[month - 1] - 1
+            elif reference.year >= 1:
+                # Gregorian calendars, using the proleptic Gregorian
+                # calendar of numpy.datetime64
+                reference_day = numpy.datetime64(
+                    '{:04d}-{:02d}-{:02d}'.format(
+                        reference.year, reference.month, reference.day),
+                    'D').astype('int64')
+                day += reference_day
+
+                gregorian_start = numpy.datetime64(
+                    '1582-10-15', 'D').astype('int64')
+                if calendar != 'proleptic_gregorian' and (
+                        reference_day < gregorian_start
+                        or day.min() < gregorian_start):
+                    # Date-times in the mixed Gregorian/Julian
+                    # calendar from before the introduction of the
+                    # Gregorian calendar
+                    factor = None
+                else:
+                    day = day.astype('datetime64[D]')
+                    month = day.astype('datetime64[M]')
+                    year = (day.astype('datetime64[Y]').astype('int64')
+                            + 1970)
+                    day = (day - month).astype('int64') + 1
+                    month = month.astype('int64') % 12 + 1
+            else:
+                factor = None
+        # --- End: if
+
+        if factor is None or year.min() < 1:
+            return netCDF4.num2date(array, units=units, calendar=calendar,
+                                    only_use_cftime_datetimes=True)
+
+        hour, time = numpy.divmod(time, 3600000000)
+        minute, time = numpy.divmod(time, 60000000)
+        second, microsecond = numpy.divmod(time, 1000000)
+
+        out = numpy.empty((microseconds.size,), dtype=object)
+        out[...] = [
+            datetime_class(*components) for components in zip(
+                *[x.tolist() for x in (year, month, day, hour, minute,
+                                       second, microsecond)])
+        ]
+
+        if index is not None:
+            out = out[index]
+
+        return out.reshape(array.shape)
+
     def _parse_axes(self, axes):
         '''Parse data axes and return valid non-duplicate axes as a tuple.
 
@@ -596,6 +1111,132 @@ class Data(Container,
 
         return tuple(axes2)
 
+    def _reduce(self, reduction, axes):
+        '''Reduce the data array along axes.
+
+    If the data array is not in memory, and is larger than the
+    reduction block size (see `{{package}}.reduction_block_size`),
+    then the reduction is calculated block by block, with the partial
+    reductions of each block combined, so that the whole array is
+    never in memory at once.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        reduction: function
+            The reduction function, such as `numpy.amax`, which must
+            accept *axis* and *keepdims* keywords, ignore masked
+            elements, and be able to combine its own partial results
+            exactly, so that the result does not depend on the
+            blocks.
+
+        axes: `tuple` of `int` or `None`
+            The axes to be reduced, as returned by `_parse_axes`. If
+            `None` then all axes are reduced.
+
+    :Returns:
+
+        `numpy.ndarray`
+            The reduced array, with the reduced axes retained with
+            size one.
+
+    **Examples:**
+
+    >>> d = {{package}}.{{class}}([[4, 2, 1], [1, 2, 3]], 'metre')
+    >>> print(d._reduce(numpy.amax, (1,)))
+    [[4]
+     [3]]
+
+        '''
+        blocks = self._reduction_blocks()
+        if blocks is None or axes == ():
+            return reduction(self.view_array(), axis=axes, keepdims=True)
+
+        if axes is None:
+            axes = tuple(range(self.ndim))
+
+        out_shape = tuple([1 if i in axes else n
+                           for i, n in enumerate(self.shape)])
+
+        array = self._get_Array()
+        out = None
+        for indices in blocks:
+            block = reduction(array[indices], axis=axes, keepdims=True)
+
+            if out is None:
+                out = numpy.ma.masked_all(out_shape, dtype=block.dtype)
+
+            # Combine the block's reduction with those of the
+            # previous blocks that span the same output elements
+            out_indices = tuple([slice(0, 1) if i in axes else index
+                                 for i, index in enumerate(indices)])
+            block = reduction(
+                numpy.ma.concatenate((out[out_indices], block),
+                                     axis=axes[0]),
+                axis=axes[0], keepdims=True)
+
+            out[out_indices] = block
+        # --- End: for
+
+        if not numpy.ma.is_masked(out):
+            out = out.data
+
+        return out
+
+    def _reduction_blocks(self):
+        '''Return the indices of the blocks in which to reduce the data.
+
+    Blocks are only used for a data array that is not in memory and
+    which is larger than the reduction block size (see
+    `{{package}}.reduction_block_size`). Blocks span whole HDF5 chunks
+    of the data, if these have been set (see `nc_hdf5_chunksizes`).
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Returns:
+
+        generator or `None`
+            The indices of each block, or `None` if the data array is
+            to be reduced in a single block.
+
+    **Examples:**
+
+    >>> d.shape
+    (10, 180, 360)
+    >>> for indices in d._reduction_blocks():
+    ...     print(indices)
+    ...
+    (slice(0, 2, None), slice(0, 180, None), slice(0, 360, None))
+    (slice(2, 4, None), slice(0, 180, None), slice(0, 360, None))
+    (slice(4, 6, None), slice(0, 180, None), slice(0, 360, None))
+    (slice(6, 8, None), slice(0, 180, None), slice(0, 360, None))
+    (slice(8, 10, None), slice(0, 180, None), slice(0, 360, None))
+
+        '''
+        max_nbytes = reduction_block_size()
+        if not max_nbytes:
+            return None
+
+        array = self._get_Array(None)
+        if array is None or isinstance(array, NumpyArray):
+            # The data is in memory
+            return None
+
+        shape = self.shape
+        if not shape:
+            return None
+
+        block_shape = _block_shape(shape, self.dtype.itemsize, max_nbytes,
+                                   chunks=self.nc_hdf5_chunksizes())
+        if block_shape is None:
+            return None
+
+        return (tuple([slice(i, i + n) for i, n in zip(start, block_shape)])
+                for start in itertools.product(
+                        *[range(0, size, n)
+                          for size, n in zip(shape, block_shape)]))
+
     def _set_Array(self, array, copy=True):
         '''Set the array.
 
@@ -615,12 +1256,18 @@ class Data(Container,
     >>> d._set_Array(a)
 
         '''
-        if not isinstance(array, abstract.Array):
+        if not isinstance(array, (abstract.Array, NumpyArray)):
             if not isinstance(array, numpy.ndarray):
                 array = numpy.asanyarray(array)
 
             array = NumpyArray(array)
 
+        # Discard the cached string representation, date-times and
+        # mask digest of the old array
+        self._custom.pop('str_summary', None)
+        self._custom.pop('datetime_array', None)
+        self._custom.pop('mask_digest', None)
+
         super()._set_Array(array, copy=copy)
 
     def _set_CompressedArray(self, array, copy=True):
@@ -751,7 +1398,10 @@ class Data(Container,
     "standard" (i.e. the mixed Gregorian/Julian calendar as defined by
     Udunits) will be used.
 
-    Conversions are carried out with the `netCDF4.num2date` function.
+    Conversions are carried out arithmetically where possible, and
+    otherwise with the `netCDF4.num2date` function, with identical
+    results. The date-times are cached, and are reused until the
+    underlying array, the units or the calendar are changed.
 
     .. versionadded:: (cfdm) 1.7.0
 
@@ -784,7 +1434,19 @@ class Data(Container,
     2019-02-03 00:00:00
 
         '''
-        array = self.array
+        units = self.get_units(None)
+        calendar = self.get_calendar('standard')
+
+        data_array = self._get_Array(None)
+        cached = self._custom.get('datetime_array')
+        if cached is not None:
+            cached_array, units_calendar, array = cached
+            if (cached_array is data_array
+                    and units_calendar == (units, calendar)):
+                return array.copy()
+        # --- End: if
+
+        array = self.view_array()
 
         mask = None
         if numpy.ma.isMA(array):
@@ -800,20 +1462,23 @@ class Data(Container,
             # missing data
             return array
 
-        array = netCDF4.num2date(array, units=self.get_units(None),
-                                 calendar=self.get_calendar('standard'),
-                                 only_use_cftime_datetimes=True)
-
         if mask is None:
             # There is no missing data
-            array = numpy.array(array, dtype=object)
+            array = numpy.array(self._num2date(array, units, calendar),
+                                dtype=object)
         else:
             # There is missing data
+            array = self._num2date(array.filled(0), units, calendar)
             array = numpy.ma.masked_where(mask, array)
             if not numpy.ndim(array):
                 array = numpy.ma.masked_all((), dtype=object)
+        # --- End: if
 
-        return array
+        if data_array is not None:
+            self._custom['datetime_array'] = (data_array, (units, calendar),
+                                              array)
+
+        return array.copy()
 
     @property
     def datetime_as_string(self):
@@ -826,7 +1491,8 @@ class Data(Container,
     "standard" (i.e. the mixed Gregorian/Julian calendar as defined by
     Udunits) will be used.
 
-    Conversions are carried out with the `netCDF4.num2date` function.
+    The strings are created from the cached date-times of
+    `datetime_array`.
 
     .. versionadded:: (cfdm) 1.8.0
 
@@ -881,7 +1547,7 @@ class Data(Container,
      [False False False False]]
 
         '''
-        return type(self)(numpy.ma.getmaskarray(self.array))
+        return type(self)(numpy.ma.getmaskarray(self.view_array()))
 
     # ----------------------------------------------------------------
     # Methods
@@ -920,11 +1586,23 @@ class Data(Container,
     False
 
         '''
-        masked = self.array.any()
-        if masked is numpy.ma.masked:
-            masked = False
+        blocks = self._reduction_blocks()
+        if blocks is None:
+            masked = self.view_array().any()
+            if masked is numpy.ma.masked:
+                masked = False
+
+            return masked
+
+        # Test each block in turn, stopping at the first True element
+        array = self._get_Array()
+        for indices in blocks:
+            masked = array[indices].any()
+            if masked and masked is not numpy.ma.masked:
+                return True
+        # --- End: for
 
-        return masked
+        return False
 
     @_inplace_enabled(default=False)
     def apply_masking(self, fill_values=None, valid_min=None,
@@ -1092,35 +1770,17 @@ class Data(Container,
                         "of type bool. Got type {}".format(type(fill_values)))
         # --- End: if
 
-        mask = None
-
-        if fill_values:
-            array = self.array
-            mask = (array == fill_values[0])
-
-            for fill_value in fill_values[1:]:
-                mask |= (array == fill_value)
-        # --- End: for
-
-        if valid_min is not None:
-            if mask is None:
-                array = self.array
-                mask = (array < valid_min)
-            else:
-                mask |= (array < valid_min)
-        # --- End: if
+        if not fill_values and valid_min is None and valid_max is None:
+            return d
 
-        if valid_max is not None:
-            if mask is None:
-                array = self.array
-                mask = (array > valid_max)
-            else:
-                mask |= (array > valid_max)
-        # --- End: if
+        array = d._deferred_Array()
+        if array is not None:
+            array = array.apply_masking(fill_values, valid_min, valid_max)
+        else:
+            array = abstract.Array._apply_masking(
+                self.view_array(), fill_values, valid_min, valid_max)
 
-        if mask is not None:
-            array = numpy.ma.where(mask, cfdm_masked, array)
-            d._set_Array(array, copy=False)
+        d._set_Array(array, copy=False)
 
         return d
 
@@ -1197,10 +1857,10 @@ class Data(Container,
                     "can not have the value 'mask'"
                 )
             masked = True
-            array = self.filled().array.tolist()
+            array = self.filled().view_array().tolist()
         else:
             masked = False
-            array = self.array.tolist()
+            array = self.view_array().tolist()
 
         units = self.get_units(None)
         if units is None:
@@ -1308,7 +1968,7 @@ class Data(Container,
                     )  # pragma: no cover
         # --- End: if
 
-        array = self.array
+        array = self.view_array()
 
         if numpy.ma.isMA(array):
             array = array.filled(fill_value)
@@ -1375,7 +2035,11 @@ class Data(Container,
                 "Can't insert dimension: "
                 "Invalid position: {!r}".format(position))
 
-        array = numpy.expand_dims(self.array, position)
+        array = d._deferred_Array()
+        if array is not None:
+            array = array.insert_dimension(position)
+        else:
+            array = numpy.expand_dims(self.view_array(), position)
 
         d._set_Array(array, copy=False)
 
@@ -1683,8 +2347,7 @@ class Data(Container,
         except ValueError as error:
             raise ValueError("Can't find maximum of data: {}".format(error))
 
-        array = self.array
-        array = numpy.amax(array, axis=axes, keepdims=True)
+        array = self._reduce(numpy.amax, axes)
 
         out = self.copy(array=False)
         out._set_Array(array, copy=False)
@@ -1755,8 +2418,7 @@ class Data(Container,
         except ValueError as error:
             raise ValueError("Can't find minimum of data: {}".format(error))
 
-        array = self.array
-        array = numpy.amin(array, axis=axes, keepdims=True)
+        array = self._reduce(numpy.amin, axes)
 
         out = self.copy(array=False)
         out._set_Array(array, copy=False)
@@ -1834,8 +2496,11 @@ class Data(Container,
         if not axes:
             return d
 
-        array = self.array
-        array = numpy.squeeze(array, axes)
+        array = d._deferred_Array()
+        if array is not None:
+            array = array.squeeze(axes)
+        else:
+            array = numpy.squeeze(self.view_array(), axes)
 
         d._set_Array(array, copy=False)
 
@@ -1902,8 +2567,9 @@ class Data(Container,
         except ValueError as error:
             raise ValueError("Can't sum data: {}".format(error))
 
-        array = self.array
-        array = numpy.sum(array, axis=axes, keepdims=True)
+        # Floating point sums are not calculated block by block,
+        # because they would then depend on the block size
+        array = numpy.sum(self.view_array(), axis=axes, keepdims=True)
 
         d = self.copy(array=False)
         d._set_Array(array, copy=False)
@@ -1975,8 +2641,11 @@ class Data(Container,
         if axes == tuple(range(ndim)):
             return d
 
-        array = self.array
-        array = numpy.transpose(array, axes=axes)
+        array = d._deferred_Array()
+        if array is not None:
+            array = array.transpose(axes)
+        else:
+            array = numpy.transpose(self.view_array(), axes=axes)
 
         d._set_Array(array, copy=False)
 
@@ -2236,13 +2905,17 @@ class Data(Container,
                             self.__class__.__name__)
                     )  # pragma: no cover
                     return False
+
+                if self._equals_compression(other):
+                    # Equal compressed arrays that are compressed in
+                    # the same way have equal uncompressed arrays
+                    return True
         # --- End: if
 
         # ------------------------------------------------------------
         # Check for equal (uncompressed) array values
         # ------------------------------------------------------------
-        if not self._equals(self.array, other.array,
-                            rtol=rtol, atol=atol):
+        if not self._equals_values(other, rtol=rtol, atol=atol):
             logger.info(
                 "{0}: Different array values (atol={1}, rtol={2})".format(
                     self.__class__.__name__, atol, rtol)
@@ -2441,7 +3114,11 @@ class Data(Container,
         new_shape = [n for i, n in enumerate(shape) if i not in axes]
         new_shape.insert(axes[0], numpy.prod([shape[i] for i in axes]))
 
-        array = d.array.reshape(new_shape)
+        array = d._deferred_Array()
+        if array is not None:
+            array = array.reshape(new_shape)
+        else:
+            array = d.view_array().reshape(new_shape)
 
         out = type(self)(array, units=d.get_units(None),
                          calendar=d.get_calendar(None),
@@ -2598,11 +3275,24 @@ class Data(Container,
     <{{repr}}Data(3): [1, 2, 4] metre>
 
         '''
-        array = self.array
-        array = numpy.unique(array)
+        blocks = self._reduction_blocks()
+        if blocks is None:
+            array = numpy.unique(self.view_array())
+            if numpy.ma.is_masked(array):
+                array = array.compressed()
+        else:
+            # Combine the unique values of each block
+            array = self._get_Array()
+            values = []
+            for indices in blocks:
+                block = numpy.unique(array[indices])
+                if numpy.ma.is_masked(block):
+                    block = block.compressed()
+
+                values.append(numpy.asarray(block))
+            # --- End: for
 
-        if numpy.ma.is_masked(array):
-            array = array.compressed()
+            array = numpy.unique(numpy.concatenate(values))
 
         d = self.copy(array=False)
         d._set_Array(array, copy=False)
@@ -2613,6 +3303,49 @@ class Data(Container,
 
         return d
 
+    def view_array(self):
+        '''Return a read-only numpy array containing the data.
+
+    Unlike `array`, the returned array is not necessarily independent
+    of the data, and so it may not be modified in-place. This avoids
+    copying data that is stored in memory when it is only needed for
+    reading.
+
+    If a fill value has been set (see `set_fill_value`) then it will
+    be used, otherwise the default numpy fill value appropriate to the
+    data type will be used.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `array`
+
+    :Returns:
+
+        `numpy.ndarray`
+            A read-only numpy array of the data.
+
+    **Examples:**
+
+    >>> d = {{package}}.{{class}}([1, 2, 3.0], 'km')
+    >>> n = d.view_array()
+    >>> print(n)
+    [1. 2. 3.]
+    >>> n.flags.writeable
+    False
+    >>> n[0] = 88
+    Traceback (most recent call last):
+        ...
+    ValueError: assignment destination is read-only
+
+        '''
+        array = self._get_Array().view_array()
+
+        # Set the numpy array fill value
+        if numpy.ma.isMA(array):
+            array.set_fill_value(self.get_fill_value(None))
+
+        return array
+
     # ----------------------------------------------------------------
     # Aliases
     # ----------------------------------------------------------------
@@ -0,0 +1,522 @@
+import numpy
+
+from . import abstract
+
+from .numpyarray import NumpyArray
+
+
+class DeferredArray(abstract.Array):
+    '''An array with deferred operations.
+
+    A deferred array records operations on another array, such as
+    subspacing, transposing and masking, without carrying them
+    out. The operations are carried out when the values of the array
+    are requested.
+
+    Subspaces are combined with each other, and with the operations
+    that precede them wherever possible, so that only the subspace of
+    the other array that is actually required is ever read from it,
+    with a single read.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    '''
+    def __init__(self, array=None):
+        '''**Initialization**
+
+    :Parameters:
+
+        array: subclass of `Array`
+            The array on which the operations are to be carried out.
+
+    **Examples:**
+
+    >>> a = {{package}}.{{class}}(netcdf_array)
+    >>> b = a.subspace([slice(0, 1), slice(None), slice(10, 20)])
+    >>> b = b.transpose([2, 1, 0]).squeeze([2])
+
+        '''
+        super().__init__()
+
+        if array is not None:
+            shape = tuple(array.shape)
+        else:
+            shape = ()
+
+        self._set_component('array', array, copy=False)
+        self._set_component('indices', (slice(None),) * len(shape),
+                            copy=False)
+        self._set_component('operations', (), copy=False)
+        self._set_component('shape', shape, copy=False)
+
+    def __getitem__(self, indices):
+        '''x.__getitem__(indices) <==> x[indices]
+
+    Returns a subspace of the array as an independent numpy array,
+    after carrying out all of the deferred operations.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+        '''
+        if indices is not Ellipsis:
+            return self.subspace(indices)[...]
+
+        source = self.source()
+        indices = self._get_component('indices')
+        if all([isinstance(index, slice) and index == slice(None)
+                for index in indices]):
+            array = source[...]
+        else:
+            array = source[indices]
+
+        for operation, args in self._get_component('operations'):
+            if operation == 'subspace':
+                array = self.get_subspace(array, args, copy=False)
+            elif operation == 'transpose':
+                array = numpy.transpose(array, args)
+            elif operation == 'squeeze':
+                array = numpy.squeeze(array, args)
+            elif operation == 'insert_dimension':
+                array = numpy.expand_dims(array, args)
+            elif operation == 'reshape':
+                array = array.reshape(args)
+            elif operation == 'apply_masking':
+                array = self._apply_masking(array, *args)
+        # --- End: for
+
+        return array
+
+    def __str__(self):
+        '''x.__str__() <==> str(x)
+
+        '''
+        operations = [operation for operation, _ in
+                      self._get_component('operations')]
+        return "{0} {1}".format(repr(self.source()), operations)
+
+    # ----------------------------------------------------------------
+    # Private methods
+    # ----------------------------------------------------------------
+    def _defer(self, operation, args, shape):
+        '''Return a new deferred array with an additional operation.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        operation: `str`
+            The name of the operation.
+
+        args:
+            The arguments of the operation.
+
+        shape: `tuple`
+            The shape of the array after the operation.
+
+    :Returns:
+
+        `{{class}}`
+            The new deferred array.
+
+        '''
+        new = self.copy()
+        new._set_component(
+            'operations',
+            self._get_component('operations') + ((operation, args),),
+            copy=False)
+        new._set_component('shape', tuple(shape), copy=False)
+        return new
+
+    # ----------------------------------------------------------------
+    # Attributes
+    # ----------------------------------------------------------------
+    @property
+    def array(self):
+        '''Return an independent numpy array containing the data.
+
+    All of the deferred operations are carried out.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Returns:
+
+        `numpy.ndarray`
+            An independent numpy array of the data.
+
+    **Examples:**
+
+    >>> n = a.array
+    >>> isinstance(n, numpy.ndarray)
+    True
+
+        '''
+        return self[...]
+
+    @property
+    def dtype(self):
+        '''Data-type of the data elements.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    **Examples:**
+
+    >>> a.dtype
+    dtype('float64')
+
+        '''
+        return self.source().dtype
+
+    @property
+    def ndim(self):
+        '''Number of array dimensions.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    **Examples:**
+
+    >>> a.shape
+    (73, 96)
+    >>> a.ndim
+    2
+
+        '''
+        return len(self.shape)
+
+    @property
+    def shape(self):
+        '''Tuple of array dimension sizes.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    **Examples:**
+
+    >>> a.shape
+    (73, 96)
+
+        '''
+        return self._get_component('shape')
+
+    @property
+    def size(self):
+        '''Number of elements in the array.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    **Examples:**
+
+    >>> a.shape
+    (73, 96)
+    >>> a.size
+    7008
+
+        '''
+        return int(numpy.prod(self.shape, dtype=int))
+
+    # ----------------------------------------------------------------
+    # Methods
+    # ----------------------------------------------------------------
+    def apply_masking(self, fill_values=(), valid_min=None,
+                      valid_max=None):
+        '''Defer the masking of invalid values.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        fill_values: sequence of scalars, optional
+            Elements exactly equal to any of these values are masked.
+
+        valid_min: number, optional
+            Elements strictly less than this value are masked.
+
+        valid_max: number, optional
+            Elements strictly greater than this value are masked.
+
+    :Returns:
+
+        `{{class}}`
+            The deferred array with the masking operation.
+
+    **Examples:**
+
+    >>> b = a.apply_masking(fill_values=[-999], valid_max=1000)
+
+        '''
+        return self._defer('apply_masking',
+                           (tuple(fill_values), valid_min, valid_max),
+                           self.shape)
+
+    def copy(self):
+        '''Return a deep copy of the array.
+
+    ``a.copy()`` is equivalent to ``copy.deepcopy(a)``.
+
+    The array on which the operations are carried out is not copied.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Returns:
+
+        `{{class}}`
+            The deep copy.
+
+    **Examples:**
+
+    >>> b = a.copy()
+
+        '''
+        new = super().copy()
+        new._components = self._components.copy()
+        return new
+
+    def get_filename(self):
+        '''The name of the netCDF file containing the array.
+
+    Only available if the array on which the operations are carried
+    out is stored in a netCDF file.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    **Examples:**
+
+    >>> a.get_filename()
+    'file.nc'
+
+        '''
+        return self.source().get_filename()
+
+    def insert_dimension(self, position):
+        '''Defer the insertion of a new size 1 dimension.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        position: `int`
+            The non-negative position of the new dimension.
+
+    :Returns:
+
+        `{{class}}`
+            The deferred array with the operation.
+
+    **Examples:**
+
+    >>> a.shape
+    (10, 9)
+    >>> a.insert_dimension(0).shape
+    (1, 10, 9)
+
+        '''
+        shape = list(self.shape)
+        shape.insert(position, 1)
+        return self._defer('insert_dimension', position, shape)
+
+    def reshape(self, shape):
+        '''Defer giving a new shape to the array.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        shape: sequence of `int`
+            The new shape, which must have the same size as the
+            array.
+
+    :Returns:
+
+        `{{class}}`
+            The deferred array with the operation.
+
+    **Examples:**
+
+    >>> a.shape
+    (10, 9)
+    >>> a.reshape((90,)).shape
+    (90,)
+
+        '''
+        shape = tuple([int(n) for n in shape])
+        return self._defer('reshape', shape, shape)
+
+    def source(self, default=ValueError()):
+        '''Return the array on which the operations are carried out.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        default: optional
+            Return the value of the *default* parameter if the array
+            has not been set. If set to an `Exception` instance then
+            it will be raised instead.
+
+    :Returns:
+
+            The array.
+
+    **Examples:**
+
+    >>> a.source()
+    <NetCDFArray(1, 10, 9): file=file.nc variable=ta>
+
+        '''
+        return self._get_component('array', default=default)
+
+    def squeeze(self, axes):
+        '''Defer the removal of size 1 dimensions.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        axes: sequence of `int`
+            The non-negative positions of the size 1 dimensions to be
+            removed.
+
+    :Returns:
+
+        `{{class}}`
+            The deferred array with the operation.
+
+    **Examples:**
+
+    >>> a.shape
+    (1, 10, 1)
+    >>> a.squeeze([0, 2]).shape
+    (10,)
+
+        '''
+        axes = tuple(sorted(axes))
+        shape = [n for i, n in enumerate(self.shape) if i not in axes]
+        return self._defer('squeeze', axes, shape)
+
+    def subspace(self, indices):
+        '''Defer the subspacing of the array.
+
+    The subspace is combined with any previous subspaces, provided
+    that the operations since then have only been transposes, the
+    insertion or removal of size 1 dimensions, and masking. Such
+    operations are unaffected by the subspace, and so the subspace
+    may be carried out first, when the array is read.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        indices:
+            The indices that define the subspace. Must be either
+            `Ellipsis` or a sequence that contains an index for each
+            dimension, each of which must either be a `slice` object
+            or a sequence of integers.
+
+    :Returns:
+
+        `{{class}}`
+            The deferred array with the subspace.
+
+    **Examples:**
+
+    >>> a.shape
+    (10, 9)
+    >>> a.subspace([slice(0, 5), [1, 3, 5]]).shape
+    (5, 3)
+
+        '''
+        if indices is Ellipsis:
+            return self.copy()
+
+        shape = self.shape
+        indices = list(indices)
+        indices.extend([slice(None)] * (len(shape) - len(indices)))
+
+        positions = [self._index_positions(index, size)
+                     for index, size in zip(indices, shape)]
+
+        operations = self._get_component('operations')
+        if any([operation in ('subspace', 'reshape')
+                for operation, _ in operations]):
+            # The subspace can't be carried out before all of the
+            # previous operations, so apply it to the result of them
+            return self._defer(
+                'subspace', tuple([self._as_index(p) for p in positions]),
+                [p.size for p in positions])
+
+        # Move the subspace to before the previous operations
+        source_positions = list(positions)
+        for operation, args in operations[::-1]:
+            if operation == 'transpose':
+                p = [None] * len(args)
+                for i, axis in zip(source_positions, args):
+                    p[axis] = i
+
+                source_positions = p
+            elif operation == 'squeeze':
+                for axis in args:
+                    source_positions.insert(axis, numpy.array([0]))
+            elif operation == 'insert_dimension':
+                source_positions.pop(args)
+        # --- End: for
+
+        # Combine the subspace with the previous subspace of the
+        # source array
+        source = self.source()
+        source_indices = [
+            self._as_index(self._index_positions(index, size)[p])
+            for index, size, p in zip(self._get_component('indices'),
+                                      source.shape, source_positions)
+        ]
+
+        new = self.copy()
+        new._set_component('indices', tuple(source_indices), copy=False)
+        new._set_component('shape', tuple([p.size for p in positions]),
+                           copy=False)
+        return new
+
+    def to_memory(self):
+        '''Bring the array into memory and retain it there.
+
+    All of the deferred operations are carried out.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Returns:
+
+        `NumpyArray`
+            The array that is stored in memory.
+
+    **Examples:**
+
+    >>> b = a.to_memory()
+
+        '''
+        return NumpyArray(self[...])
+
+    def transpose(self, axes):
+        '''Defer the permutation of the dimensions of the array.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        axes: sequence of `int`
+            The new order of the dimensions.
+
+    :Returns:
+
+        `{{class}}`
+            The deferred array with the operation.
+
+    **Examples:**
+
+    >>> a.shape
+    (10, 9)
+    >>> a.transpose([1, 0]).shape
+    (9, 10)
+
+        '''
+        axes = tuple(axes)
+        shape = self.shape
+        return self._defer('transpose', axes, [shape[i] for i in axes])
+
+# --- End: class
@@ -1,6 +1,3 @@
-from functools import reduce
-from operator import mul
-
 import numpy
 
 from . import abstract
@@ -53,76 +50,30 @@ class GatheredArray(abstract.CompressedArray):
                          list_variable=list_variable,
                          compression_type='gathered')
 
-    def __getitem__(self, indices):
-        '''x.__getitem__(indices) <==> x[indices]
+    def _uncompressed_indices(self):
+        '''Return the uncompressed indices of every sample.
 
-    Returns an subspace of the uncompressed data as an independent
-    numpy array.
+    The positions along each compressed dimension of every sample are
+    found by unravelling the flattened positions given by the list
+    variable.
 
-    The indices that define the subspace are relative to the
-    uncompressed data and must be either `Ellipsis` or a sequence that
-    contains an index for each dimension. In the latter case, each
-    dimension's index must either be a `slice` object or a sequence of
-    two or more integers.
+    .. versionadded:: (cfdm) 1.8.8.0
 
-    Indexing is similar to numpy indexing. The only difference to
-    numpy indexing (given the restrictions on the type of indices
-    allowed) is:
+    :Returns:
 
-      * When two or more dimension's indices are sequences of integers
-        then these indices work independently along each dimension
-        (similar to the way vector subscripts work in Fortran).
+        `tuple` of `numpy.ndarray`
+            The positions along each compressed dimension of the
+            uncompressed array of each sample, in sample dimension
+            order.
 
         '''
-        # ------------------------------------------------------------
-        # Method: Uncompress the entire array and then subspace it
-        # ------------------------------------------------------------
-
-        compressed_array = self._get_compressed_Array().array
-
-        # Initialise the un-sliced uncompressed array
-        uarray = numpy.ma.masked_all(self.shape, dtype=self.dtype)
-
-        # Initialise the uncomprssed array
-        compressed_dimension = self.get_compressed_dimension()
-
-        compressed_axes = self.get_compressed_axes()
+        uncompressed_shape = self.shape
+        compressed_shape = [uncompressed_shape[i]
+                            for i in self.get_compressed_axes()]
 
-        n_compressed_axes = len(compressed_axes)
+        list_array = numpy.array(self.get_list().data.array, dtype=int)
 
-        uncompressed_shape = self.shape
-        partial_uncompressed_shapes = [
-            reduce(mul, [uncompressed_shape[i]
-                         for i in compressed_axes[j:]], 1)
-            for j in range(1, n_compressed_axes)]
-
-        sample_indices = [slice(None)] * compressed_array.ndim
-        u_indices = [slice(None)] * self.ndim
-
-        list_array = self.get_list().data.array
-
-        zeros = [0] * n_compressed_axes
-        for j, b in enumerate(list_array):
-            sample_indices[compressed_dimension] = slice(j, j+1)
-
-            # Note that it is important for indices a and b to be
-            # integers (rather than the slices a:a+1 and b:b+1) so
-            # that these dimensions are dropped from uarray[u_indices]
-            u_indices[compressed_axes[0]:compressed_axes[-1]+1] = zeros
-            for i, z in zip(compressed_axes[:-1], partial_uncompressed_shapes):
-                if b >= z:
-                    (a, b) = divmod(b, z)
-                    u_indices[i] = a
-            # --- End: for
-            u_indices[compressed_axes[-1]] = b
-
-            compressed = compressed_array[tuple(sample_indices)]
-            sample_indices[compressed_dimension] = 0
-            compressed = compressed[tuple(sample_indices)]
-
-            uarray[tuple(u_indices)] = compressed
-
-        return self.get_subspace(uarray, indices, copy=True)
+        return numpy.unravel_index(list_array, compressed_shape)
 
     def get_list(self, default=ValueError()):
         '''Return the list variable for a compressed array.
@@ -1,6 +1,11 @@
 import numpy
 
 
+# The number of elements of an array that are masked at a time by
+# `ArrayMixin._apply_masking`
+_masking_buffer_size = 65536
+
+
 class ArrayMixin:
     '''Mixin class for a container of an array.
 
@@ -32,6 +37,40 @@ class ArrayMixin:
         else:
             return array.astype(dtype[0], copy=False)
 
+    def _read_only(self, array):
+        '''Return a read-only view of a numpy array.
+
+    The data and, for a masked array, the mask of the returned view
+    may not be modified in-place. The input array is not changed.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        array: `numpy.ndarray`
+            The numpy array.
+
+    :Returns:
+
+        `numpy.ndarray`
+            A read-only view of the numpy array.
+
+    **Examples:**
+
+    >>> v = a._read_only(numpy.arange(3))
+    >>> v.flags.writeable
+    False
+
+        '''
+        array = array.view()
+        array.flags.writeable = False
+
+        mask = numpy.ma.getmask(array)
+        if mask is not numpy.ma.nomask:
+            mask.flags.writeable = False
+
+        return array
+
     def __getitem__(self, indices):
         '''Return a subspace as an independent numpy array.
 
@@ -59,6 +98,33 @@ class ArrayMixin:
             "must implement '__getitem__'"
         )  # pragma: no cover
 
+    def view_array(self):
+        '''Return a read-only numpy array containing the data.
+
+    Unlike `array`, the returned array is not necessarily independent
+    of the data, and so it may not be modified in-place. This avoids
+    copying the data when it is only needed for reading.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `array`
+
+    :Returns:
+
+        `numpy.ndarray`
+            A read-only numpy array of the data.
+
+    **Examples:**
+
+    >>> n = a.view_array()
+    >>> isinstance(n, numpy.ndarray)
+    True
+    >>> n.flags.writeable
+    False
+
+        '''
+        return self._read_only(self.array)
+
     def __repr__(self):
         '''Called by the `repr` built-in function.
 
@@ -87,6 +153,161 @@ class ArrayMixin:
         '''
         return 0
 
+    @staticmethod
+    def _apply_masking(array, fill_values=(), valid_min=None,
+                       valid_max=None):
+        '''Mask the elements of a numpy array that are invalid.
+
+    Elements that are already masked remain so.
+
+    All of the masking criteria are evaluated together in a single
+    pass through the array, one buffer-sized block at a time, and the
+    results are combined in place into a single new mask. The data of
+    the array are not copied, so the returned masked array shares
+    them with the input array.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        array: `numpy.ndarray`
+            The array to be masked. It is not changed.
+
+        fill_values: sequence of scalars, optional
+            Elements exactly equal to any of these values are masked.
+
+        valid_min: number, optional
+            Elements strictly less than this value are masked.
+
+        valid_max: number, optional
+            Elements strictly greater than this value are masked.
+
+    :Returns:
+
+        `numpy.ndarray`
+            The masked array, or the input array if no masking
+            criteria were given.
+
+    **Examples:**
+
+    >>> print(a._apply_masking(numpy.arange(6), fill_values=[0],
+    ...                        valid_max=4))
+    [-- 1 2 3 4 --]
+
+        '''
+        if not fill_values and valid_min is None and valid_max is None:
+            return array
+
+        mask = numpy.zeros(array.shape, dtype=bool)
+        if numpy.ma.isMA(array):
+            fill_value = array.fill_value
+            mask[...] = numpy.ma.getmaskarray(array)
+            array = array.data
+        else:
+            fill_value = None
+
+        iterator = numpy.nditer(
+            [array, mask],
+            flags=['external_loop', 'buffered', 'refs_ok', 'zerosize_ok'],
+            op_flags=[['readonly'], ['readwrite']],
+            buffersize=_masking_buffer_size)
+
+        with iterator:
+            for x, m in iterator:
+                for value in fill_values:
+                    m |= (x == value)
+
+                if valid_min is not None:
+                    m |= (x < valid_min)
+
+                if valid_max is not None:
+                    m |= (x > valid_max)
+            # --- End: for
+
+        return numpy.ma.masked_array(array, mask=mask, copy=False,
+                                     fill_value=fill_value)
+
+    @staticmethod
+    def _as_index(positions):
+        '''Return positions as a slice, if possible.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        positions: `numpy.ndarray`
+            Non-negative integer positions along a dimension.
+
+    :Returns:
+
+        `slice` or `numpy.ndarray`
+            The positions as a slice if they are empty or evenly and
+            positively spaced, otherwise the unchanged positions.
+
+    **Examples:**
+
+    >>> a._as_index(numpy.array([2, 4, 6]))
+    slice(2, 7, 2)
+    >>> a._as_index(numpy.array([2, 4, 5]))
+    array([2, 4, 5])
+
+        '''
+        if not positions.size:
+            return slice(0, 0)
+
+        if positions.size == 1:
+            start = int(positions[0])
+            return slice(start, start + 1)
+
+        step = int(positions[1] - positions[0])
+        if step > 0 and (numpy.diff(positions) == step).all():
+            return slice(int(positions[0]), int(positions[-1]) + 1, step)
+
+        return positions
+
+    @staticmethod
+    def _index_positions(index, size):
+        '''Return the positions selected by an index of one dimension.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        index: `slice` or sequence of `int` or `bool`
+            The index of the dimension.
+
+        size: `int`
+            The size of the dimension.
+
+    :Returns:
+
+        `numpy.ndarray`
+            The non-negative integer positions selected by the index,
+            in the order in which they are selected.
+
+    **Examples:**
+
+    >>> a._index_positions(slice(1, 7, 2), 10)
+    array([1, 3, 5])
+    >>> a._index_positions([0, -1], 10)
+    array([0, 9])
+    >>> a._index_positions([True, False, True], 3)
+    array([0, 2])
+
+        '''
+        if isinstance(index, slice):
+            return numpy.arange(*index.indices(size))
+
+        positions = numpy.asanyarray(index)
+        if positions.dtype.kind == 'b':
+            # Boolean index
+            return numpy.flatnonzero(positions)
+
+        positions = numpy.array(positions, dtype=int, ndmin=1)
+        positions = numpy.where(positions < 0, positions + size,
+                                positions)
+        return positions
+
     def get_compression_type(self):
         '''The type of compression that has been applied to the underlying
     array.
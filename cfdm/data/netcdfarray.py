@@ -1,4 +1,7 @@
 
+from collections import OrderedDict
+from itertools import product
+
 import numpy
 import netCDF4
 
@@ -6,6 +9,20 @@ from . import abstract
 
 from .numpyarray import NumpyArray
 
+from ..functions import (_file_signature,
+                         _open_netcdf_file,
+                         abspath,
+                         block_cache_size)
+
+
+# --------------------------------------------------------------------
+# Blocks of data read from netCDF variables, each corresponding to an
+# HDF5 chunk of its variable, shared by all `NetCDFArray`
+# instances. The blocks are kept in order of least recent use.
+# --------------------------------------------------------------------
+_block_cache = OrderedDict()
+_block_cache_nbytes = {'nbytes': 0}
+
 
 class NetCDFArray(abstract.Array):
     '''An underlying array stored in a netCDF file.
@@ -146,19 +163,21 @@ class NetCDFArray(abstract.Array):
         if ncvar is not None:
             # Get the variable by netCDF name
             variable = netcdf.variables[ncvar]
-            variable.set_auto_mask(mask)
-            array = variable[indices]
         else:
             # Get the variable by netCDF ID
             varid = self.get_varid()
 
             for variable in netcdf.variables.values():
                 if variable._varid == varid:
-                    variable.set_auto_mask(mask)
-                    array = variable[indices]
                     break
         # --- End: if
 
+        variable.set_auto_mask(mask)
+
+        array = self._get_blocks(variable, indices)
+        if array is None:
+            array = variable[indices]
+
         if self._get_component('close'):
             # Close the netCDF file
             self.close()
@@ -208,6 +227,213 @@ class NetCDFArray(abstract.Array):
 
         return array
 
+    def _get_blocks(self, variable, indices):
+        '''Read a subspace of the variable via the block cache.
+
+    The subspace is assembled from blocks that each correspond to an
+    HDF5 chunk of the variable. Blocks are taken from the block cache
+    if possible, otherwise they are read from the file and added to
+    the cache.
+
+    The block cache is not used if it has zero size (see
+    `{{package}}.block_cache_size`); if the variable is not chunked
+    or does not have a numeric data type; or if the blocks spanned by
+    the subspace would not fit in the cache.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        variable: `netCDF4.Variable`
+            The variable containing the array.
+
+        indices:
+            The indices that define the subspace.
+
+    :Returns:
+
+        `numpy.ndarray` or `None`
+            The subspace, or `None` if the block cache was not used.
+
+        '''
+        max_nbytes = block_cache_size()
+        if not max_nbytes:
+            if _block_cache:
+                _block_cache.clear()
+                _block_cache_nbytes['nbytes'] = 0
+
+            return None
+
+        dtype = variable.dtype
+        if not (isinstance(dtype, numpy.dtype) and dtype.kind in 'biuf'):
+            return None
+
+        chunks = variable.chunking()
+        if not isinstance(chunks, list):
+            # Variable is stored contiguously, or the file format
+            # does not support chunking
+            return None
+
+        shape = variable.shape
+        ndim = len(shape)
+
+        if indices is Ellipsis:
+            indices = [slice(None)] * ndim
+        else:
+            indices = list(indices)
+            if len(indices) > ndim or not all(
+                    [isinstance(index, slice) or numpy.ndim(index) == 1
+                     for index in indices]):
+                return None
+
+            indices.extend([slice(None)] * (ndim - len(indices)))
+
+        positions = [self._index_positions(index, size)
+                     for index, size in zip(indices, shape)]
+        if not all([p.size for p in positions]):
+            return None
+
+        # Find the chunks spanned by the subspace along each
+        # dimension
+        chunk_ids = [numpy.unique(p // c) for p, c in zip(positions, chunks)]
+        chunk_sizes = [numpy.minimum(c, size - ids * c)
+                       for ids, c, size in zip(chunk_ids, chunks, shape)]
+
+        nbytes = (int(numpy.prod([n.sum() for n in chunk_sizes],
+                                 dtype=float))
+                  * dtype.itemsize)
+        if nbytes > max_nbytes:
+            return None
+
+        filename = abspath(self.get_filename())
+        key = (filename, _file_signature(filename), self.get_group(),
+               self.get_ncvar(), self.get_varid(), self.get_mask())
+
+        # For each dimension and each of its chunks, find the
+        # positions of the chunk's elements in the subspace, and
+        # their positions within the chunk
+        out_positions = []
+        chunk_positions = []
+        for p, c, ids in zip(positions, chunks, chunk_ids):
+            chunk_p = p // c
+            out_p = []
+            in_p = []
+            for i in ids:
+                out_i = numpy.nonzero(chunk_p == i)[0]
+                out_p.append(self._as_index(out_i))
+                in_p.append(self._as_index(p[out_i] - i * c))
+
+            out_positions.append(out_p)
+            chunk_positions.append(in_p)
+        # --- End: for
+
+        # Assemble the subspace from the blocks
+        array = None
+        for block_index in product(*[range(ids.size) for ids in chunk_ids]):
+            chunk = tuple([int(ids[i])
+                           for ids, i in zip(chunk_ids, block_index)])
+            block_key = key + (chunk,)
+
+            cached = _block_cache.get(block_key)
+            if cached is None:
+                block = variable[tuple([slice(i * c, (i + 1) * c)
+                                        for i, c in zip(chunk, chunks)])]
+                self._cache_block(block_key, block, max_nbytes)
+            else:
+                block = cached[0]
+                _block_cache.move_to_end(block_key)
+
+            if array is None:
+                out_shape = tuple([p.size for p in positions])
+                if numpy.ma.isMA(block):
+                    array = numpy.ma.empty(out_shape, dtype=block.dtype)
+                    array.mask = False
+                else:
+                    array = numpy.empty(out_shape, dtype=block.dtype)
+            elif numpy.ma.isMA(block) and not numpy.ma.isMA(array):
+                array = numpy.ma.array(array, mask=False)
+
+            out_index = [p[i] for p, i in zip(out_positions, block_index)]
+            in_index = [p[i] for p, i in zip(chunk_positions, block_index)]
+            if all([isinstance(i, slice) for i in out_index + in_index]):
+                array[tuple(out_index)] = block[tuple(in_index)]
+            else:
+                array[numpy.ix_(*[self._as_positions(i, n)
+                                  for i, n in zip(out_index,
+                                                  array.shape)])] = \
+                    block[numpy.ix_(*[self._as_positions(i, n)
+                                      for i, n in zip(in_index,
+                                                      block.shape)])]
+        # --- End: for
+
+        return array
+
+    @classmethod
+    def _as_positions(cls, index, size):
+        '''Return an index as positions.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        index: `slice` or `numpy.ndarray`
+            The index of a dimension.
+
+        size: `int`
+            The size of the dimension.
+
+    :Returns:
+
+        `numpy.ndarray`
+            The positions selected by the index.
+
+        '''
+        if isinstance(index, slice):
+            return cls._index_positions(index, size)
+
+        return index
+
+    @staticmethod
+    def _cache_block(key, block, max_nbytes):
+        '''Add a block to the block cache.
+
+    The least recently used blocks are removed from the cache if its
+    size would otherwise exceed the maximum.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        key: `tuple`
+            The key of the block, which identifies the file, variable
+            and chunk.
+
+        block: `numpy.ndarray`
+            The data of the block.
+
+        max_nbytes: `int`
+            The maximum size of the block cache, in bytes.
+
+    :Returns:
+
+        `None`
+
+        '''
+        nbytes = block.nbytes
+        if numpy.ma.isMA(block):
+            # Allow for a Boolean mask
+            nbytes += block.size
+
+        if nbytes > max_nbytes:
+            return
+
+        _block_cache[key] = (block, nbytes)
+        _block_cache_nbytes['nbytes'] += nbytes
+
+        while _block_cache_nbytes['nbytes'] > max_nbytes:
+            _, (_, nbytes) = _block_cache.popitem(last=False)
+            _block_cache_nbytes['nbytes'] -= nbytes
+
     def __repr__(self):
         '''x.__repr__() <==> repr(x)
 
@@ -424,6 +650,9 @@ class NetCDFArray(abstract.Array):
     def close(self):
         '''Close the `netCDF4.Dataset` for the file containing the data.
 
+    A dataset that is shared with other arrays is not closed (see
+    `{{package}}.close_files`).
+
     .. versionadded:: (cfdm) 1.7.0
 
     :Returns:
@@ -465,6 +694,11 @@ class NetCDFArray(abstract.Array):
     def open(self):
         '''Return an open `netCDF4.Dataset` for the file containing the array.
 
+    The dataset is shared with other arrays that are stored in the
+    same file, and is kept open after the data have been read,
+    unless the maximum number of open files is zero (see
+    `{{package}}.max_open_files`).
+
     .. versionadded:: (cfdm) 1.7.0
 
     :Returns:
@@ -479,13 +713,12 @@ class NetCDFArray(abstract.Array):
     'eastward_wind'
 
         '''
-        if self._get_component('netcdf') is None:
-            try:
-                netcdf = netCDF4.Dataset(self.get_filename(), 'r')
-            except RuntimeError as error:
-                raise RuntimeError("{}: {}".format(error, filename))
-
-            self._set_component('netcdf', netcdf, copy=False)
+        netcdf = self._get_component('netcdf')
+        if netcdf is None:
+            netcdf, shared = _open_netcdf_file(self.get_filename())
+            if not shared:
+                self._set_component('netcdf', netcdf, copy=False)
+        # --- End: if
 
         return netcdf
 
@@ -34,6 +34,32 @@ class NumpyArray(mixin.ArrayMixin, core.NumpyArray):
         return self.get_subspace(self._get_component('array'), indices,
                                  copy=True)
 
+    def view_array(self):
+        '''Return a read-only numpy array containing the data.
+
+    The returned array is a view of the data that is not copied, and
+    so it may not be modified in-place.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `array`
+
+    :Returns:
+
+        `numpy.ndarray`
+            A read-only view of the data.
+
+    **Examples:**
+
+    >>> n = a.view_array()
+    >>> isinstance(n, numpy.ndarray)
+    True
+    >>> n.flags.writeable
+    False
+
+        '''
+        return self._read_only(self._get_component('array'))
+
     def to_memory(self):
         '''Bring an array on disk into memory and retain it there.
 
@@ -51,59 +51,68 @@ class RaggedContiguousArray(mixin.RaggedContiguous,
                          compression_type='ragged contiguous',
                          compressed_dimension=0)
 
-    def __getitem__(self, indices):
-        '''x.__getitem__(indices) <==> x[indices]
+    def _sample_positions(self, axis_positions):
+        '''Return the positions of uncompressed elements in the sample
+    dimension.
 
-    Returns an subspace of the uncompressed data an independent numpy
-    array.
+    The uncompressed array has dimensions (instance dimension, element
+    dimension). The position in the sample dimension of each element
+    is found from the cumulative sum of the counts.
 
-    The indices that define the subspace are relative to the
-    uncompressed data and must be either `Ellipsis` or a sequence that
-    contains an index for each dimension. In the latter case, each
-    dimension's index must either be a `slice` object or a sequence of
-    two or more integers.
+    .. versionadded:: (cfdm) 1.8.8.0
 
-    Indexing is similar to numpy indexing. The only difference to
-    numpy indexing (given the restrictions on the type of indices
-    allowed) is:
+    :Parameters:
 
-    * When two or more dimension's indices are sequences of integers
-      then these indices work independently along each dimension
-      (similar to the way vector subscripts work in Fortran).
+        axis_positions: `list` of `numpy.ndarray`
+            The positions of the required elements along the instance
+            and element dimensions respectively.
 
-    .. versionadded:: (cfdm) 1.7.0
+    :Returns:
+
+        `numpy.ndarray`
+            The positions in the sample dimension of each combination
+            of the given instances and elements, with -1 for
+            combinations which are missing.
 
         '''
-        # ------------------------------------------------------------
-        # Method: Uncompress the entire array and then subspace it
-        # ------------------------------------------------------------
+        instances, elements = axis_positions
+
+        count_array = numpy.array(self.get_count().data.array,
+                                  dtype=int)
+        starts = numpy.cumsum(count_array) - count_array
 
-        compressed_array = self._get_compressed_Array()
+        positions = starts[instances].reshape(-1, 1) + elements
+        valid = elements < count_array[instances].reshape(-1, 1)
 
-        # Initialise the un-sliced uncompressed array
-        uarray = numpy.ma.masked_all(self.shape, dtype=self.dtype)
+        return numpy.where(valid, positions, -1)
 
-        # --------------------------------------------------------
-        # Compression by contiguous ragged array
-        #
-        # The uncompressed array has dimensions (instance
-        # dimension, element dimension).
-        # --------------------------------------------------------
+    def _uncompressed_indices(self):
+        '''Return the uncompressed indices of every sample.
 
-        count_array = self.get_count().data.array
+    The instance and element positions of every sample are found from
+    the cumulative sum of the counts.
 
-        start = 0
-        for i, n in enumerate(count_array):
-            n = int(n)
-            sample_indices = slice(start, start + n)
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Returns:
+
+        `tuple` of `numpy.ndarray`
+            The instance and element dimension positions of each
+            sample, in sample dimension order.
+
+        '''
+        count_array = numpy.array(self.get_count().data.array,
+                                  dtype=int)
 
-            u_indices = (i,
-                         slice(0, sample_indices.stop - sample_indices.start))
+        n_samples = int(count_array.sum())
+        starts = numpy.cumsum(count_array) - count_array
 
-            uarray[u_indices] = compressed_array[(sample_indices,)]
-            start += n
+        instances = numpy.repeat(numpy.arange(count_array.size),
+                                 count_array)
+        elements = (numpy.arange(n_samples)
+                    - numpy.repeat(starts, count_array))
 
-        return self.get_subspace(uarray, indices, copy=True)
+        return (instances, elements)
 
     def to_memory(self):
         '''Bring an array on disk into memory and retain it there.
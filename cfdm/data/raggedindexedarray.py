@@ -49,55 +49,27 @@ class RaggedIndexedArray(mixin.RaggedIndexed,
                          compressed_dimension=0,
                          compression_type='ragged indexed')
 
-    def __getitem__(self, indices):
-        '''x.__getitem__(indices) <==> x[indices]
+    def _uncompressed_indices(self):
+        '''Return the uncompressed indices of every sample.
 
-    Returns an subspace of the uncompressed data an independent numpy
-    array.
+    The instance of each sample is given by the index variable, and
+    its element position is found by grouping the samples by
+    instance, rather than by searching for the samples of each
+    instance in turn.
 
-    The indices that define the subspace are relative to the
-    uncompressed data and must be either `Ellipsis` or a sequence that
-    contains an index for each dimension. In the latter case, each
-    dimension's index must either be a `slice` object or a sequence of
-    two or more integers.
+    .. versionadded:: (cfdm) 1.8.8.0
 
-    Indexing is similar to numpy indexing. The only difference to
-    numpy indexing (given the restrictions on the type of indices
-    allowed) is:
-
-      * When two or more dimension's indices are sequences of integers
-        then these indices work independently along each dimension
-        (similar to the way vector subscripts work in Fortran).
+    :Returns:
 
-    .. versionadded:: (cfdm) 1.7.0
+        `tuple` of `numpy.ndarray`
+            The instance and element dimension positions of each
+            sample, in sample dimension order.
 
         '''
-        # ------------------------------------------------------------
-        # Method: Uncompress the entire array and then subspace it
-        # ------------------------------------------------------------
-
-        compressed_array = self._get_compressed_Array()
-
-        # Initialise the un-sliced uncompressed array
-        uarray = numpy.ma.masked_all(self.shape, dtype=self.dtype)
-
-        # --------------------------------------------------------
-        # Compression by indexed ragged array.
-        #
-        # The uncompressed array has dimensions (instance
-        # dimension, element dimension).
-        # --------------------------------------------------------
-        index_array = self.get_index().data.array
-
-        for i in range(uarray.shape[0]):
-            sample_dimension_indices = numpy.where(index_array == i)[0]
-
-            u_indices = (i,  # slice(i, i+1),
-                         slice(0, len(sample_dimension_indices)))
-
-            uarray[u_indices] = compressed_array[(sample_dimension_indices,)]
+        index_array = numpy.array(self.get_index().data.array,
+                                  dtype=int)
 
-        return self.get_subspace(uarray, indices, copy=True)
+        return (index_array, self._element_positions(index_array))
 
     def to_memory(self):
         '''Bring an array on disk into memory and retain it there.
@@ -58,80 +58,41 @@ class RaggedIndexedContiguousArray(mixin.RaggedContiguous,
                          compression_type='ragged indexed contiguous',
                          compressed_dimension=0)
 
-    def __getitem__(self, indices):
-        '''x.__getitem__(indices) <==> x[indices]
+    def _uncompressed_indices(self):
+        '''Return the uncompressed indices of every sample.
 
-    Returns an subspace of the uncompressed data an independent numpy
-    array.
+    The instance of each profile is given by the index variable, and
+    its profile position is found by grouping the profiles by
+    instance. The element position of each sample is found from the
+    cumulative sum of the counts.
 
-    The indices that define the subspace are relative to the
-    uncompressed data and must be either `Ellipsis` or a sequence that
-    contains an index for each dimension. In the latter case, each
-    dimension's index must either be a `slice` object or a sequence of
-    two or more integers.
+    .. versionadded:: (cfdm) 1.8.8.0
 
-    Indexing is similar to numpy indexing. The only difference to
-    numpy indexing (given the restrictions on the type of indices
-    allowed) is:
-
-      * When two or more dimension's indices are sequences of integers
-        then these indices work independently along each dimension
-        (similar to the way vector subscripts work in Fortran).
+    :Returns:
 
-    .. versionadded:: (cfdm) 1.7.0
+        `tuple` of `numpy.ndarray`
+            The instance, profile and element dimension positions of
+            each sample, in sample dimension order.
 
         '''
-        # ------------------------------------------------------------
-        # Method: Uncompress the entire array and then subspace it
-        # ------------------------------------------------------------
-
-        compressed_array = self._get_compressed_Array()
-
-        # Initialise the un-sliced uncompressed array
-        uarray = numpy.ma.masked_all(self.shape, dtype=self.dtype)
-
-        count_array = self.get_count().data.array
-        index_array = self.get_index().data.array
-
-        # Loop over instances
-        for i in range(uarray.shape[0]):
-
-            # For all of the profiles in ths instance, find the
-            # locations in the count array of the number of elements
-            # in the profile
-            xprofile_indices = numpy.where(index_array == i)[0]
-
-            # Find the number of profiles in this instance
-            n_profiles = xprofile_indices.size
-
-            # Loop over profiles in this instance
-            for j in range(uarray.shape[1]):
-                if j >= n_profiles:
-                    continue
-
-                # Find the location in the count array of the number
-                # of elements in this profile
-                profile_index = xprofile_indices[j]
-
-                if profile_index == 0:
-                    start = 0
-                else:
-                    start = int(count_array[:profile_index].sum())
-
-                stop = start + int(count_array[profile_index])
+        count_array = numpy.array(self.get_count().data.array,
+                                  dtype=int)
+        index_array = numpy.array(self.get_index().data.array,
+                                  dtype=int)
 
-                sample_indices = slice(start, stop)
+        n_samples = int(count_array.sum())
+        starts = numpy.cumsum(count_array) - count_array
 
-                u_indices = (i,  # slice(i, i+1),
-                             j,  # slice(j, j+1),
-                             slice(0, stop-start))
-                # slice(0, sample_indices.stop - sample_indices.start))
+        # The profile of each sample
+        sample_profiles = numpy.repeat(numpy.arange(count_array.size),
+                                       count_array)
 
-                uarray[u_indices] = compressed_array[(sample_indices,)]
-            # --- End: for
-        # --- End: for
+        instances = index_array[sample_profiles]
+        profiles = self._element_positions(index_array)[sample_profiles]
+        elements = (numpy.arange(n_samples)
+                    - numpy.repeat(starts, count_array))
 
-        return self.get_subspace(uarray, indices, copy=True)
+        return (instances, profiles, elements)
 
     def to_memory(self):
         '''Bring an array on disk into memory and retain it there.
@@ -1,5 +1,7 @@
 import logging
 
+import numpy
+
 from . import mixin
 from . import core
 from . import Constructs
@@ -8,8 +10,6 @@ from . import Count
 from . import Index
 from . import List
 
-from .constants import masked as cfdm_masked
-
 from .data import (
     RaggedContiguousArray,
     RaggedIndexedArray,
@@ -302,12 +302,12 @@ class Field(mixin.NetCDFVariable,
         indices = data._parse_indices(indices)
         indices = tuple(indices)
 
-        new = self.copy()  # data=False)
-
         data_axes = self.get_data_axes()
 
-        # Open any files that contained the original data (this not
-        # necessary, is an optimisation)
+        # Copy the field without any data. The data of the metadata
+        # constructs that span the subspaced axes are replaced by
+        # subspaces, so there is no need to copy them first.
+        new = self.copy(data=False)
 
         # ------------------------------------------------------------
         # Subspace the field's data
@@ -325,25 +325,20 @@ class Field(mixin.NetCDFVariable,
         # Subspace other constructs that contain arrays
         # ------------------------------------------------------------
         self_constructs = self.constructs
-        new_constructs_data_axes = new.constructs.data_axes()
-
-        if data_axes:
-            for key, construct in new.constructs.filter_by_axis(
-                    'or', *data_axes).items():
-                needs_slicing = False
-                dice = []
-                for axis in new_constructs_data_axes[key]:
-                    if axis in data_axes:
-                        needs_slicing = True
-                        dice.append(indices[data_axes.index(axis)])
-                    else:
-                        dice.append(slice(None))
-                # --- End: for
-
-                if needs_slicing:
-                    new.set_construct(construct[tuple(dice)],
-                                      key=key, copy=False)
-        # --- End: if
+        sliced = set()
+        for key, positions in self._slicing_plan(data_axes):
+            dice = [slice(None) if i is None else indices[i]
+                    for i in positions]
+            new.set_construct(self_constructs[key][tuple(dice)],
+                              key=key, copy=False)
+            sliced.add(key)
+
+        # Copy the metadata constructs that have not been subspaced,
+        # with their data
+        for key in new.constructs.data_axes():
+            if key not in sliced:
+                new.set_construct(self_constructs[key], key=key)
+        # --- End: for
 
         new.set_data(new_data, copy=False)
 
@@ -352,6 +347,52 @@ class Field(mixin.NetCDFVariable,
     # ----------------------------------------------------------------
     # Private methods
     # ----------------------------------------------------------------
+    def _slicing_plan(self, data_axes):
+        '''Return the plan for subspacing the metadata constructs.
+
+    The plan records, for each metadata construct that spans at least
+    one of the data axes, the position in the data axes of each of
+    the construct's axes. It is found with a single pass through the
+    axes of the metadata constructs.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `__getitem__`
+
+    :Parameters:
+
+        data_axes: sequence of `str`
+            The domain axis constructs spanned by the field's data.
+
+    :Returns:
+
+        `tuple`
+            The plan, as a pair of construct key and position tuple
+            for each metadata construct to be subspaced. A position
+            of `None` indicates an axis that is not spanned by the
+            field's data.
+
+    **Examples:**
+
+    >>> f.get_data_axes()
+    ('domainaxis0', 'domainaxis1', 'domainaxis2')
+    >>> f._slicing_plan(f.get_data_axes())
+    (('dimensioncoordinate0', (0,)),
+     ('auxiliarycoordinate0', (1, 2)),
+     ('cellmeasure0', (2, 1)))
+
+        '''
+        data_positions = {axis: i for i, axis in enumerate(data_axes)}
+
+        plan = []
+        for key, axes in self.constructs.data_axes().items():
+            positions = tuple([data_positions.get(axis) for axis in axes])
+            if positions.count(None) < len(positions):
+                plan.append((key, positions))
+        # --- End: for
+
+        return tuple(plan)
+
     def _get_data_compression_variables(self, component):
         '''
 
@@ -807,10 +848,20 @@ class Field(mixin.NetCDFVariable,
 
             * ``'gathered'``
 
-              Compression by gathering over any subset of the field
-              construct data dimensions.
+              Compression by gathering over any subset of adjacent
+              field construct data dimensions, given by the *axes*
+              parameter. Elements of the gathered dimensions for which
+              all of the data values are missing are removed to create
+              the compressed data.
+
+        axes: (sequence of) `str`, optional
+            The identifiers of the domain axis constructs of the
+            dimensions to be compressed by gathering. Required, and
+            only used, for compression by gathering. The dimensions
+            must be adjacent in the field construct data.
 
-              *Not yet available.*
+            *Parameter example:*
+              ``axes=['domainaxis1', 'domainaxis2']``
 
         count_properties: `dict`, optional
             Provide properties to the count variable for contiguous
@@ -875,10 +926,78 @@ class Field(mixin.NetCDFVariable,
     >>> {{package}}.write(g, 'compressed_file_indexed.nc')
 
         '''
-        def _empty_compressed_data(data, shape):
-            return data.empty(shape=shape, dtype=data.dtype,
+        def _compress_data(data, position, n_axes, indices, array=None):
+            '''Compress data by selecting elements of combined axes.
+
+        :Parameters:
+
+            data: `Data`
+
+            position: `int`
+                The position of the first of the axes to be combined.
+
+            n_axes: `int`
+                The number of adjacent axes to be combined.
+
+            indices: `numpy.ndarray`
+                The positions along the combined axis of the elements
+                to be kept.
+
+            array: `numpy.ndarray`, optional
+                The uncompressed array of *data*, if it has already
+                been created.
+
+        :Returns:
+
+            `Data`
+
+            '''
+            if array is None:
+                array = data.array
+
+            shape = array.shape
+            size = int(numpy.prod(shape[position:position + n_axes],
+                                  dtype=int))
+            array = array.reshape(
+                shape[:position] + (size,) + shape[position + n_axes:])
+
+            return type(data)(array.take(indices, axis=position),
                               units=data.get_units(None),
-                              calendar=data.get_calendar(None))
+                              calendar=data.get_calendar(None),
+                              copy=False)
+        # --- End: def
+
+        def _only_missing_removed(array, position, n_axes, indices):
+            '''Whether compression would only remove missing values.
+
+        :Parameters:
+
+            array: `numpy.ndarray`
+                The uncompressed array.
+
+            position: `int`
+                The position of the first of the axes to be combined.
+
+            n_axes: `int`
+                The number of adjacent axes to be combined.
+
+            indices: `numpy.ndarray`
+                The positions along the combined axis of the elements
+                to be kept.
+
+        :Returns:
+
+            `bool`
+
+            '''
+            shape = array.shape
+            mask = numpy.ma.getmaskarray(array).reshape(
+                shape[:position] + (-1,) + shape[position + n_axes:])
+
+            removed = numpy.ones(mask.shape[position], dtype=bool)
+            removed[indices] = False
+
+            return bool(mask.compress(removed, axis=position).all())
         # --- End: def
 
         def _RaggedContiguousArray(self, compressed_data, data,
@@ -911,7 +1030,18 @@ class Field(mixin.NetCDFVariable,
                 index_variable=index_variable)
         # --- End: def
 
-        def _compress_metadata(f, method, count, N, axes, Array_func,
+        def _GatheredArray(self, compressed_data, data, list_variable,
+                           compressed_dimension):
+            return self._GatheredArray(
+                compressed_data,
+                shape=data.shape,
+                size=data.size,
+                ndim=data.ndim,
+                compressed_dimension=compressed_dimension,
+                list_variable=list_variable)
+        # --- End: def
+
+        def _compress_metadata(f, method, axes, indices, Array_func,
                                **kwargs):
             '''Compress metadata constructs for a field by a chosen method.
 
@@ -919,12 +1049,18 @@ class Field(mixin.NetCDFVariable,
 
             f: `Field`
 
-            count: sequence of `int`
-
-            N: `int`
-                The number of elements in the compressed array.
+            method: `str`
 
             axes: sequence of `str`
+                The axes to be compressed. For DSG compression, only
+                metadata constructs which span exactly these axes, in
+                the same order, are compressed. For compression by
+                gathering, metadata constructs which span these axes
+                adjacently, in the same order, are compressed.
+
+            indices: `numpy.ndarray`
+                The positions along the combined compressed axes of
+                the elements to be kept.
 
             Array_func:
 
@@ -935,89 +1071,50 @@ class Field(mixin.NetCDFVariable,
             `None`
 
             '''
-            if method == 'indexed_contiguous':
-                shape1 = f.data.shape[1]
+            axes = tuple(axes)
+            n_axes = len(axes)
 
             for key, c in f.constructs.filter_by_axis('or').items():
-                c_axes = f.get_data_axes(key)
-                if c_axes != axes:
+                c_axes = tuple(f.get_data_axes(key))
+                if method == 'gathered':
+                    if axes[0] not in c_axes:
+                        continue
+
+                    position = c_axes.index(axes[0])
+                    if c_axes[position:position + n_axes] != axes:
+                        # Skip metadata constructs which don't span
+                        # the compressed axes adjacently in the same
+                        # order
+                        continue
+
+                    kwargs['compressed_dimension'] = position
+                elif c_axes != axes:
                     # Skip metadata constructs which don't span
                     # exactly the same axes in the same order
                     continue
+                else:
+                    position = 0
+
+                arrays = [(data, data.array)
+                          for data in (c.get_data(None),
+                                       c.get_bounds_data(None))
+                          if data is not None]
+
+                if method == 'gathered' and not all(
+                        [_only_missing_removed(array, position, n_axes,
+                                               indices)
+                         for _, array in arrays]):
+                    # Skip metadata constructs which would lose
+                    # non-missing values by being gathered
+                    continue
 
-                # Initialize the compressed data for the metadata
-                # construct
-                data = c.get_data(None)
-                if data is not None:
-                    compressed_data = _empty_compressed_data(data, (N,))
-
-                    # Populate the compressed data for the metadata
-                    # construct
-                    start = 0
-                    if method == 'indexed_contiguous' and c.data.ndim == 2:
-                        c_start = 0
-                        for i, d in enumerate(
-                                data.flatten(range(data.ndim-1))):
-                            c_start = shape1 * i
-                            c_end = c_start + shape1
-                            last = sum(n > 0 for n in count[c_start:c_end])
-
-                            end = start + last
-                            compressed_data[start:end] = d[:last]
-                            start += last
-                    else:
-                        for last, d in zip(count,
-                                           data.flatten(range(data.ndim-1))):
-                            if not last:
-                                continue
-
-                            end = start + last
-                            compressed_data[start:end] = d[:last]
-                            start += last
-                # --- End: if
-
-                # Insert the compressed data into the metadata
-                # construct
-                y = Array_func(f, compressed_data, data=data,
-                               **kwargs)
-                data._set_CompressedArray(y, copy=False)
-
-                if c.has_bounds():
-                    data = c.get_bounds_data(None)
-                    if data is None:
-                        continue
+                # Compress the data of the metadata construct, and its
+                # bounds, with one selection each
+                for data, array in arrays:
+                    compressed_data = _compress_data(data, position,
+                                                     n_axes, indices,
+                                                     array=array)
 
-                    b_shape = data.shape[c.data.ndim:]
-                    compressed_data = _empty_compressed_data(
-                        data, (N,) + b_shape)
-
-                    # Populate the compressed data for the metadata
-                    # construct
-                    start = 0
-                    if method == 'indexed_contiguous' and c.data.ndim == 2:
-                        c_start = 0
-                        for i, d in enumerate(
-                                data.flatten(range(c.data.ndim-1))):
-                            c_start = shape1 * i
-                            c_end = c_start + shape1
-                            last = sum(n > 0 for n in count[c_start:c_end])
-
-                            end = start + last
-                            compressed_data[start:end] = d[:last]
-                            start += last
-                    else:
-                        for last, d in zip(
-                                count, data.flatten(range(c.data.ndim-1))):
-                            if not last:
-                                continue
-
-                            end = start + last
-                            compressed_data[start:end] = d[:last]
-                            start += last
-                    # --- End: if
-
-                    # Insert the compressed data into the metadata
-                    # construct
                     y = Array_func(f, compressed_data, data=data,
                                    **kwargs)
                     data._set_CompressedArray(y, copy=False)
@@ -1055,46 +1152,104 @@ class Field(mixin.NetCDFVariable,
                     "DSG ragged indexed contiguous compression. Got "
                     "{}".format(self.data.ndim)
                 )
+        elif method == 'gathered':
+            if not axes:
+                raise ValueError(
+                    "Must specify the axes to be compressed by gathering")
+
+            data_axes = f.get_data_axes()
+            if isinstance(axes, str):
+                axes = (axes,)
+
+            for axis in axes:
+                if axis not in data_axes:
+                    raise ValueError(
+                        "Can't compress by gathering an axis that is not "
+                        "spanned by the field data: {!r}".format(axis))
+            # --- End: for
+
+            positions = sorted([data_axes.index(axis) for axis in axes])
+            position = positions[0]
+            if positions != list(range(position,
+                                       position + len(positions))):
+                raise ValueError(
+                    "Can't compress by gathering axes that are not "
+                    "adjacent in the field data: {!r}".format(axes))
+
+            if (current_compression_type == 'gathered'
+                    and data.get_compressed_axes() == positions):
+                # The field is already compressed by the correct
+                # method
+                return f
+        else:
+            raise ValueError(
+                "Unknown compression method: {!r}".format(method))
         # --- End: if
 
-        # Make sure that the metadata constructs have the same
-        # relative axis order as the field's data
-        f.transpose(range(self.data.ndim), constructs=True, inplace=True)
+        if method != 'gathered':
+            # Make sure that the metadata constructs have the same
+            # relative axis order as the field's data. This is not
+            # required for compression by gathering, which only
+            # compresses metadata constructs that span the gathered
+            # axes in the same order as the field's data.
+            f.transpose(range(self.data.ndim), constructs=True,
+                        inplace=True)
+
+        # Read the uncompressed field data just once, for finding both
+        # the elements to be kept and their values
+        array = data.array
+        shape = array.shape
+        mask = numpy.ma.getmaskarray(array)
 
         if method == 'gathered':
             # --------------------------------------------------------
             # Compression by gathering
+            #
+            # Keep each element of the combined gathered axes for
+            # which any value is not missing.
             # --------------------------------------------------------
-            pass
+            n_axes = len(positions)
+            compressed_axes = f.get_data_axes()[
+                position:position + n_axes]
+
+            mask = mask.reshape(shape[:position] + (-1,)
+                                + shape[position + n_axes:])
+            other_axes = tuple([i for i in range(mask.ndim)
+                                if i != position])
+            indices = numpy.flatnonzero(~mask.all(axis=other_axes))
+
+            compressed_field_data = _compress_data(data, position,
+                                                   n_axes, indices,
+                                                   array=array)
+
+            list_variable = self._List(properties=list_properties,
+                                       data=self._Data(indices))
+
+            x = _GatheredArray(self, compressed_field_data, data,
+                               list_variable=list_variable,
+                               compressed_dimension=position)
+
+            _compress_metadata(f, method, compressed_axes, indices,
+                               _GatheredArray,
+                               list_variable=list_variable)
         else:
             # --------------------------------------------------------
             # DSG compression
+            #
+            # The count of each feature is the position after its
+            # last non-missing element, and the kept elements are
+            # those before that position.
             # --------------------------------------------------------
-            flattened_data = data.flatten(range(data.ndim-1))
+            n = shape[-1]
+            mask = mask.reshape(-1, n)
+            count = numpy.where(mask.all(axis=1), 0,
+                                n - numpy.argmin(mask[:, ::-1], axis=1))
 
-            count = []
-            for d in flattened_data:
-                last = d.size
-                for i in d[::-1]:
-                    if i is not cfdm_masked:
-                        break
-                    else:
-                        last -= 1
-                # --- End: for
+            indices = numpy.flatnonzero(
+                numpy.arange(n) < count[:, numpy.newaxis])
 
-                count.append(last)
-
-            N = sum(count)
-            compressed_field_data = _empty_compressed_data(data, (N,))
-
-            start = 0
-            for last, d in zip(count, flattened_data):
-                if not last:
-                    continue
-
-                end = start + last
-                compressed_field_data[start:end] = d[:last]
-                start += last
+            compressed_field_data = _compress_data(data, 0, data.ndim,
+                                                   indices, array=array)
         # --- End: if
 
         if method == 'contiguous':
@@ -1103,13 +1258,13 @@ class Field(mixin.NetCDFVariable,
             # --------------------------------------------------------
             count_variable = self._Count(
                 properties=count_properties,
-                data=self._Data([n for n in count if n]))
+                data=self._Data(count))
 
             x = _RaggedContiguousArray(self, compressed_field_data,
                                        data,
                                        count_variable=count_variable)
 
-            _compress_metadata(f, method, count, N, f.get_data_axes(),
+            _compress_metadata(f, method, f.get_data_axes(), indices,
                                _RaggedContiguousArray,
                                count_variable=count_variable)
 
@@ -1117,23 +1272,15 @@ class Field(mixin.NetCDFVariable,
             # --------------------------------------------------------
             # Ragged indexed
             # --------------------------------------------------------
-            index_variable = self._Index(properties=index_properties,
-                                         data=self._Data.empty(shape=(N,),
-                                                               dtype=int))
-
-            start = 0
-            for i, (last, d) in enumerate(zip(count, flattened_data)):
-                if not last:
-                    continue
-
-                end = start + last
-                index_variable.data[start:end] = i
-                start += last
+            index_variable = self._Index(
+                properties=index_properties,
+                data=self._Data(numpy.repeat(numpy.arange(count.size),
+                                             count)))
 
             x = _RaggedIndexedArray(self, compressed_field_data, data,
                                     index_variable)
 
-            _compress_metadata(f, method, count, N, f.get_data_axes(),
+            _compress_metadata(f, method, f.get_data_axes(), indices,
                                _RaggedIndexedArray,
                                index_variable=index_variable)
 
@@ -1141,16 +1288,13 @@ class Field(mixin.NetCDFVariable,
             # --------------------------------------------------------
             # Ragged indexed contiguous
             # --------------------------------------------------------
-            index = []
-            shape1 = f.data.shape[1]
-            for i in range(f.data.shape[0]):
-                start = shape1 * i
-                end = start + shape1
-                index.extend([i] * sum(n > 0 for n in count[start:end]))
+            count = count.reshape(shape[:2])
+            index = numpy.repeat(numpy.arange(shape[0]),
+                                 (count > 0).sum(axis=1))
 
             count_variable = self._Count(
                 properties=count_properties,
-                data=self._Data([n for n in count if n]))
+                data=self._Data(count[count > 0]))
             index_variable = self._Index(properties=index_properties,
                                          data=self._Data(index))
 
@@ -1159,28 +1303,18 @@ class Field(mixin.NetCDFVariable,
                                               data, count_variable,
                                               index_variable)
 
-            _compress_metadata(f, method, count, N, f.get_data_axes(),
+            _compress_metadata(f, method, f.get_data_axes(), indices,
                                _RaggedIndexedContiguousArray,
                                count_variable=count_variable,
                                index_variable=index_variable)
 
             # Compress metadata constructs that span the index axis,
             # but not the count axis.
-            _compress_metadata(f, method, count, len(index),
-                               f.get_data_axes()[:-1],
+            _compress_metadata(f, method, f.get_data_axes()[:-1],
+                               numpy.flatnonzero(count),
                                _RaggedIndexedArray,
                                index_variable=index_variable)
-
-        elif method == 'gathered':
-            # --------------------------------------------------------
-            # Gathered
-            # --------------------------------------------------------
-            raise ValueError(
-                "Compression by gathering is not yet available - sorry!")
-
-        else:
-            raise ValueError(
-                "Unknown compression method: {!r}".format(method))
+        # --- End: if
 
         f.data._set_CompressedArray(x, copy=False)
 
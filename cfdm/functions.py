@@ -4,6 +4,8 @@ import platform
 import sys
 import urllib.parse
 
+from collections import OrderedDict
+
 import netCDF4
 import cftime
 import numpy
@@ -16,7 +18,24 @@ from . import (__version__,
 from .constants import CONSTANTS, ValidLogLevels
 
 
-def configuration(atol=None, rtol=None, log_level=None):
+# --------------------------------------------------------------------
+# The netCDF datasets that are open for reading data, shared by all
+# `NetCDFArray` instances. Each is keyed by its absolute file name and
+# the datasets are kept in order of least recent use.
+# --------------------------------------------------------------------
+_open_files = OrderedDict()
+_open_files_statistics = {'hits': 0, 'misses': 0}
+
+# The process in which the open files were opened, and any open files
+# inherited from a parent process
+_open_files_process = {'pid': os.getpid(), 'inherited': []}
+
+
+def configuration(atol=None, rtol=None, log_level=None,
+                  max_open_files=None, block_cache_size=None,
+                  write_block_size=None, cdl_cache_size=None,
+                  reduction_block_size=None, lazy=None,
+                  index_cache_size=None):
     '''View or set any number of constants in the project-wide configuration.
 
     The full list of global constants that are provided in a dictionary to
@@ -25,6 +44,13 @@ def configuration(atol=None, rtol=None, log_level=None):
     * `atol`
     * `rtol`
     * `log_level`
+    * `max_open_files`
+    * `block_cache_size`
+    * `write_block_size`
+    * `cdl_cache_size`
+    * `reduction_block_size`
+    * `lazy`
+    * `index_cache_size`
 
     These are all constants that apply throughout `cfdm`, except for in
     specific functions only if overriden by the corresponding keyword
@@ -40,7 +66,10 @@ def configuration(atol=None, rtol=None, log_level=None):
 
     .. versionadded:: (cfdm) 1.8.6
 
-    .. seealso:: `atol`, `rtol`, `log_level`
+    .. seealso:: `atol`, `rtol`, `log_level`, `max_open_files`,
+                 `block_cache_size`, `write_block_size`,
+                 `cdl_cache_size`, `reduction_block_size`, `lazy`,
+                 `index_cache_size`
 
     :Parameters:
 
@@ -64,6 +93,56 @@ def configuration(atol=None, rtol=None, log_level=None):
             * ``'DETAIL'`` (``3``);
             * ``'DEBUG'`` (``-1``).
 
+        max_open_files: `int`, optional
+            The new value of the maximum number of netCDF files that
+            may be kept open for reading data. The default is to not
+            change the current value.
+
+            .. versionadded:: (cfdm) 1.8.8.0
+
+        block_cache_size: `int`, optional
+            The new value of the maximum amount of memory, in bytes,
+            used to cache blocks of data read from netCDF files. The
+            default is to not change the current value.
+
+            .. versionadded:: (cfdm) 1.8.8.0
+
+        write_block_size: `int`, optional
+            The new value of the maximum amount of memory, in bytes,
+            used to write each block of a data array to a netCDF
+            file. The default is to not change the current value.
+
+            .. versionadded:: (cfdm) 1.8.8.0
+
+        cdl_cache_size: `int`, optional
+            The new value of the maximum amount of disk space, in
+            bytes, used to cache netCDF files converted from CDL
+            files. The default is to not change the current value.
+
+            .. versionadded:: (cfdm) 1.8.8.0
+
+        reduction_block_size: `int`, optional
+            The new value of the maximum amount of memory, in bytes,
+            used to read each block of a data array when calculating
+            reductions of data that is not in memory. The default is
+            to not change the current value.
+
+            .. versionadded:: (cfdm) 1.8.8.0
+
+        lazy: `bool`, optional
+            The new value of whether or not operations on data that
+            is not in memory are deferred. The default is to not
+            change the current value.
+
+            .. versionadded:: (cfdm) 1.8.8.0
+
+        index_cache_size: `int`, optional
+            The new value of the maximum amount of memory, in bytes,
+            used to cache the index tables of each compressed
+            array. The default is to not change the current value.
+
+            .. versionadded:: (cfdm) 1.8.8.0
+
     :Returns:
 
         `dict`
@@ -76,13 +155,27 @@ def configuration(atol=None, rtol=None, log_level=None):
     >>> cfdm.configuration()  # view full global configuration of constants
     {'atol': 2.220446049250313e-16,
      'rtol': 2.220446049250313e-16,
-     'log_level': 'WARNING'}
+     'log_level': 'WARNING',
+     'max_open_files': 16,
+     'block_cache_size': 0,
+     'write_block_size': 134217728,
+     'cdl_cache_size': 0,
+     'reduction_block_size': 134217728,
+     'lazy': False,
+     'index_cache_size': 134217728}
     >>> cfdm.log_level('DEBUG')  # make a change to one constant...
     'WARNING'
     >>> cfdm.configuration()  # ...and it is reflected in the configuration
     {'atol': 2.220446049250313e-16,
      'rtol': 2.220446049250313e-16,
-     'log_level': 'DEBUG'}
+     'log_level': 'DEBUG',
+     'max_open_files': 16,
+     'block_cache_size': 0,
+     'write_block_size': 134217728,
+     'cdl_cache_size': 0,
+     'reduction_block_size': 134217728,
+     'lazy': False,
+     'index_cache_size': 134217728}
 
     >>> cfdm.configuration()['atol']  # access specific values by key querying
     2.220446049250313e-16
@@ -92,18 +185,59 @@ def configuration(atol=None, rtol=None, log_level=None):
     >>> cfdm.configuration(atol=5e-14, log_level='INFO')  # set multiple items
     {'atol': 2.220446049250313e-16,
      'rtol': 2.220446049250313e-16,
-     'log_level': 'DEBUG'}
+     'log_level': 'DEBUG',
+     'max_open_files': 16,
+     'block_cache_size': 0,
+     'write_block_size': 134217728,
+     'cdl_cache_size': 0,
+     'reduction_block_size': 134217728,
+     'lazy': False,
+     'index_cache_size': 134217728}
     >>> cfdm.configuration()
-    {'atol': 5e-14, 'rtol': 2.220446049250313e-16, 'log_level': 'INFO'}
+    {'atol': 5e-14,
+     'rtol': 2.220446049250313e-16,
+     'log_level': 'INFO',
+     'max_open_files': 16,
+     'block_cache_size': 0,
+     'write_block_size': 134217728,
+     'cdl_cache_size': 0,
+     'reduction_block_size': 134217728,
+     'lazy': False,
+     'index_cache_size': 134217728}
 
     >>> cfdm.configuration(rtol=1e-17)  # equivalent to setting cfdm.rtol(1e-17)
-    {'atol': 5e-14, 'rtol': 2.220446049250313e-16, 'log_level': 'INFO'}
+    {'atol': 5e-14,
+     'rtol': 2.220446049250313e-16,
+     'log_level': 'INFO',
+     'max_open_files': 16,
+     'block_cache_size': 0,
+     'write_block_size': 134217728,
+     'cdl_cache_size': 0,
+     'reduction_block_size': 134217728,
+     'lazy': False,
+     'index_cache_size': 134217728}
     >>> cfdm.configuration()
-    {'atol': 5e-14, 'rtol': 1e-17, 'log_level': 'INFO'}
+    {'atol': 5e-14,
+     'rtol': 1e-17,
+     'log_level': 'INFO',
+     'max_open_files': 16,
+     'block_cache_size': 0,
+     'write_block_size': 134217728,
+     'cdl_cache_size': 0,
+     'reduction_block_size': 134217728,
+     'lazy': False,
+     'index_cache_size': 134217728}
 
     '''
     return _configuration(
-        new_atol=atol, new_rtol=rtol, new_log_level=log_level)
+        new_atol=atol, new_rtol=rtol, new_log_level=log_level,
+        new_max_open_files=max_open_files,
+        new_block_cache_size=block_cache_size,
+        new_write_block_size=write_block_size,
+        new_cdl_cache_size=cdl_cache_size,
+        new_reduction_block_size=reduction_block_size,
+        new_lazy=lazy,
+        new_index_cache_size=index_cache_size)
 
 
 def _configuration(**kwargs):
@@ -131,6 +265,13 @@ def _configuration(**kwargs):
         'new_atol': atol,
         'new_rtol': rtol,
         'new_log_level': log_level,
+        'new_max_open_files': max_open_files,
+        'new_block_cache_size': block_cache_size,
+        'new_write_block_size': write_block_size,
+        'new_cdl_cache_size': cdl_cache_size,
+        'new_reduction_block_size': reduction_block_size,
+        'new_lazy': lazy,
+        'new_index_cache_size': index_cache_size,
     }
     for setting_alias, new_value in kwargs.items():  # for all input kwargs...
         reset_mapping[setting_alias](new_value)  # ...run corresponding func
@@ -354,6 +495,656 @@ def LOG_LEVEL(*new_log_level):
     return log_level(*new_log_level)
 
 
+def max_open_files(*max_open_files):
+    '''The maximum number of netCDF files that may be kept open for
+    reading data.
+
+    Data that are stored in netCDF files are only read from disk when
+    they are required. Rather than opening and closing a file for
+    every such read, the file may be kept open so that subsequent
+    reads from the same file do not incur the cost of opening it
+    again. The open files are shared by all data arrays. When the
+    maximum number of open files is exceeded, the least recently used
+    file is closed.
+
+    A value of ``0`` means that a file is closed as soon as data have
+    been read from it.
+
+    The default maximum number is ``16``.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `close_files`, `configuration`, `open_files`
+
+    :Parameters:
+
+        max_open_files: `int`, optional
+            The new value of the maximum number of open files. The
+            default is to not change the current value.
+
+    :Returns:
+
+        `int`
+            The value prior to the change, or the current value if no
+            new value was specified.
+
+    **Examples:**
+
+    >>> max_open_files()
+    16
+    >>> old = max_open_files(2)
+    >>> max_open_files()
+    2
+    >>> max_open_files(old)
+    2
+    >>> max_open_files()
+    16
+
+    '''
+    old = CONSTANTS['MAX_OPEN_FILES']
+    if max_open_files:
+        CONSTANTS['MAX_OPEN_FILES'] = _non_negative_int(
+            max_open_files[0], 'maximum number of open files')
+        _trim_open_files()
+
+    return old
+
+
+def block_cache_size(*block_cache_size):
+    '''The maximum amount of memory used to cache blocks of data read
+    from netCDF files.
+
+    When data are read from a chunked netCDF4 variable, whole HDF5
+    chunks of the variable may be kept in memory so that subsequent
+    reads of the same, or overlapping, parts of the variable are
+    served from memory rather than from disk. When the maximum amount
+    of memory is exceeded, the least recently used chunks are
+    discarded.
+
+    A value of ``0`` means that no data are cached, which is the
+    default.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `configuration`, `max_open_files`
+
+    :Parameters:
+
+        block_cache_size: `int`, optional
+            The new value of the maximum amount of memory, in
+            bytes. The default is to not change the current value.
+
+    :Returns:
+
+        `int`
+            The value prior to the change, or the current value if no
+            new value was specified.
+
+    **Examples:**
+
+    >>> block_cache_size()
+    0
+    >>> old = block_cache_size(2**28)
+    >>> block_cache_size()
+    268435456
+    >>> block_cache_size(old)
+    268435456
+    >>> block_cache_size()
+    0
+
+    '''
+    old = CONSTANTS['BLOCK_CACHE_SIZE']
+    if block_cache_size:
+        CONSTANTS['BLOCK_CACHE_SIZE'] = _non_negative_int(
+            block_cache_size[0], 'block cache size')
+
+    return old
+
+
+def write_block_size(*write_block_size):
+    '''The maximum amount of memory used to write each block of a data
+    array to a netCDF file.
+
+    A data array that is larger than this is written to the netCDF
+    file in blocks, each of which is no larger than this (unless a
+    single HDF5 chunk of the output netCDF variable is larger), so
+    that the whole array is never in memory at once.
+
+    A value of ``0`` means that every data array is written in a
+    single block. The default is 134217728 bytes (128 MiB).
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `configuration`, `write`
+
+    :Parameters:
+
+        write_block_size: `int`, optional
+            The new value of the maximum amount of memory, in
+            bytes. The default is to not change the current value.
+
+    :Returns:
+
+        `int`
+            The value prior to the change, or the current value if no
+            new value was specified.
+
+    **Examples:**
+
+    >>> write_block_size()
+    134217728
+    >>> old = write_block_size(2**20)
+    >>> write_block_size()
+    1048576
+    >>> write_block_size(old)
+    1048576
+    >>> write_block_size()
+    134217728
+
+    '''
+    old = CONSTANTS['WRITE_BLOCK_SIZE']
+    if write_block_size:
+        CONSTANTS['WRITE_BLOCK_SIZE'] = _non_negative_int(
+            write_block_size[0], 'write block size')
+
+    return old
+
+
+def cdl_cache_size(*cdl_cache_size):
+    '''The maximum amount of disk space used to cache netCDF files
+    converted from CDL files.
+
+    When a CDL file is read, it is first converted to a temporary
+    netCDF file with the external ``ncgen`` command (see `cfdm.read`
+    for details). If this cache is enabled then each converted netCDF
+    file is also stored in the ``cfdm/cdl`` sub-directory of the
+    user's cache directory (``$XDG_CACHE_HOME``, or ``~/.cache`` if
+    that is not set), keyed by a hash of the CDL file's contents, so
+    that subsequent reads of an unchanged CDL file, in this or any
+    later Python session, do not need to run ``ncgen`` again. The
+    least recently used files are deleted from the cache whenever its
+    total size exceeds this value.
+
+    The cache is not used if its directory is not owned by the user,
+    or if it can be written to by other users.
+
+    Within a single Python session, an unchanged CDL file is only ever
+    converted once, regardless of whether or not this cache is
+    enabled.
+
+    A value of ``0`` means that no files are cached on disk. The
+    default is 0.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `configuration`, `read`
+
+    :Parameters:
+
+        cdl_cache_size: `int`, optional
+            The new value of the maximum amount of disk space, in
+            bytes. The default is to not change the current value.
+
+    :Returns:
+
+        `int`
+            The value prior to the change, or the current value if no
+            new value was specified.
+
+    **Examples:**
+
+    >>> cdl_cache_size()
+    0
+    >>> old = cdl_cache_size(2**28)
+    >>> cdl_cache_size()
+    268435456
+    >>> cdl_cache_size(old)
+    268435456
+    >>> cdl_cache_size()
+    0
+
+    '''
+    old = CONSTANTS['CDL_CACHE_SIZE']
+    if cdl_cache_size:
+        CONSTANTS['CDL_CACHE_SIZE'] = _non_negative_int(
+            cdl_cache_size[0], 'CDL cache size')
+
+    return old
+
+
+def reduction_block_size(*reduction_block_size):
+    '''The maximum amount of memory used to read each block of a data
+    array when calculating reductions.
+
+    Reductions, such as the maximum and minimum, of a data array that
+    is not in memory (for instance, one that is stored in a netCDF
+    file or is compressed) and is larger than this are calculated
+    block by block, each block being no larger than this (unless the
+    array's HDF5 chunks are larger), so that the whole array is never
+    in memory at once. Sums are always calculated in a single block,
+    since a floating point sum that is calculated block by block may
+    differ slightly from one that is not.
+
+    A value of ``0`` means that every data array is reduced in a
+    single block. The default is 134217728 bytes (128 MiB).
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `configuration`, `write_block_size`
+
+    :Parameters:
+
+        reduction_block_size: `int`, optional
+            The new value of the maximum amount of memory, in
+            bytes. The default is to not change the current value.
+
+    :Returns:
+
+        `int`
+            The value prior to the change, or the current value if no
+            new value was specified.
+
+    **Examples:**
+
+    >>> reduction_block_size()
+    134217728
+    >>> old = reduction_block_size(2**20)
+    >>> reduction_block_size()
+    1048576
+    >>> reduction_block_size(old)
+    1048576
+    >>> reduction_block_size()
+    134217728
+
+    '''
+    old = CONSTANTS['REDUCTION_BLOCK_SIZE']
+    if reduction_block_size:
+        CONSTANTS['REDUCTION_BLOCK_SIZE'] = _non_negative_int(
+            reduction_block_size[0], 'reduction block size')
+
+    return old
+
+
+def lazy(*lazy):
+    '''Whether or not operations on data that is not in memory are
+    deferred.
+
+    If True then subspacing, transposing, squeezing, inserting
+    dimensions into, flattening and applying masking to data that is
+    not in memory (for instance, data that is stored in a netCDF file)
+    are not carried out straight away. Instead, they are recorded and
+    carried out together only when the data values are required, at
+    which point only the part of the data that is actually needed is
+    read.
+
+    The default is False, meaning that all such operations read the
+    data and are carried out straight away.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `configuration`
+
+    :Parameters:
+
+        lazy: `bool`, optional
+            The new value. The default is to not change the current
+            value.
+
+    :Returns:
+
+        `bool`
+            The value prior to the change, or the current value if no
+            new value was specified.
+
+    **Examples:**
+
+    >>> lazy()
+    False
+    >>> old = lazy(True)
+    >>> lazy()
+    True
+    >>> lazy(old)
+    True
+    >>> lazy()
+    False
+
+    '''
+    old = CONSTANTS['LAZY']
+    if lazy:
+        value = lazy[0]
+        if not isinstance(value, bool):
+            raise ValueError(
+                "The lazy setting must be True or False. "
+                "Got {!r}".format(value))
+
+        CONSTANTS['LAZY'] = value
+
+    return old
+
+
+def index_cache_size(*index_cache_size):
+    '''The maximum amount of memory used to cache the index tables of
+    each compressed array.
+
+    Locating the elements of a compressed array (such as a ragged or
+    gathered array) in its uncompressed form requires index tables
+    that are created from its count, index or list variables. The
+    tables of each compressed array are cached, so that repeatedly
+    subspacing the same compressed array, for instance when iterating
+    over its data, does not recreate them every time. Tables that
+    would take the memory used by the cached tables of a compressed
+    array beyond this amount are not cached.
+
+    A value of ``0`` means that index tables are never cached. The
+    default is 134217728 bytes (128 MiB).
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `configuration`
+
+    :Parameters:
+
+        index_cache_size: `int`, optional
+            The new value of the maximum amount of memory, in
+            bytes. The default is to not change the current value.
+
+    :Returns:
+
+        `int`
+            The value prior to the change, or the current value if no
+            new value was specified.
+
+    **Examples:**
+
+    >>> index_cache_size()
+    134217728
+    >>> old = index_cache_size(2**20)
+    >>> index_cache_size()
+    1048576
+    >>> index_cache_size(old)
+    1048576
+    >>> index_cache_size()
+    134217728
+
+    '''
+    old = CONSTANTS['INDEX_CACHE_SIZE']
+    if index_cache_size:
+        CONSTANTS['INDEX_CACHE_SIZE'] = _non_negative_int(
+            index_cache_size[0], 'index cache size')
+
+    return old
+
+
+def open_files():
+    '''Return the netCDF files that are kept open for reading data.
+
+    See `max_open_files` for details.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `close_files`, `max_open_files`
+
+    :Returns:
+
+        `dict`
+            The names of the open files, from least to most recently
+            used; and the number of times that a request to open a
+            file was satisfied by an already open file ("hits"), or
+            required the file to be opened ("misses").
+
+    **Examples:**
+
+    >>> f = cfdm.read('file.nc')[0]
+    >>> a = f.array
+    >>> b = f.dimension_coordinate('latitude').array
+    >>> cfdm.open_files()
+    {'files': ['/data/file.nc'], 'hits': 1, 'misses': 1}
+
+    '''
+    _check_open_files_process()
+
+    out = {'files': list(_open_files)}
+    out.update(_open_files_statistics)
+    return out
+
+
+def close_files(filename=None):
+    '''Close netCDF files that are kept open for reading data.
+
+    See `max_open_files` for details.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `max_open_files`, `open_files`
+
+    :Parameters:
+
+        filename: `str`, optional
+            Only close the file with this name. By default all open
+            files are closed.
+
+    :Returns:
+
+        `None`
+
+    **Examples:**
+
+    >>> cfdm.close_files('file.nc')
+    >>> cfdm.close_files()
+    >>> cfdm.open_files()
+    {'files': [], 'hits': 1, 'misses': 1}
+
+    '''
+    _check_open_files_process()
+
+    if filename is None:
+        filenames = list(_open_files)
+    else:
+        filenames = [abspath(filename)]
+
+    for filename in filenames:
+        nc = _open_files.pop(filename, None)
+        if nc is not None:
+            nc[0].close()
+
+
+def _block_shape(shape, itemsize, max_nbytes, chunks=None):
+    '''Return the shape of blocks that partition an array.
+
+    Blocks span whole chunks of the array (or whole elements, if the
+    array is not chunked), and are as large as possible given the
+    maximum block size, with trailing dimensions filled first.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        shape: sequence of `int`
+            The shape of the array.
+
+        itemsize: `int`
+            The size, in bytes, of each array element.
+
+        max_nbytes: `int`
+            The maximum size of each block, in bytes. A block may be
+            larger than this if a single chunk is larger.
+
+        chunks: sequence of `int`, optional
+            The shape of each chunk of the array. By default the
+            array is not chunked.
+
+    :Returns:
+
+        `tuple` or `None`
+            The shape of each block, or `None` if the array is no
+            larger than *max_nbytes* and so fits into a single block.
+
+    **Examples:**
+
+    >>> _block_shape((10, 180, 360), 8, 2**20)
+    (2, 180, 360)
+    >>> _block_shape((10, 180, 360), 8, 2**20, chunks=(1, 90, 90))
+    (2, 180, 360)
+    >>> _block_shape((10, 180, 360), 8, 2**30) is None
+    True
+
+    '''
+    if numpy.prod(shape, dtype=float) * itemsize <= max_nbytes:
+        return None
+
+    if not chunks:
+        chunks = [1] * len(shape)
+
+    block_shape = [min(n, size) for n, size in zip(chunks, shape)]
+    for i in range(len(shape) - 1, -1, -1):
+        block_shape[i] = shape[i]
+        nbytes = numpy.prod(block_shape, dtype=float) * itemsize
+        if nbytes > max_nbytes:
+            # Use as many whole chunks along this dimension as will
+            # fit
+            n = min(chunks[i], shape[i])
+            size = max_nbytes * shape[i] // nbytes
+            block_shape[i] = max(n, int(size // n) * n)
+            break
+    # --- End: for
+
+    return tuple(block_shape)
+
+
+def _open_netcdf_file(filename):
+    '''Return an open `netCDF4.Dataset`, shared by all data arrays.
+
+    The dataset is taken from the open files, if possible, and
+    otherwise is opened and added to them. A file that has been
+    modified since it was opened is reopened.
+
+    If the maximum number of open files is zero then a new dataset is
+    returned that is not added to the open files, and which is the
+    responsibility of the caller to close.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        filename: `str`
+            The name of the netCDF file.
+
+    :Returns:
+
+        `netCDF4.Dataset`, `bool`
+            The open dataset, and whether or not it is shared.
+
+    '''
+    _check_open_files_process()
+
+    key = abspath(filename)
+    stat = _file_signature(key)
+
+    nc = _open_files.get(key)
+    if nc is not None:
+        if nc[1] == stat:
+            _open_files_statistics['hits'] += 1
+            _open_files.move_to_end(key)
+            return nc[0], True
+
+        # The file has changed since it was opened
+        close_files(key)
+
+    _open_files_statistics['misses'] += 1
+
+    try:
+        nc = netCDF4.Dataset(filename, 'r')
+    except RuntimeError as error:
+        raise RuntimeError("{}: {}".format(error, filename))
+
+    if not CONSTANTS['MAX_OPEN_FILES']:
+        return nc, False
+
+    _open_files[key] = (nc, stat)
+    _trim_open_files()
+
+    return nc, True
+
+
+def _file_signature(filename):
+    '''Return a signature that changes when a file is modified.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        filename: `str`
+            The name of the file.
+
+    :Returns:
+
+        `tuple` or `None`
+            The inode, size and modification time of the file, or
+            `None` if these are not available (as is the case for an
+            OPeNDAP URL, for instance).
+
+    '''
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return None
+
+    return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+def _trim_open_files():
+    '''Close the least recently used open files in excess of the
+    maximum number allowed.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Returns:
+
+        `None`
+
+    '''
+    _check_open_files_process()
+
+    while len(_open_files) > CONSTANTS['MAX_OPEN_FILES']:
+        _, nc = _open_files.popitem(last=False)
+        nc[0].close()
+
+
+def _check_open_files_process():
+    '''Forget the open files inherited from a parent process.
+
+    A forked process (such as a worker process of `read_many`)
+    inherits the open files of its parent, but they share the file
+    descriptors of the parent process, and so can not be safely used
+    or closed by the child process. Such files are removed from the
+    open files, but are retained (without being closed) for the
+    lifetime of the child process.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Returns:
+
+        `None`
+
+    '''
+    pid = os.getpid()
+    if pid != _open_files_process['pid']:
+        _open_files_process['inherited'].extend(_open_files.values())
+        _open_files.clear()
+        _open_files_process['pid'] = pid
+
+
+def _non_negative_int(n, name):
+    '''Return a setting as an `int`, checking that it is non-negative.'''
+    if (isinstance(n, bool) or not isinstance(n, (int, numpy.integer))
+            or n < 0):
+        raise ValueError(
+            "The {} must be a non-negative integer. Got {!r}".format(
+                name, n))
+
+    return int(n)
+
+
 def _is_valid_log_level_int(int_log_level):
     '''Return a Boolean stating if input is a ValidLogLevels Enum integer.'''
     try:
@@ -71,6 +71,77 @@ class Properties(Container):
 
         return '\n'.join(string)
 
+    def _equals_fingerprint(self, ignore_data_type=False,
+                            ignore_fill_value=False,
+                            ignore_compression=False,
+                            ignore_properties=(), digest=False):
+        '''Return a structural fingerprint for testing equality.
+
+    Two instances can only be equal if their fingerprints, created
+    with the same parameters, are equal. The fingerprint records the
+    property names, and the values of the string-valued properties.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `equals`
+
+    :Parameters:
+
+        ignore_data_type: `bool`, optional
+            As for the `equals` method.
+
+        ignore_fill_value: `bool`, optional
+            As for the `equals` method.
+
+        ignore_compression: `bool`, optional
+            As for the `equals` method, when it is available.
+
+        ignore_properties: sequence of `str`, optional
+            As for the `equals` method.
+
+        digest: `bool`, optional
+            If True then include digests of the data, where
+            available. Computing the digests may require the data to
+            be read, but the digests are cached.
+
+    :Returns:
+
+        `tuple`
+            The fingerprint.
+
+    **Examples:**
+
+    >>> f = {{package}}.{{class}}(properties={'foo': 'bar', 'baz': 1})
+    >>> f._equals_fingerprint()
+    (('baz', None), ('foo', 'bar'))
+
+        '''
+        properties = self.properties()
+
+        if ignore_fill_value:
+            ignore_properties = tuple(ignore_properties) + ('_FillValue',
+                                                            'missing_value')
+
+        for prop in ignore_properties:
+            properties.pop(prop, None)
+
+        out = []
+        for prop, value in properties.items():
+            if (isinstance(value, numpy.ndarray) and not value.ndim
+                    and value.dtype.kind == 'U'):
+                # A string stored in a numpy array is equal to the
+                # same string
+                value = str(value)
+            elif not isinstance(value, str):
+                # Values that are not strings may be compared with
+                # a tolerance, so only record that they exist
+                value = None
+
+            out.append((prop, value))
+        # --- End: for
+
+        return tuple(sorted(out))
+
     # ----------------------------------------------------------------
     # Methods
     # ----------------------------------------------------------------
@@ -136,6 +136,65 @@ class PropertiesData(Properties):
 
         return [(i + ndim if i < 0 else i) for i in axes]
 
+    def _equals_fingerprint(self, ignore_data_type=False,
+                            ignore_fill_value=False,
+                            ignore_compression=False,
+                            ignore_properties=(), digest=False):
+        '''Return a structural fingerprint for testing equality.
+
+    Two instances can only be equal if their fingerprints, created
+    with the same parameters, are equal. The fingerprint records the
+    property names, the values of the string-valued properties and
+    the shape, units, calendar, data type and compression type of the
+    data. An external variable is recorded by its netCDF variable
+    name.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `equals`
+
+    :Parameters:
+
+        ignore_data_type: `bool`, optional
+            As for the `equals` method.
+
+        ignore_fill_value: `bool`, optional
+            As for the `equals` method.
+
+        ignore_compression: `bool`, optional
+            As for the `equals` method.
+
+        ignore_properties: sequence of `str`, optional
+            As for the `equals` method.
+
+        digest: `bool`, optional
+            If True then include a digest of the positions of the
+            missing values of the data. Computing the digest may
+            require the data to be read, but the digest is cached.
+
+    :Returns:
+
+        `tuple`
+            The fingerprint.
+
+        '''
+        if self._get_component('external', False):
+            # External variables are equal if their netCDF variable
+            # names are equal
+            return ('external', self.nc_get_variable(None))
+
+        data = self.get_data(None)
+        if data is not None:
+            data = data._equals_fingerprint(
+                ignore_data_type=ignore_data_type,
+                ignore_compression=ignore_compression,
+                digest=digest)
+
+        return (super()._equals_fingerprint(
+                    ignore_fill_value=ignore_fill_value,
+                    ignore_properties=ignore_properties),
+                data)
+
     @classmethod
     def _test_docstring_substitution_classmethod(cls, arg1, arg2):
         '''Test docstring substitution on with @classmethod.
@@ -255,6 +255,70 @@ class PropertiesDataBounds(PropertiesData):
 
         return '{0}{1} {2}'.format(self.identity(''), dims, units)
 
+    # ----------------------------------------------------------------
+    # Private methods
+    # ----------------------------------------------------------------
+    def _equals_fingerprint(self, ignore_data_type=False,
+                            ignore_fill_value=False,
+                            ignore_compression=False,
+                            ignore_properties=(), digest=False):
+        '''Return a structural fingerprint for testing equality.
+
+    Two instances can only be equal if their fingerprints, created
+    with the same parameters, are equal. In addition to the properties
+    and data, the fingerprint records the geometry type, and the
+    fingerprints of the bounds and interior ring.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `equals`
+
+    :Parameters:
+
+        ignore_data_type: `bool`, optional
+            As for the `equals` method.
+
+        ignore_fill_value: `bool`, optional
+            As for the `equals` method.
+
+        ignore_compression: `bool`, optional
+            As for the `equals` method.
+
+        ignore_properties: sequence of `str`, optional
+            As for the `equals` method.
+
+        digest: `bool`, optional
+            If True then include a digest of the positions of the
+            missing values of the data, but not of the bounds or
+            interior ring.
+
+    :Returns:
+
+        `tuple`
+            The fingerprint.
+
+        '''
+        out = [super()._equals_fingerprint(
+                   ignore_data_type=ignore_data_type,
+                   ignore_fill_value=ignore_fill_value,
+                   ignore_compression=ignore_compression,
+                   ignore_properties=ignore_properties,
+                   digest=digest),
+               self.get_geometry(None)]
+
+        for component in (self.get_bounds(None),
+                          self.get_interior_ring(None)):
+            if component is not None:
+                component = component._equals_fingerprint(
+                    ignore_data_type=ignore_data_type,
+                    ignore_fill_value=ignore_fill_value,
+                    ignore_compression=ignore_compression)
+
+            out.append(component)
+        # --- End: for
+
+        return tuple(out)
+
     # ----------------------------------------------------------------
     # Attributes
     # ----------------------------------------------------------------
@@ -1,5 +1,7 @@
 from .abstract import (IO,
                        IORead,
                        IOWrite)
-from .read import read
+from .read import (read,
+                   read_many,
+                   scan)
 from .write import write
@@ -1,7 +1,10 @@
+import hashlib
 import logging
 import operator
 import os
 import re
+import shutil
+import stat
 import struct
 import subprocess
 import tempfile
@@ -11,6 +14,7 @@ from collections       import OrderedDict
 from copy              import deepcopy
 from distutils.version import LooseVersion
 from functools         import reduce
+from inspect           import signature
 from pprint            import (pformat, pprint)
 
 import numpy
@@ -20,7 +24,7 @@ import netcdf_flattener
 
 from ...decorators import _manage_log_level_via_verbosity
 
-from ...functions import log_level
+from ...functions import cdl_cache_size, log_level
 
 from .. import IORead
 
@@ -29,9 +33,73 @@ from . import constants
 
 _cached_temporary_files = {}
 
+# The temporary netCDF file converted from each CDL file, keyed by a
+# hash of the CDL file's contents
+_cdl_netcdf_files = {}
+
+# The directory of the disk cache of netCDF files converted from CDL
+# files, which is in the user's cache directory (see
+# cfdm.cdl_cache_size)
+_cdl_cache_directory = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(
+        os.path.expanduser('~'), '.cache'),
+    'cfdm', 'cdl')
+
 logger = logging.getLogger(__name__)
 
-_flattener_separator = netcdf_flattener._Flattener._Flattener__new_separator
+# The private parts of netcdf_flattener that are used to find the
+# flattened names of a grouped dataset (see _flattener_internals)
+_flattener_cache = {}
+
+
+def _flattener_internals():
+    '''Return the private parts of netcdf_flattener used to flatten names.
+
+    They are looked up when first needed, rather than when the module
+    is imported, so that a release of netcdf_flattener that changes
+    them does not prevent cfdm from being imported.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `NetCDFRead._flatten_names`
+
+    :Returns:
+
+        `dict` or `None`
+            The flattener class, with key ``'Flattener'``; the
+            marker of a reference that could not be resolved, with
+            key ``'ref_not_found'``; and the properties of the
+            variable attributes that contain references, with key
+            ``'attribute_properties'``. `None` if any of these are
+            missing.
+
+    **Examples:**
+
+    >>> _flattener_internals()['ref_not_found']
+    'REF_NOT_FOUND'
+
+    '''
+    if 'internals' not in _flattener_cache:
+        try:
+            flattener = netcdf_flattener._Flattener
+            internals = {
+                'Flattener': flattener,
+                'ref_not_found': flattener._Flattener__ref_not_found_error,
+                'attribute_properties': netcdf_flattener._AttributeProperties,
+            }
+
+            for method in ('generate_flattened_name', 'pathname',
+                           'resolve_reference', 'handle_reference_error'):
+                getattr(flattener, method)
+
+            for function in ('parse_var_attr', 'generate_var_attr_str'):
+                getattr(netcdf_flattener, function)
+        except AttributeError:
+            internals = None
+
+        _flattener_cache['internals'] = internals
+
+    return _flattener_cache['internals']
 
 
 class NetCDFRead(IORead):
@@ -269,8 +337,7 @@ class NetCDFRead(IORead):
     def file_close(self):
         '''Close all netCDF files that have been opened.
 
-    Includes the input file being read, any external files, and any
-    temporary flattened files.
+    Includes the input file being read and any external files.
 
     :Returns:
 
@@ -284,15 +351,13 @@ class NetCDFRead(IORead):
         for nc in self.read_vars['datasets']:
             nc.close()
 
-        # Close temporary flattened files
-        for flat_file in self.read_vars['flat_files']:
-            flat_file.close()
-
     def file_open(self, filename, flatten=True, verbose=None):
         '''Open the netCDf file for reading.
 
-    If the file has hierarchical groups then a flattened version of it
-    is returned, and the original grouped file remains open.
+    If the file has hierarchical groups then its variables and
+    dimensions are later mapped to the names that they would have in
+    a flattened version of the file, without creating the flattened
+    file (see `_flatten_names`).
 
     .. versionadded:: (cfdm) 1.7.0
 
@@ -324,43 +389,340 @@ class NetCDFRead(IORead):
             raise RuntimeError("{}: {}".format(error, filename))
 
         # ------------------------------------------------------------
-        # If the file has a group structure then flatten it (CF>=1.8)
+        # If the file has a group structure then note that it needs
+        # to be flattened (CF>=1.8)
         # ------------------------------------------------------------
         g = self.read_vars
 
         if flatten and nc.groups:
-            # Create a diskless, non-persistent container for the
-            # flattened file
-            flat_file = tempfile.NamedTemporaryFile(
-                mode='wb',
-                dir=tempfile.gettempdir(),
-                prefix='cfdm_flat_',
-                suffix='.nc',
-                delete=True)
-
-            flat_nc = netCDF4.Dataset(flat_file, 'w',
-                                      diskless=True,
-                                      persist=False)
-            flat_nc.set_fill_off()
-
-            # Flatten the file
-            netcdf_flattener.flatten(nc, flat_nc,
-                                     lax_mode=True,
-                                     _copy_data=False)
-
-            nc.close()
-            nc = flat_nc
-
             g['has_groups'] = True
-            g['flat_files'].append(flat_file)
 
         g['nc'] = nc
         return nc
 
+    def _flatten_names(self, nc):
+        '''Map the contents of a grouped netCDF dataset to flattened names.
+
+    Every variable, dimension and group attribute is given the name
+    that it would have in a version of the dataset flattened by
+    `netcdf_flattener.flatten`, and the references to other variables
+    and dimensions in variable attributes (such as ``coordinates`` and
+    ``cell_measures``) are resolved and replaced with flattened names
+    in the same way. No flattened dataset is created, and the
+    original variables and dimensions are used directly.
+
+    If the private parts of `netcdf_flattener` that this relies on
+    are not available then the names are instead found from a
+    flattened copy of the dataset (see `_flatten_names_from_copy`).
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        nc: `netCDF4.Dataset`
+            The grouped dataset.
+
+    :Returns:
+
+        `dict`
+            The flattened names, with keys:
+
+            * ``'variables'``: each flattened variable name mapped to
+              its `netCDF4.Variable`.
+
+            * ``'dimensions'``: each flattened dimension name mapped
+              to its `netCDF4.Dimension`.
+
+            * ``'variable_dimensions'``: each flattened variable name
+              mapped to the flattened names of its dimensions.
+
+            * ``'references'``: each flattened variable name mapped
+              to its attributes that contain resolved references.
+
+            * ``'flattener_variables'``: each flattened variable name
+              mapped to its absolute path. The leading slash is
+              omitted for variables in the root group.
+
+            * ``'flattener_dimensions'``: each flattened dimension
+              name mapped to its absolute path. The leading slash is
+              omitted for dimensions in the root group.
+
+            * ``'flattener_attributes'``: the group structure of each
+              group, as a `tuple`, mapped to its attributes.
+
+    **Examples:**
+
+    >>> flat = r._flatten_names(nc)
+    >>> flat['flattener_variables']['forecast__model__ta']
+    '/forecast/model/ta'
+    >>> flat['references']['forecast__model__ta']
+    {'coordinates': 'forecast__latitude_1 forecast__longitude_1'}
+
+        '''
+        internals = _flattener_internals()
+        if internals is None:
+            return self._flatten_names_from_copy(nc)
+
+        try:
+            flattener = internals['Flattener'](nc, lax_mode=True,
+                                               _copy_data=False)
+        except TypeError:
+            return self._flatten_names_from_copy(nc)
+
+        ref_not_found = internals['ref_not_found']
+
+        variables = OrderedDict()
+        dimensions = OrderedDict()
+        flattener_variables = {}
+        flattener_dimensions = {}
+        flattener_attributes = {}
+
+        # Map absolute paths to flattened names
+        var_map = {}
+        dim_map = {}
+
+        # ------------------------------------------------------------
+        # Name the contents of each group, in the same order as the
+        # netCDF flattener
+        # ------------------------------------------------------------
+        groups = [nc]
+        while groups:
+            group = groups.pop(0)
+
+            if group.parent is not None:
+                flattener_attributes[tuple(group.path.split('/')[1:])] = {
+                    attr: group.getncattr(attr) for attr in group.ncattrs()
+                }
+
+            for name, dimension in group.dimensions.items():
+                flat_name = flattener.generate_flattened_name(group, name)
+                path = flattener.pathname(group, name)
+
+                dimensions[flat_name] = dimension
+                dim_map[path] = flat_name
+                if group.parent is None:
+                    path = name
+
+                flattener_dimensions[flat_name] = path
+
+            for name, variable in group.variables.items():
+                flat_name = flattener.generate_flattened_name(group, name)
+                path = flattener.pathname(group, name)
+
+                variables[flat_name] = variable
+                var_map[path] = flat_name
+                if group.parent is None:
+                    path = name
+
+                flattener_variables[flat_name] = path
+
+            # Process the sub-groups depth-first
+            groups[:0] = group.groups.values()
+        # --- End: while
+
+        def adapt_name(ref, attr):
+            '''Return the flattened name of a resolved reference.'''
+            if ref_not_found in ref:
+                return ref
+
+            if attr.ref_to_dim > attr.ref_to_var:
+                maps = (dim_map, var_map)
+            else:
+                maps = (var_map, dim_map)
+
+            if ref in maps[0]:
+                return maps[0][ref]
+
+            if attr.ref_to_dim and attr.ref_to_var and ref in maps[1]:
+                return maps[1][ref]
+
+            if attr.accept_standard_names:
+                return ref
+
+            return flattener.handle_reference_error(ref)
+
+        # ------------------------------------------------------------
+        # Resolve the references in variable attributes
+        # ------------------------------------------------------------
+        variable_dimensions = {}
+        references = {}
+        for name, variable in variables.items():
+            variable_dimensions[name] = tuple([
+                dim_map[flattener.pathname(dimension.group(),
+                                           dimension.name)]
+                for dimension in variable.get_dims()
+            ])
+
+            ncattrs = variable.ncattrs()
+
+            references[name] = {}
+            for attr in internals['attribute_properties']:
+                if attr.name not in ncattrs:
+                    continue
+
+                parsed = netcdf_flattener.parse_var_attr(
+                    variable.getncattr(attr.name))
+
+                resolved = OrderedDict()
+                for key, values in parsed.items():
+                    if attr.resolve_key:
+                        key = adapt_name(
+                            flattener.resolve_reference(key, variable, attr),
+                            attr)
+
+                    if attr.resolve_value and values is not None:
+                        values = [
+                            adapt_name(
+                                flattener.resolve_reference(value, variable,
+                                                            attr),
+                                attr)
+                            for value in values
+                        ]
+
+                    resolved[key] = values
+                # --- End: for
+
+                references[name][attr.name] = (
+                    netcdf_flattener.generate_var_attr_str(resolved))
+        # --- End: for
+
+        return {'variables': variables,
+                'dimensions': dimensions,
+                'variable_dimensions': variable_dimensions,
+                'references': references,
+                'flattener_variables': flattener_variables,
+                'flattener_dimensions': flattener_dimensions,
+                'flattener_attributes': flattener_attributes}
+
+    def _flatten_names_from_copy(self, nc):
+        '''Map the contents of a grouped netCDF dataset to flattened names.
+
+    The names are found from a diskless copy of the dataset that is
+    flattened by `netcdf_flattener.flatten`. The copy does not contain
+    any data, and is closed before returning.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `_flatten_names`
+
+    :Parameters:
+
+        nc: `netCDF4.Dataset`
+            The grouped dataset.
+
+    :Returns:
+
+        `dict`
+            The flattened names, in the same form as returned by
+            `_flatten_names`.
+
+    **Examples:**
+
+    >>> flat = r._flatten_names_from_copy(nc)
+    >>> flat['flattener_variables']['forecast__model__ta']
+    '/forecast/model/ta'
+
+        '''
+        # Create a diskless, non-persistent container for the
+        # flattened dataset
+        flat_file = tempfile.NamedTemporaryFile(
+            mode='wb',
+            dir=tempfile.gettempdir(),
+            prefix='cfdm_flat_',
+            suffix='.nc',
+            delete=True)
+
+        flat_nc = netCDF4.Dataset(flat_file.name, 'w', diskless=True,
+                                  persist=False)
+        flat_nc.set_fill_off()
+
+        kwargs = {'lax_mode': True}
+        if '_copy_data' in signature(netcdf_flattener.flatten).parameters:
+            kwargs['_copy_data'] = False
+
+        try:
+            netcdf_flattener.flatten(nc, flat_nc, **kwargs)
+
+            def name_mapping(attr):
+                '''Return a flattener name mapping attribute as a dict.'''
+                mapping = getattr(flat_nc, attr, [])
+                if isinstance(mapping, str):
+                    mapping = [mapping]
+
+                out = OrderedDict()
+                for x in mapping:
+                    flat_name, path = x.split(': ')
+                    if path.count('/') == 1:
+                        # Remove the leading slash from names in the
+                        # root group
+                        path = path[1:]
+
+                    out[flat_name] = path
+
+                return out
+
+            flattener_variables = name_mapping(
+                '__flattener_name_mapping_variables')
+            flattener_dimensions = name_mapping(
+                '__flattener_name_mapping_dimensions')
+
+            variables = OrderedDict()
+            variable_dimensions = {}
+            references = {}
+            for name, flat_variable in flat_nc.variables.items():
+                variable = nc[flattener_variables[name]]
+                variables[name] = variable
+                variable_dimensions[name] = flat_variable.dimensions
+
+                # Attributes whose references to other variables and
+                # dimensions have been replaced with flattened names
+                ncattrs = variable.ncattrs()
+                references[name] = {}
+                for attr in flat_variable.ncattrs():
+                    value = flat_variable.getncattr(attr)
+                    if isinstance(value, str) and (
+                            attr not in ncattrs
+                            or value != variable.getncattr(attr)):
+                        references[name][attr] = value
+            # --- End: for
+        finally:
+            flat_nc.close()
+            flat_file.close()
+
+        dimensions = OrderedDict()
+        for name, path in flattener_dimensions.items():
+            group_path, _, basename = path.rpartition('/')
+            group = nc[group_path] if group_path else nc
+            dimensions[name] = group.dimensions[basename]
+
+        flattener_attributes = {}
+        groups = list(nc.groups.values())
+        while groups:
+            group = groups.pop(0)
+            flattener_attributes[tuple(group.path.split('/')[1:])] = {
+                attr: group.getncattr(attr) for attr in group.ncattrs()
+            }
+            groups[:0] = group.groups.values()
+        # --- End: while
+
+        return {'variables': variables,
+                'dimensions': dimensions,
+                'variable_dimensions': variable_dimensions,
+                'references': references,
+                'flattener_variables': flattener_variables,
+                'flattener_dimensions': flattener_dimensions,
+                'flattener_attributes': flattener_attributes}
+
     @classmethod
     def cdl_to_netcdf(cls, filename):
         '''Create temporary netCDF file from a CDL text file.
 
+    An unchanged CDL file is only converted once per Python session,
+    and the converted netCDF files may also be cached on disk for use
+    by later sessions (see `cfdm.cdl_cache_size`). The returned
+    temporary netCDF file persists until the end of the Python
+    session.
+
     :Parameters:
 
         filename: `str`
@@ -372,6 +734,20 @@ class NetCDFRead(IORead):
             The name of the new netCDF file.
 
         '''
+        command = ['ncgen', '-v3', '-o']
+
+        # Key the conversion by the contents of the CDL file and the
+        # ncgen options
+        with open(filename, 'rb') as fh:
+            key = hashlib.sha1(fh.read())
+
+        key.update(' '.join(command).encode())
+        key = key.hexdigest()
+
+        tmpfile = _cdl_netcdf_files.get(key)
+        if tmpfile is not None and os.path.isfile(tmpfile):
+            return tmpfile
+
         x = tempfile.NamedTemporaryFile(mode='wb',
                                         dir=tempfile.gettempdir(),
                                         prefix='cfdm_', suffix='.nc')
@@ -383,10 +759,160 @@ class NetCDFRead(IORead):
         # ----------------------------------------------------------------
         _cached_temporary_files[tmpfile] = x
 
-        subprocess.run(['ncgen', '-v3', '-o', tmpfile, filename], check=True)
+        cache_size = cdl_cache_size()
+        if cache_size and not cls._cdl_cache_usable(_cdl_cache_directory):
+            cache_size = 0
+
+        if cache_size:
+            cached_file = os.path.join(_cdl_cache_directory, key + '.nc')
+            try:
+                shutil.copyfile(cached_file, tmpfile)
+            except OSError:
+                pass
+            else:
+                # Mark the cached file as recently used
+                try:
+                    os.utime(cached_file)
+                except OSError:
+                    pass
+
+                _cdl_netcdf_files[key] = tmpfile
+                return tmpfile
+        # --- End: if
+
+        subprocess.run(command + [tmpfile, filename], check=True)
+
+        _cdl_netcdf_files[key] = tmpfile
+
+        if cache_size:
+            cls._cache_cdl_netcdf(tmpfile, cached_file, cache_size)
 
         return tmpfile
 
+    @classmethod
+    def _cdl_cache_usable(cls, directory):
+        '''Whether the disk cache of netCDF files converted from CDL may
+    be used.
+
+    The cache directory is created if it does not exist. It may only
+    be used if it is owned by the current user and can not be written
+    to by any other user, so that no other user can place files in
+    the cache.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `cdl_to_netcdf`
+
+    :Parameters:
+
+        directory: `str`
+            The cache directory.
+
+    :Returns:
+
+        `bool`
+            Whether or not the cache may be used.
+
+        '''
+        try:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+            status = os.stat(directory)
+        except OSError as error:
+            logger.info(
+                "Can't use the cache of netCDF files converted from CDL: "
+                "{}".format(error)
+            )  # pragma: no cover
+            return False
+
+        if hasattr(os, 'getuid') and status.st_uid != os.getuid():
+            logger.info(
+                "Not using the cache of netCDF files converted from CDL: "
+                "{} is not owned by the current user".format(directory)
+            )  # pragma: no cover
+            return False
+
+        if status.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+            logger.info(
+                "Not using the cache of netCDF files converted from CDL: "
+                "{} is writable by other users".format(directory)
+            )  # pragma: no cover
+            return False
+
+        return True
+
+    @classmethod
+    def _cache_cdl_netcdf(cls, tmpfile, cached_file, cache_size):
+        '''Store a netCDF file converted from a CDL file in the disk cache.
+
+    The least recently used files are then deleted from the cache
+    until its total size is no larger than *cache_size*. Failure to
+    write to the cache is not an error.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `cdl_to_netcdf`
+
+    :Parameters:
+
+        tmpfile: `str`
+            The name of the netCDF file converted from the CDL file.
+
+        cached_file: `str`
+            The name of the file in the cache.
+
+        cache_size: `int`
+            The maximum size of the cache, in bytes.
+
+    :Returns:
+
+        `None`
+
+        '''
+        directory = os.path.dirname(cached_file)
+
+        partial = None
+        try:
+            # Copy to a temporary name first, so that no other process
+            # can see a partially written file
+            fd, partial = tempfile.mkstemp(dir=directory, prefix='.',
+                                           suffix='.part')
+            os.close(fd)
+            shutil.copyfile(tmpfile, partial)
+            os.replace(partial, cached_file)
+            partial = None
+
+            files = []
+            for entry in os.scandir(directory):
+                if entry.name.endswith('.nc'):
+                    status = entry.stat()
+                    files.append((status.st_mtime, status.st_size,
+                                  entry.path))
+            # --- End: for
+
+            # Delete the least recently used files
+            total = sum(size for _, size, _ in files)
+            for _, size, path in sorted(files):
+                if total <= cache_size:
+                    break
+
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+                total -= size
+        except OSError as error:
+            logger.info(
+                "Can't cache netCDF file converted from CDL: {}".format(
+                    error)
+            )  # pragma: no cover
+        finally:
+            if partial is not None:
+                try:
+                    os.remove(partial)
+                except OSError:
+                    pass
+
     @classmethod
     def is_netcdf_file(cls, filename):
         '''Return `True` if the file is a netCDF file.
@@ -673,6 +1199,10 @@ class NetCDFRead(IORead):
             #        <CoordinateReference: ocean_s_coordinate>}
             'vertical_crs': {},
 
+            # The CF-compliant bounds of netCDF variables, keyed by
+            # the arguments to _find_bounds
+            'found_bounds': {},
+
             #
             'version': {},
 
@@ -687,8 +1217,6 @@ class NetCDFRead(IORead):
             # Assume a priori that the dataset does not have a group
             # structure
             'has_groups': False,
-            # Keep a list of flattened file names
-            'flat_files': [],
         }
 
         g = self.read_vars
@@ -846,85 +1374,26 @@ class NetCDFRead(IORead):
         # ------------------------------------------------------------
         has_groups = g['has_groups']
 
-        flattener_variables = {}
-        flattener_dimensions = {}
-        flattener_attributes = {}
-
         if has_groups:
-            flattener_name_mapping_variables = getattr(
-                nc, '__flattener_name_mapping_variables', None)
-            if flattener_name_mapping_variables is not None:
-                if isinstance(flattener_name_mapping_variables, str):
-                    flattener_name_mapping_variables = [
-                        flattener_name_mapping_variables
-                    ]
-                flattener_variables = dict(
-                    tuple(x.split(': '))
-                    for x in flattener_name_mapping_variables
-                )
-
-            flattener_name_mapping_dimensions = getattr(
-                nc, '__flattener_name_mapping_dimensions', None)
-            if flattener_name_mapping_dimensions is not None:
-                if isinstance(flattener_name_mapping_dimensions, str):
-                    flattener_name_mapping_attributes = [
-                        flattener_name_mapping_attributes
-                    ]
-                flattener_dimensions = dict(
-                    tuple(x.split(': '))
-                    for x in flattener_name_mapping_dimensions
-                )
-
-                # Remove a leading / (slash) from dimensions in the
-                # root group
-                for key, value in flattener_dimensions.items():
-                    if value.startswith('/') and value.count('/') == 1:
-                        flattener_dimensions[key] = value[1:]
-            # --- End: if
-
-            flattener_name_mapping_attributes = getattr(
-                nc, '__flattener_name_mapping_attributes', None)
-            if flattener_name_mapping_attributes is not None:
-                if isinstance(flattener_name_mapping_attributes, str):
-                    flattener_name_mapping_attributes = [
-                        flattener_name_mapping_attributes
-                    ]
-                flattener_attributes = dict(
-                    tuple(x.split(': '))
-                    for x in flattener_name_mapping_attributes
-                )
-
-                # Remove group attributes from the global attributes,
-                # and vice versa.
-                for flat_attr in flattener_attributes.copy():
-                    attr = flattener_attributes.pop(flat_attr)
-
-                    x = attr.split('/')
-                    groups = x[1:-1]
-
-                    if groups:
-                        g['global_attributes'].pop(flat_attr)
-
-                        group_attr = x[-1]
-                        flattener_attributes.setdefault(
-                            tuple(groups), {}
-                        )[group_attr] = nc.getncattr(flat_attr)
-            # --- End: if
-
-            # Remove flattener attributes from the global attributes
-            for attr in ('__flattener_name_mapping_variables',
-                         '__flattener_name_mapping_dimensions',
-                         '__flattener_name_mapping_attributes'):
-                g['global_attributes'].pop(attr, None)
+            flat = self._flatten_names(nc)
+            nc_variables = flat['variables']
+            nc_dimensions = flat['dimensions']
+            flattener_variables = flat['flattener_variables']
+            flattener_dimensions = flat['flattener_dimensions']
+            flattener_attributes = flat['flattener_attributes']
+        else:
+            nc_variables = nc.variables
+            nc_dimensions = nc.dimensions
+            flattener_variables = {}
+            flattener_dimensions = {}
+            flattener_attributes = {}
         # --- End: if
 
-        for ncvar in nc.variables:
+        for ncvar, variable in nc_variables.items():
             ncvar_basename = ncvar
             groups = ()
             group_attributes = {}
 
-            variable = nc.variables[ncvar]
-
             # --------------------------------------------------------
             # Specify the group structure for each variable (CF>=1.8)
             # TODO
@@ -941,14 +1410,8 @@ class NetCDFRead(IORead):
                 groups = tuple(ncvar.split('/')[1:-1])
 
                 if groups:
-                    # This variable is in a group. Remove the group
-                    # structure that was prepended to the netCDF
-                    # variable name by the netCDF flattener.
-                    ncvar_basename = re.sub(
-                        '^{}{}'.format(_flattener_separator.join(groups),
-                                       _flattener_separator),
-                        '', ncvar_flat
-                    )
+                    # This variable is in a group
+                    ncvar_basename = variable.name
 
                     # ------------------------------------------------
                     # Group attributes. Note that, currently,
@@ -964,11 +1427,6 @@ class NetCDFRead(IORead):
                         group_attributes.update(
                             flattener_attributes[hierarchy]
                         )
-                else:
-                    # Remove the leading / from the absolute netCDF
-                    # variable path
-                    ncvar = ncvar[1:]
-                    flattener_variables[ncvar] = ncvar
             # --- End: if
 
             variable_attributes[ncvar] = {}
@@ -989,7 +1447,18 @@ class NetCDFRead(IORead):
                     pass
             # --- End: for
 
-            variable_dimensions[ncvar] = tuple(variable.dimensions)
+            if has_groups:
+                # Replace references to other variables and
+                # dimensions with their flattened names
+                variable_attributes[ncvar].update(
+                    flat['references'][ncvar_flat])
+                variable_dimensions[ncvar] = tuple([
+                    flattener_dimensions[ncdim]
+                    for ncdim in flat['variable_dimensions'][ncvar_flat]
+                ])
+            else:
+                variable_dimensions[ncvar] = tuple(variable.dimensions)
+
             variable_dataset[ncvar] = nc
             variable_filename[ncvar] = g['filename']
             variables[ncvar] = variable
@@ -1001,41 +1470,31 @@ class NetCDFRead(IORead):
 
         # Populate dimensions_groups abd dimension_basename
         # dictionaries
-        for ncdim in nc.dimensions:
-            ncdim_org = ncdim
+        internal_dimension_sizes = {}
+        for ncdim, dimension in nc_dimensions.items():
             ncdim_basename = ncdim
             groups = ()
-            ncdim_basename = ncdim
 
             if has_groups:
-                # Replace the flattened variable name with its
+                # Replace the flattened dimension name with its
                 # absolute path.
-                ncdim_flat = ncdim
-                ncdim = flattener_dimensions[ncdim_flat]
+                ncdim = flattener_dimensions[ncdim]
 
                 groups = tuple(ncdim.split('/')[1:-1])
 
                 if groups:
                     # This dimension is in a group.
-                    ncdim_basename = re.sub(
-                        '^{}{}'.format(_flattener_separator.join(groups),
-                                       _flattener_separator),
-                        '', ncdim_flat
-                    )
+                    ncdim_basename = dimension.name
             # --- End: if
 
             dimension_groups[ncdim] = groups
             dimension_basename[ncdim] = ncdim_basename
 
-            dimension_isunlimited[ncdim] = (
-                nc.dimensions[ncdim_org].isunlimited()
-            )
+            dimension_isunlimited[ncdim] = dimension.isunlimited()
 
-        if has_groups:
-            variable_dimensions = {
-                name: tuple([flattener_dimensions[ncdim] for ncdim in value])
-                for name, value in variable_dimensions.items()
-            }
+            # The netCDF dimensions of the parent file
+            internal_dimension_sizes[ncdim] = dimension.size
+        # --- End: for
 
         logger.debug("    General read variables:")  # pragma: no cover
         logger.debug(
@@ -1071,15 +1530,6 @@ class NetCDFRead(IORead):
         g['internal_variables'] = set(variables)
 
         # The netCDF dimensions of the parent file
-        internal_dimension_sizes = {}
-        for name, dimension in nc.dimensions.items():
-            internal_dimension_sizes[name] = dimension.size
-
-        if g['has_groups']:
-            internal_dimension_sizes = {
-                flattener_dimensions[name]: value
-                for name, value in internal_dimension_sizes.items()}
-
         g['internal_dimension_sizes'] = internal_dimension_sizes
 
         # The group structure for each variable. Variables in the root
@@ -1486,38 +1936,174 @@ class NetCDFRead(IORead):
         # ------------------------------------------------------------
         return out
 
-    def _check_valid(self, field, construct):
-        '''Issue a warning if a construct with data has valid_[min|max|range]
-    properties.
+    def scan(self, filename, default_version=None, verbose=None):
+        '''Summarise the field constructs in a netCDF file without
+    creating them.
 
-    .. versionadded:: (cfdm) 1.8.3
+    Only the netCDF header is inspected, so no data arrays are read
+    and no field or metadata constructs are created. The netCDF
+    variables that would become field constructs are selected in the
+    same way as by `read`.
 
-    :Parameters:
+    .. versionadded:: (cfdm) 1.8.8.0
 
-        field: `Field`
-            The parent field construct.
+    .. seealso:: `read`
 
-        construct: Construct or Bounds
-            The construct that may have valid_[min|max|range]
-            properties. May also be the parent field construct or
-            Bounds.
+    :Parameters:
+
+        filename: `str`
+            The file name or OPenDAP URL of the dataset.
 
     :Returns:
 
-        `None`
+        `list` of `dict`
+            A summary of each field construct that would be created
+            by `read`, sorted by netCDF variable name. See
+            `cfdm.scan` for details.
 
         '''
-        # Check the bounds, if any.
-        if self.implementation.has_bounds(construct):
-            bounds = self.implementation.get_bounds(construct)
-            self._check_valid(field, bounds)
+        g = self.read(filename, default_version=default_version,
+                      verbose=verbose, _scan_only=True)
 
-        x = sorted(self.read_vars['valid_properties'].intersection(
-            self.implementation.get_properties(construct)))
-        if not x:
-            return
+        try:
+            summaries = {}
+            for ncvar in g['variables']:
+                if ncvar not in g['do_not_create_field']:
+                    summaries[ncvar] = self._scan_field(ncvar)
+            # --- End: for
 
-        # Still here?
+            # --------------------------------------------------------
+            # Discard netCDF variables that are referenced by other
+            # netCDF variables, unless all of their referencers are
+            # themselves referenced
+            # --------------------------------------------------------
+            referenced_variables = [ncvar for ncvar in sorted(summaries)
+                                    if not self._is_unreferenced(ncvar)]
+
+            for ncvar in referenced_variables[:]:
+                if all(referencer in referenced_variables
+                       for referencer in g['referencers'][ncvar]):
+                    referenced_variables.remove(ncvar)
+            # --- End: for
+        finally:
+            self.file_close()
+
+        return [summary for ncvar, summary in sorted(summaries.items())
+                if ncvar not in referenced_variables]
+
+    def _scan_field(self, field_ncvar):
+        '''Summarise the field construct for a netCDF variable.
+
+    The netCDF variables that the field construct would reference are
+    found and counted with `_field_references`, as by `_create_field`,
+    but no constructs are created.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        field_ncvar: `str`
+            The name of the netCDF variable to be summarised.
+
+    :Returns:
+
+        `dict`
+            The summary of the field construct.
+
+        '''
+        g = self.read_vars
+
+        # Reset 'vertical_crs'
+        g['vertical_crs'] = {}
+
+        g['dataset_compliance'][field_ncvar] = {
+            'CF version': self.implementation.get_cf_version(),
+            'dimensions': g['variable_dimensions'][field_ncvar],
+            'non-compliance': {}
+        }
+
+        properties = g['global_attributes'].copy()
+        if g['has_groups']:
+            properties.update(g['variable_group_attributes'][field_ncvar])
+
+        properties.update(g['variable_attributes'][field_ncvar])
+
+        for prop in ('cell_methods', 'add_offset', 'scale_factor'):
+            properties.pop(prop, None)
+
+        if g['CF>=1.8']:
+            properties.pop('geometry', None)
+
+        self._field_references(field_ncvar, properties)
+
+        for prop in ('coordinates', 'grid_mapping', 'cell_measures',
+                     'ancillary_variables'):
+            properties.pop(prop, None)
+
+        field_ncdimensions = self._ncdimensions(field_ncvar)
+
+        shape = []
+        for ncdim in field_ncdimensions:
+            if ncdim in g['new_dimensions']:
+                shape.append(g['new_dimensions'][ncdim])
+            else:
+                shape.append(g['internal_dimension_sizes'][ncdim])
+        # --- End: for
+
+        # ------------------------------------------------------------
+        # Identity
+        # ------------------------------------------------------------
+        identity = properties.get('standard_name')
+        if identity is None:
+            for prop in ('cf_role', 'axis', 'long_name'):
+                if prop in properties:
+                    identity = '{0}={1}'.format(prop, properties[prop])
+                    break
+            else:
+                identity = 'ncvar%{0}'.format(field_ncvar)
+        # --- End: if
+
+        return {
+            'ncvar': field_ncvar,
+            'identity': identity,
+            'shape': tuple(shape),
+            'dimensions': tuple([self._ncdim_abspath(ncdim)
+                                 for ncdim in field_ncdimensions]),
+            'properties': properties,
+        }
+
+    def _check_valid(self, field, construct):
+        '''Issue a warning if a construct with data has valid_[min|max|range]
+    properties.
+
+    .. versionadded:: (cfdm) 1.8.3
+
+    :Parameters:
+
+        field: `Field`
+            The parent field construct.
+
+        construct: Construct or Bounds
+            The construct that may have valid_[min|max|range]
+            properties. May also be the parent field construct or
+            Bounds.
+
+    :Returns:
+
+        `None`
+
+        '''
+        # Check the bounds, if any.
+        if self.implementation.has_bounds(construct):
+            bounds = self.implementation.get_bounds(construct)
+            self._check_valid(field, bounds)
+
+        x = sorted(self.read_vars['valid_properties'].intersection(
+            self.implementation.get_properties(construct)))
+        if not x:
+            return
+
+        # Still here?
         if self.implementation.is_field(construct):
             construct = ""
         else:
@@ -2067,7 +2653,7 @@ class NetCDFRead(IORead):
             # variable in this case.
             # --------------------------------------------------------
             nodes_per_geometry = self.implementation.initialise_Count()
-            size = g['nc'].dimensions[node_dimension].size
+            size = g['internal_dimension_sizes'][node_dimension]
             ones = self.implementation.initialise_Data(
                 array=numpy.ones((size,), dtype='int32'), copy=False)
             self.implementation.set_data(nodes_per_geometry, data=ones)
@@ -2721,8 +3307,9 @@ class NetCDFRead(IORead):
         '''
         g = self.read_vars
 
-        # Reset 'domain_ancillary_key'
+        # Reset 'domain_ancillary_key' and 'vertical_crs'
         g['domain_ancillary_key'] = {}
+        g['vertical_crs'] = {}
 
         nc = g['variable_dataset'][field_ncvar]
 
@@ -2833,6 +3420,12 @@ class NetCDFRead(IORead):
                 self.implementation.nc_set_geometry_variable(f, geometry)
         # --- End: if
 
+        # ------------------------------------------------------------
+        # Find the CF-compliant netCDF variables that are referenced
+        # by the data variable, and count the references to them
+        # ------------------------------------------------------------
+        references = self._field_references(field_ncvar, field_properties)
+
         # Map netCDF dimension names to domain axis names.
         #
         # For example: {'lat': 'dim0', 'time': 'dim1'}
@@ -2853,12 +3446,9 @@ class NetCDFRead(IORead):
         # ------------------------------------------------------------
         field_ncdimensions = self._ncdimensions(field_ncvar)
 
-        field_groups = g['variable_groups'][field_ncvar]
-
         for ncdim in field_ncdimensions:
-            ncvar, method = self._find_coordinate_variable(field_ncvar,
-                                                           field_groups,
-                                                           ncdim)
+            ncvar, method = references['dimension_coordinates'].get(
+                ncdim, (None, ''))
 
             if ncvar is not None:
                 # There is a Unidata coordinate variable for this
@@ -2891,13 +3481,6 @@ class NetCDFRead(IORead):
                     field=f, construct=coord,
                     axes=[axis], copy=False)
 
-                self._reference(ncvar, field_ncvar)
-                if coord.has_bounds():
-                    bounds = self.implementation.get_bounds(coord)
-                    self._reference(
-                        self.implementation.nc_get_variable(bounds),
-                        field_ncvar)
-
                 # Set unlimited status of axis
 #                if nc.dimensions[ncdim].isunlimited():
                 if g['dimension_isunlimited'][ncdim]:
@@ -2957,19 +3540,7 @@ class NetCDFRead(IORead):
         coordinates = self.implementation.del_property(f, 'coordinates', None)
 
         if coordinates is not None:
-            parsed_coordinates = self._split_string_by_white_space(
-                field_ncvar, coordinates, variables=True)
-
-            for ncvar in parsed_coordinates:
-                # Skip dimension coordinates which are in the list
-                if ncvar in field_ncdimensions:
-                    continue
-
-                cf_compliant = self._check_auxiliary_scalar_coordinate(
-                    field_ncvar, ncvar, coordinates)
-                if not cf_compliant:
-                    continue
-
+            for ncvar in references['coordinates']:
                 # Set dimensions for this variable
                 dimensions = self._get_domain_axes(ncvar)
 
@@ -3042,13 +3613,6 @@ class NetCDFRead(IORead):
                         axes=[axis],
                         copy=False)
 
-                    self._reference(ncvar, field_ncvar)
-                    if self.implementation.has_bounds(coord):
-                        bounds = self.implementation.get_bounds(coord)
-                        self._reference(
-                            self.implementation.nc_get_variable(bounds),
-                            field_ncvar)
-
                     dimensions = [axis]
                     ncvar_to_key[ncvar] = dim
 
@@ -3063,13 +3627,6 @@ class NetCDFRead(IORead):
                     aux = self.implementation.set_auxiliary_coordinate(
                         f, coord, axes=dimensions, copy=False)
 
-                    self._reference(ncvar, field_ncvar)
-                    if self.implementation.has_bounds(coord):
-                        bounds = self.implementation.get_bounds(coord)
-                        self._reference(
-                            self.implementation.nc_get_variable(bounds),
-                            field_ncvar)
-
                     ncvar_to_key[ncvar] = aux
 
                 if scalar:
@@ -3133,7 +3690,6 @@ class NetCDFRead(IORead):
                     axes=(g['ncdim_to_axis'][geometry_dimension],),
                     copy=False)
 
-                self._reference(node_ncvar, field_ncvar)
                 ncvar_to_key[node_ncvar] = aux
         # --- End: if
 
@@ -3149,27 +3705,14 @@ class NetCDFRead(IORead):
                 # just contains geometry nodes
                 continue
 
-            formula_terms = (
-                g['variable_attributes'][coord_ncvar].get('formula_terms'))
-            if formula_terms is None:
-                # This coordinate does not have a formula_terms
-                # attribute
+            if coord_ncvar not in references['formula_terms']:
+                # This coordinate does not have a CF-compliant
+                # formula_terms attribute
                 continue
 
-            if coord_ncvar not in g['formula_terms']:
-                self._check_formula_terms(
-                    field_ncvar,
-                    coord_ncvar,
-                    formula_terms,
-                    z_ncdim=g['variable_dimensions'][coord_ncvar][0])
-
-            ok = True
             domain_ancillaries = []
-            for term, ncvar in (
-                    g['formula_terms'][coord_ncvar]['coord'].items()):
-                if ncvar is None:
-                    continue
-
+            for term, ncvar, bounds in (
+                    references['formula_terms'][coord_ncvar]):
                 # Set dimensions
                 axes = self._get_domain_axes(ncvar)
 
@@ -3177,36 +3720,15 @@ class NetCDFRead(IORead):
                     domain_anc = self._copy_construct('domain_ancillary',
                                                       field_ncvar, ncvar)
                 else:
-                    bounds = (
-                        g['formula_terms'][coord_ncvar]['bounds'].get(term))
-                    if bounds == ncvar:
-                        bounds = None
-
                     domain_anc = self._create_domain_ancillary(
                         field_ncvar,
                         ncvar,
                         f,
                         bounds_ncvar=bounds)
 
-                if len(axes) == len(self._ncdimensions(ncvar)):
-                    domain_ancillaries.append((ncvar, domain_anc, axes))
-                else:
-                    # The domain ancillary variable spans a dimension
-                    # that is not spanned by its parent data variable
-                    self._add_message(
-                        field_ncvar, ncvar,
-                        message=('Formula terms variable',
-                                 'spans incorrect dimensions'),
-                        attribute={coord_ncvar+':formula_terms':
-                                   formula_terms},
-                        dimensions=g['variable_dimensions'][ncvar])
-                    ok = False
+                domain_ancillaries.append((ncvar, domain_anc, axes))
             # --- End: for
 
-            if not ok:
-                # Move on to the next coordinate
-                continue
-
             # Still here? Create a formula terms coordinate reference.
             for ncvar, domain_anc, axes in domain_ancillaries:
                 logger.detail(
@@ -3216,13 +3738,6 @@ class NetCDFRead(IORead):
                 da_key = self.implementation.set_domain_ancillary(
                     field=f, construct=domain_anc, axes=axes, copy=False)
 
-                self._reference(ncvar, field_ncvar)
-                if self.implementation.has_bounds(domain_anc):
-                    bounds = self.implementation.get_bounds(domain_anc)
-                    self._reference(
-                        self.implementation.nc_get_variable(bounds),
-                        field_ncvar)
-
                 if ncvar not in ncvar_to_key:
                     ncvar_to_key[ncvar] = da_key
 
@@ -3252,13 +3767,8 @@ class NetCDFRead(IORead):
         grid_mapping = self.implementation.del_property(
             f, 'grid_mapping', None)
         if grid_mapping is not None:
-            parsed_grid_mapping = self._parse_grid_mapping(
-                field_ncvar, grid_mapping)
-
-            cf_compliant = self._check_grid_mapping(field_ncvar,
-                                                    grid_mapping,
-                                                    parsed_grid_mapping)
-            if not cf_compliant:
+            parsed_grid_mapping = references['grid_mapping']
+            if parsed_grid_mapping is None:
                 logger.warning(
                     "        Bad grid_mapping: {}".format(grid_mapping)
                 )  # pragma: no cover
@@ -3360,8 +3870,6 @@ class NetCDFRead(IORead):
                             "        [l] Inserting {!r}".format(coordref)
                         )  # pragma: no cover
 
-                        self._reference(grid_mapping_ncvar,
-                                        field_ncvar)
                         ncvar_to_key[grid_mapping_ncvar] = key
                 # --- End: for
             # --- End: if
@@ -3372,12 +3880,8 @@ class NetCDFRead(IORead):
         # ------------------------------------------------------------
         measures = self.implementation.del_property(f, 'cell_measures', None)
         if measures is not None:
-            parsed_cell_measures = self._parse_x(field_ncvar, measures)
-
-            cf_compliant = self._check_cell_measures(field_ncvar,
-                                                     measures,
-                                                     parsed_cell_measures)
-            if cf_compliant:
+            parsed_cell_measures = references['cell_measures']
+            if parsed_cell_measures is not None:
                 for x in parsed_cell_measures:
                     measure, ncvars = list(x.items())[0]
                     ncvar = ncvars[0]
@@ -3401,12 +3905,6 @@ class NetCDFRead(IORead):
                         field=f, construct=cell,
                         axes=axes, copy=False)
 
-                    # Count a reference to the cell measure ...
-                    if ncvar != field_ncvar:
-                        # ... but only if it is not the same as its
-                        # parent data variable (introduced at v1.8.6).
-                        self._reference(ncvar, field_ncvar)
-
                     ncvar_to_key[ncvar] = key
 
                     if ncvar in g['external_variables']:
@@ -3458,14 +3956,8 @@ class NetCDFRead(IORead):
         ancillary_variables = self.implementation.del_property(
             f, 'ancillary_variables', None)
         if ancillary_variables is not None:
-            parsed_ancillary_variables = self._split_string_by_white_space(
-                field_ncvar,
-                ancillary_variables, variables=True)
-            cf_compliant = self._check_ancillary_variables(
-                field_ncvar,
-                ancillary_variables,
-                parsed_ancillary_variables)
-            if not cf_compliant:
+            parsed_ancillary_variables = references['ancillary_variables']
+            if parsed_ancillary_variables is None:
                 pass
             else:
                 for ncvar in parsed_ancillary_variables:
@@ -3484,7 +3976,6 @@ class NetCDFRead(IORead):
                     )  # pragma: no cover
                     key = self.implementation.set_field_ancillary(
                         field=f, construct=field_anc, axes=axes, copy=False)
-                    self._reference(ncvar, field_ncvar)
 
                     ncvar_to_key[ncvar] = key
         # --- End: if
@@ -3502,6 +3993,337 @@ class NetCDFRead(IORead):
         # Return the finished field
         return f
 
+    def _field_references(self, field_ncvar, properties):
+        '''Find and count the netCDF variables referenced by a data variable.
+
+    The netCDF variables that would be contained in the field
+    construct created from the data variable are found and checked
+    for CF compliance, and the reference count of each CF-compliant
+    one is incremented by one. The field construct is created from
+    the returned variables by `_create_field`, and `_scan_field`
+    counts the same references without creating any constructs, so
+    the netCDF variables that become field constructs are the same
+    for both.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `_find_bounds`, `_reference`
+
+    :Parameters:
+
+        field_ncvar: `str`
+            The netCDF variable name of the data variable.
+
+        properties: `dict`
+            The netCDF attributes of the data variable, combined with
+            any global and group attributes.
+
+    :Returns:
+
+        `dict`
+            The CF-compliant referenced netCDF variables. The
+            ``'dimension_coordinates'`` key maps netCDF dimensions to
+            their coordinate variables and how they were found; the
+            ``'coordinates'`` key lists the scalar and auxiliary
+            coordinate variables; the ``'formula_terms'`` key maps
+            coordinate variables to their ``(term, ncvar,
+            bounds_ncvar)`` formula terms; and the ``'grid_mapping'``,
+            ``'cell_measures'`` and ``'ancillary_variables'`` keys
+            are the parsed attributes, or `None` if they are missing
+            or not CF-compliant.
+
+        '''
+        g = self.read_vars
+
+        out = {
+            'dimension_coordinates': {},
+            'coordinates': [],
+            'formula_terms': {},
+            'grid_mapping': None,
+            'cell_measures': None,
+            'ancillary_variables': None,
+        }
+
+        def reference(ncvar, bounds_ncvar=None):
+            # Count a reference to a variable and to its bounds
+            self._reference(ncvar, field_ncvar)
+            bounds_ncvar, _ = self._find_bounds(field_ncvar, ncvar,
+                                                bounds_ncvar=bounds_ncvar)
+            if bounds_ncvar is not None:
+                self._reference(bounds_ncvar, field_ncvar)
+
+        field_ncdimensions = self._ncdimensions(field_ncvar)
+        field_groups = g['variable_groups'][field_ncvar]
+
+        # The netCDF variables of the field's coordinate and domain
+        # ancillary constructs
+        construct_ncvars = set()
+        coordinate_ncvars = []
+
+        # ------------------------------------------------------------
+        # Dimension coordinates
+        # ------------------------------------------------------------
+        for ncdim in field_ncdimensions:
+            ncvar, method = self._find_coordinate_variable(field_ncvar,
+                                                           field_groups,
+                                                           ncdim)
+            if ncvar is not None:
+                out['dimension_coordinates'][ncdim] = (ncvar, method)
+                reference(ncvar)
+                coordinate_ncvars.append(ncvar)
+        # --- End: for
+
+        # ------------------------------------------------------------
+        # Scalar and auxiliary coordinates
+        # ------------------------------------------------------------
+        coordinates = properties.get('coordinates')
+        if coordinates is not None:
+            parsed_coordinates = self._split_string_by_white_space(
+                field_ncvar, coordinates, variables=True)
+
+            for ncvar in parsed_coordinates:
+                # Skip dimension coordinates which are in the list
+                if ncvar in field_ncdimensions:
+                    continue
+
+                cf_compliant = self._check_auxiliary_scalar_coordinate(
+                    field_ncvar, ncvar, coordinates)
+                if not cf_compliant:
+                    continue
+
+                out['coordinates'].append(ncvar)
+                reference(ncvar)
+                coordinate_ncvars.append(ncvar)
+        # --- End: if
+
+        construct_ncvars.update(coordinate_ncvars)
+
+        # ------------------------------------------------------------
+        # Geometry node coordinates (CF>=1.8), which are either the
+        # bounds of auxiliary coordinates or auxiliary coordinates
+        # themselves
+        # ------------------------------------------------------------
+        geometry = self._get_geometry(field_ncvar)
+        if geometry is not None:
+            for ncvar in geometry['node_coordinates']:
+                self._reference(ncvar, field_ncvar)
+                construct_ncvars.add(ncvar)
+        # --- End: if
+
+        # ------------------------------------------------------------
+        # Formula terms
+        # ------------------------------------------------------------
+        vertical_ncvars = set()
+        for coord_ncvar in coordinate_ncvars:
+            formula_terms = (
+                g['variable_attributes'][coord_ncvar].get('formula_terms'))
+            if formula_terms is None:
+                # This coordinate does not have a formula_terms
+                # attribute
+                continue
+
+            if coord_ncvar not in g['formula_terms']:
+                self._check_formula_terms(
+                    field_ncvar,
+                    coord_ncvar,
+                    formula_terms,
+                    z_ncdim=g['variable_dimensions'][coord_ncvar][0])
+
+            ok = True
+            terms = []
+            for term, ncvar in (
+                    g['formula_terms'][coord_ncvar]['coord'].items()):
+                if ncvar is None:
+                    continue
+
+                if not set(self._ncdimensions(ncvar)).issubset(
+                        field_ncdimensions):
+                    # The domain ancillary variable spans a dimension
+                    # that is not spanned by its parent data variable
+                    self._add_message(
+                        field_ncvar, ncvar,
+                        message=('Formula terms variable',
+                                 'spans incorrect dimensions'),
+                        attribute={coord_ncvar+':formula_terms':
+                                   formula_terms},
+                        dimensions=g['variable_dimensions'][ncvar])
+                    ok = False
+                    continue
+
+                bounds_ncvar = (
+                    g['formula_terms'][coord_ncvar]['bounds'].get(term))
+                if bounds_ncvar == ncvar:
+                    bounds_ncvar = None
+
+                terms.append((term, ncvar, bounds_ncvar))
+            # --- End: for
+
+            if not ok:
+                # Move on to the next coordinate
+                continue
+
+            for term, ncvar, bounds_ncvar in terms:
+                reference(ncvar, bounds_ncvar=bounds_ncvar)
+                construct_ncvars.add(ncvar)
+
+            out['formula_terms'][coord_ncvar] = terms
+            vertical_ncvars.add(coord_ncvar)
+        # --- End: for
+
+        # ------------------------------------------------------------
+        # Grid mappings
+        # ------------------------------------------------------------
+        grid_mapping = properties.get('grid_mapping')
+        if grid_mapping is not None:
+            parsed_grid_mapping = self._parse_grid_mapping(field_ncvar,
+                                                           grid_mapping)
+            if self._check_grid_mapping(field_ncvar, grid_mapping,
+                                        parsed_grid_mapping):
+                out['grid_mapping'] = parsed_grid_mapping
+
+                for x in parsed_grid_mapping:
+                    grid_mapping_ncvar, coordinates = list(x.items())[0]
+
+                    # A grid mapping that only applies to coordinates
+                    # which already have a formula terms coordinate
+                    # reference does not create its own coordinate
+                    # reference
+                    coordinates = construct_ncvars.intersection(
+                        coordinates)
+                    if (coordinates
+                            and coordinates.issubset(vertical_ncvars)):
+                        continue
+
+                    self._reference(grid_mapping_ncvar, field_ncvar)
+        # --- End: if
+
+        # ------------------------------------------------------------
+        # Cell measures
+        # ------------------------------------------------------------
+        measures = properties.get('cell_measures')
+        if measures is not None:
+            parsed_cell_measures = self._parse_x(field_ncvar, measures)
+            if self._check_cell_measures(field_ncvar, measures,
+                                         parsed_cell_measures):
+                out['cell_measures'] = parsed_cell_measures
+
+                for x in parsed_cell_measures:
+                    ncvar = list(x.values())[0][0]
+
+                    # Count a reference to the cell measure ...
+                    if ncvar != field_ncvar:
+                        # ... but only if it is not the same as its
+                        # parent data variable (introduced at v1.8.6).
+                        self._reference(ncvar, field_ncvar)
+        # --- End: if
+
+        # ------------------------------------------------------------
+        # Field ancillaries
+        # ------------------------------------------------------------
+        ancillary_variables = properties.get('ancillary_variables')
+        if ancillary_variables is not None:
+            parsed_ancillary_variables = self._split_string_by_white_space(
+                field_ncvar, ancillary_variables, variables=True)
+            if self._check_ancillary_variables(field_ncvar,
+                                               ancillary_variables,
+                                               parsed_ancillary_variables):
+                out['ancillary_variables'] = parsed_ancillary_variables
+
+                for ncvar in parsed_ancillary_variables:
+                    self._reference(ncvar, field_ncvar)
+        # --- End: if
+
+        return out
+
+    def _find_bounds(self, field_ncvar, ncvar, bounds_ncvar=None,
+                     nodes=False):
+        '''Find the CF-compliant bounds of a netCDF variable.
+
+    Unless they are given, the bounds are named by the variable's
+    ``bounds``, ``climatology`` or, for geometries, ``nodes``
+    attribute. The bounds are only checked for CF compliance the first
+    time that they are found, so that the checks are not repeated when
+    a construct is created after its references have been counted.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `_create_bounded_construct`, `_field_references`
+
+    :Parameters:
+
+        field_ncvar: `str`
+            The netCDF variable name of the parent data variable.
+
+        ncvar: `str` or `None`
+            The netCDF variable name of the variable. See the *nodes*
+            parameter.
+
+        bounds_ncvar: `str`, optional
+            The netCDF variable name of the bounds. By default the
+            bounds are found from the variable's attributes.
+
+        nodes: `bool`
+            Set to True only if and only if *bounds_ncvar* is a node
+            coordinates variable. In this case *ncvar* must be
+            `None`.
+
+    :Returns:
+
+        (`str`, `str`) or (`None`, `str`)
+            The netCDF variable name of the CF-compliant bounds, or
+            `None` if there are none, and the name of the attribute
+            that names them.
+
+        '''
+        g = self.read_vars
+
+        key = (ncvar, bounds_ncvar, nodes)
+        found = g['found_bounds'].get(key)
+        if found is not None:
+            return found
+
+        geometry = self._get_geometry(field_ncvar)
+
+        attribute = 'bounds'
+        if bounds_ncvar is None:
+            attributes = g['variable_attributes'][ncvar]
+            bounds_ncvar = attributes.get('bounds')
+            if bounds_ncvar is None:
+                bounds_ncvar = attributes.get('climatology')
+                if bounds_ncvar is not None:
+                    attribute = 'climatology'
+                elif geometry:
+                    bounds_ncvar = attributes.get('nodes')
+                    if bounds_ncvar is not None:
+                        attribute = 'nodes'
+        elif nodes:
+            attribute = 'nodes'
+
+        if bounds_ncvar:
+            if g['has_groups']:
+                # Replace a flattened name with an absolute name
+                bounds_ncvar = g['flattener_variables'].get(
+                    bounds_ncvar, bounds_ncvar)
+
+            if attribute == 'nodes':
+                # Check geometry node coordinate bounds
+                cf_compliant = self._check_geometry_node_coordinates(
+                    field_ncvar, bounds_ncvar, geometry)
+            else:
+                # Check "normal" bounds
+                cf_compliant = self._check_bounds(
+                    field_ncvar, ncvar, attribute, bounds_ncvar)
+
+            if not cf_compliant:
+                bounds_ncvar = None
+        else:
+            bounds_ncvar = None
+
+        found = (bounds_ncvar, attribute)
+        g['found_bounds'][key] = found
+
+        return found
+
     def _find_coordinate_variable(self, field_ncvar, field_groups,
                                   ncdim):
         '''Find a Unidata coordinate variable for a particular CF-netCDF data
@@ -3997,23 +4819,18 @@ class NetCDFRead(IORead):
         # ------------------------------------------------------------
         geometry = self._get_geometry(field_ncvar)
 
-        has_bounds = False
-        attribute = 'bounds'  # TODO Bad default? consider if bounds != None
-
-        # If there are bounds then find the name of the attribute that
-        # names them, and the netCDF variable name of the bounds.
+        # If there are bounds then remove the attribute that names
+        # them from the properties, and find the netCDF variable name
+        # of the CF-compliant bounds.
         if bounds_ncvar is None:
-            bounds_ncvar = properties.pop('bounds', None)
-            if bounds_ncvar is None:
-                bounds_ncvar = properties.pop('climatology', None)
-                if bounds_ncvar is not None:
-                    attribute = 'climatology'
-                elif geometry:
-                    bounds_ncvar = properties.pop('nodes', None)
-                    if bounds_ncvar is not None:
-                        attribute = 'nodes'
-        elif nodes:
-            attribute = 'nodes'
+            if properties.pop('bounds', None) is None:
+                if properties.pop('climatology', None) is None and geometry:
+                    properties.pop('nodes', None)
+        # --- End: if
+
+        bounds_ncvar, _ = self._find_bounds(field_ncvar, ncvar,
+                                            bounds_ncvar=bounds_ncvar,
+                                            nodes=nodes)
 
         if dimension:
             properties.pop('compress', None)
@@ -4047,28 +4864,6 @@ class NetCDFRead(IORead):
         # ------------------------------------------------------------
         # Add any bounds
         # ------------------------------------------------------------
-        if bounds_ncvar:
-            if g['has_groups']:
-                # Replace a flattened name with an absolute name
-                bounds_ncvar = g['flattener_variables'].get(
-                    bounds_ncvar, bounds_ncvar)
-
-            if attribute == 'nodes':
-                # Check geomerty node coordinate boounds
-                cf_compliant = self._check_geometry_node_coordinates(
-                    field_ncvar,
-                    bounds_ncvar,
-                    geometry)
-            else:
-                # Check "normal" boounds
-                cf_compliant = self._check_bounds(
-                    field_ncvar, ncvar,
-                    attribute,
-                    bounds_ncvar)
-
-            if not cf_compliant:
-                bounds_ncvar = None
-
         if bounds_ncvar:
             bounds = self.implementation.initialise_Bounds()
 
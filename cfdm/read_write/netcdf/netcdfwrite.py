@@ -1,4 +1,6 @@
 import copy
+import hashlib
+import itertools
 import logging
 import os
 import re
@@ -16,6 +18,12 @@ from . import constants
 
 from ...decorators import _manage_log_level_via_verbosity
 
+from ...functions import (atol,
+                          close_files,
+                          rtol,
+                          write_block_size,
+                          _block_shape)
+
 
 logger = logging.getLogger(__name__)
 
@@ -1107,7 +1115,29 @@ class NetCDFWrite(IOWrite):
 
         seen = g['seen']
 
-        for value in seen.values():
+        self._index_seen()
+
+        bucket = g['seen_index'].get(self._seen_key(variable))
+        if bucket is None:
+            return False
+
+        # Still here? Then there are variables in the 'seen'
+        # dictionary which might be equal to the input variable.
+        #
+        # First try those with identical array values, then try
+        # those whose sampled array values are equal to within the
+        # numerical tolerance used by 'equals'.
+        self._update_seen_bucket(bucket)
+
+        info = self._seen_info(variable)
+        matches = list(bucket['digests'].get(info['digest'], ()))
+        if len(matches) < len(bucket['ids']):
+            matches.extend([i for i in self._seen_sample_matches(info,
+                                                                 bucket)
+                            if i not in matches])
+
+        for i in matches:
+            value = seen[i]
             if ncdims is not None and ncdims != value['ncdims']:
                 # The netCDF dimensions (names and order) of the input
                 # variable are different to those of this variable in
@@ -1127,6 +1157,211 @@ class NetCDFWrite(IOWrite):
 
         return False
 
+    def _index_seen(self):
+        '''Add new variables in g['seen'] to the g['seen_index'] dictionary.
+
+    The g['seen_index'] dictionary maps the key returned by
+    `_seen_key` to a "bucket" of the variables in g['seen'] that have
+    that key. Variables that have different keys can not be equal,
+    and so need not be compared.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Returns:
+
+        `None`
+
+        '''
+        g = self.write_vars
+
+        seen = g['seen']
+        n = g['seen_n_indexed']
+        if n == len(seen):
+            return
+
+        # Variables are only ever added to the end of g['seen']
+        seen_index = g['seen_index']
+        for i in list(seen)[n:]:
+            key = self._seen_key(seen[i]['variable'])
+            bucket = seen_index.get(key)
+            if bucket is None:
+                bucket = {'ids': [], 'n_info': 0, 'digests': {},
+                          'samples': [], 'sample_masks': [],
+                          'sampled': True}
+                seen_index[key] = bucket
+
+            bucket['ids'].append(i)
+
+        g['seen_n_indexed'] = len(seen)
+
+    def _update_seen_bucket(self, bucket):
+        '''Add the array digests and samples of new variables to a bucket.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        bucket: `dict`
+            A bucket of the g['seen_index'] dictionary.
+
+    :Returns:
+
+        `None`
+
+        '''
+        seen = self.write_vars['seen']
+
+        ids = bucket['ids']
+        for i in ids[bucket['n_info']:]:
+            info = self._seen_info(seen[i]['variable'])
+            bucket['digests'].setdefault(info['digest'], []).append(i)
+            if info['sample'] is None:
+                bucket['sampled'] = False
+            else:
+                bucket['samples'].append(info['sample'])
+                bucket['sample_masks'].append(info['sample_mask'])
+        # --- End: for
+
+        bucket['n_info'] = len(ids)
+
+    def _seen_key(self, variable):
+        '''Return the key of a variable in the g['seen_index'] dictionary.
+
+    Variables that are equal always have the same key, but variables
+    with the same key need not be equal.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        variable:
+            The variable.
+
+    :Returns:
+
+        `tuple` or `None`
+            The key, or `None` if the variable has no data or
+            properties.
+
+    **Examples:**
+
+    >>> w._seen_key(coord)
+    ((180,), '<f8', frozenset({'standard_name', 'units'}))
+
+        '''
+        try:
+            data = self.implementation.get_data(variable, None)
+            properties = self.implementation.get_properties(variable)
+        except AttributeError:
+            # The variable does not have data or properties (such as
+            # a coordinate reference)
+            return None
+
+        # Exclude properties that may be ignored when testing for
+        # equality
+        properties = frozenset(properties).difference(
+            ('Conventions', '_FillValue', 'missing_value'))
+
+        if data is None:
+            return (None, None, properties)
+
+        return (data.shape, data.dtype.str, properties)
+
+    def _seen_info(self, variable):
+        '''Return the digest and sampled values of a variable's array.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        variable:
+            The variable.
+
+    :Returns:
+
+        `dict`
+            The digest of the array values, and the values and mask
+            of the array at sample positions. The digest and samples
+            are `None` if the variable has no data, or if its data
+            type is not numeric or string.
+
+        '''
+        info = {'digest': None, 'sample': None, 'sample_mask': None}
+
+        try:
+            data = self.implementation.get_data(variable, None)
+        except AttributeError:
+            data = None
+
+        if data is None or data.dtype.kind not in 'biufcSU':
+            return info
+
+        array = self.implementation.get_array(data)
+        mask = numpy.ma.getmaskarray(array).ravel()
+        values = numpy.ma.getdata(array).ravel()
+
+        digest = hashlib.sha1(mask.tobytes())
+        digest.update(numpy.where(mask, values.dtype.type(0),
+                                  values).tobytes())
+        info['digest'] = digest.hexdigest()
+
+        positions = numpy.unique(
+            numpy.linspace(0, values.size - 1,
+                           min(values.size, 8)).astype(int))
+        info['sample'] = values[positions]
+        info['sample_mask'] = mask[positions]
+
+        return info
+
+    def _seen_sample_matches(self, info, bucket):
+        '''Return the variables of a bucket whose sampled values match.
+
+    The sampled array values of two variables that are equal always
+    match, to within the numerical tolerance used when testing for
+    equality, but variables whose sampled values match need not be
+    equal.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        info: `dict`
+            The digest and sampled values of the input variable, as
+            returned by `_seen_info`.
+
+        bucket: `dict`
+            The bucket of the g['seen_index'] dictionary that has the
+            same key as the input variable.
+
+    :Returns:
+
+        `list`
+            The identifiers of the variables in g['seen'] whose
+            sampled values match.
+
+        '''
+        ids = bucket['ids']
+
+        sample = info['sample']
+        if sample is None or not bucket['sampled']:
+            return list(ids)
+
+        samples = numpy.array(bucket['samples'], dtype=sample.dtype)
+        masks = numpy.array(bucket['sample_masks'], dtype=bool)
+        samples = samples.reshape(len(ids), sample.size)
+        masks = masks.reshape(samples.shape)
+
+        if sample.dtype.kind in 'iufc':
+            close = numpy.isclose(sample, samples, rtol=rtol(), atol=atol())
+        else:
+            close = (sample == samples)
+
+        close |= masks
+        matches = (masks == info['sample_mask']).all(axis=1)
+        matches &= close.all(axis=1)
+
+        return [i for i, match in zip(ids, matches) if match]
+
     def _write_geometry_container(self, field, geometry_container):
         '''Write a netCDF geometry container variable.
 
@@ -2729,6 +2964,16 @@ class NetCDFWrite(IOWrite):
 
         g = self.write_vars
 
+        if not compressed:
+            block_shape = self._write_block_shape(data, ncvar)
+            if block_shape is not None:
+                # Write the uncompressed data in blocks
+                self._write_data_blocks(data, cfvar, ncvar, block_shape,
+                                        unset_values=unset_values,
+                                        attributes=attributes)
+                return
+        # --- End: if
+
         if compressed:
             # if set(ncdimensions).intersection(g['sample_ncdim'].values()):
             # Get the data as a compressed numpy array
@@ -2737,6 +2982,162 @@ class NetCDFWrite(IOWrite):
             # Get the data as an uncompressed numpy array
             array = self.implementation.get_array(data)
 
+        array = self._prepare_array(array, ncvar, unset_values)
+
+        if g['warn_valid']:
+            # Check for out-of-range values
+            self._check_valid(cfvar, array, attributes)
+
+        # Copy the array into the netCDF variable
+        g['nc'][ncvar][...] = array
+
+        self._aaa(ncvar, array)
+
+    def _write_data_blocks(self, data, cfvar, ncvar, block_shape,
+                           unset_values=(), attributes=None):
+        '''Write uncompressed data to a netCDF variable in blocks.
+
+    Each block is read, checked and written in turn, so that the whole
+    array is never in memory at once.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        data: Data instance
+
+        cfvar: cfdm instance
+
+        ncvar: `str`
+
+        block_shape: `tuple` of `int`
+            The shape of each block. Blocks at the ends of dimensions
+            may be smaller.
+
+        unset_values: sequence of numbers
+
+        attributes: `dict`, optional
+            The netCDF attributes for the constructs that have been
+            written to the file.
+
+    :Returns:
+
+        `None`
+
+        '''
+        g = self.write_vars
+
+        # The minimum and maximum unmasked values of each block, for
+        # checking for out-of-range values
+        extremes = []
+
+        shape = self.implementation.get_data_shape(data, isdata=True)
+        for start in itertools.product(*[range(0, size, n)
+                                         for size, n in zip(shape,
+                                                            block_shape)]):
+            # Blocks at the ends of dimensions are truncated, so that
+            # an unlimited dimension is not extended beyond its size
+            indices = tuple([slice(i, min(i + n, size))
+                             for i, n, size in zip(start, block_shape,
+                                                   shape)])
+
+            array = self.implementation.get_array(data[indices])
+            array = self._prepare_array(array, ncvar, unset_values)
+
+            if g['warn_valid'] and array.dtype.kind in 'iuf':
+                for x in (array.min(), array.max()):
+                    if x is not numpy.ma.masked:
+                        extremes.append(x)
+            # --- End: if
+
+            # Copy the block into the netCDF variable
+            g['nc'][ncvar][indices] = array
+
+            self._aaa(ncvar, array)
+        # --- End: for
+
+        if extremes:
+            # Check for out-of-range values
+            self._check_valid(cfvar, numpy.array(extremes), attributes)
+
+    def _write_block_shape(self, data, ncvar):
+        '''Return the shape of the blocks in which to write data.
+
+    Blocks span whole HDF5 chunks of the netCDF variable (or whole
+    elements, if the variable is not chunked), and are as large as
+    possible given the write block size (see
+    `{{package}}.write_block_size`), with trailing dimensions filled
+    first.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        data: Data instance
+
+        ncvar: `str`
+
+    :Returns:
+
+        `tuple` or `None`
+            The shape of each block, or `None` if the data is to be
+            written in a single block.
+
+    **Examples:**
+
+    >>> w._write_block_shape(data, 'tas')
+    (3, 180, 360)
+
+        '''
+        max_nbytes = write_block_size()
+        if not max_nbytes:
+            return None
+
+        g = self.write_vars
+
+        shape = self.implementation.get_data_shape(data, isdata=True)
+        if not shape:
+            return None
+
+        dtype = g['nc'][ncvar].dtype
+        if not isinstance(dtype, numpy.dtype) or dtype.kind not in 'biuf':
+            # Variable-length and character variables are written in
+            # a single block
+            return None
+
+        itemsize = max(dtype.itemsize, data.dtype.itemsize)
+
+        chunks = g['nc'][ncvar].chunking()
+        if not isinstance(chunks, list):
+            chunks = None
+
+        return _block_shape(shape, itemsize, max_nbytes, chunks=chunks)
+
+    def _prepare_array(self, array, ncvar, unset_values=()):
+        '''Prepare an array for writing to a netCDF variable.
+
+    The data type is converted, if required, and the array is checked
+    for unmasked elements which are equal to any of the missing data
+    values.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        array: `numpy.ndarray`
+
+        ncvar: `str`
+
+        unset_values: sequence of numbers
+
+    :Returns:
+
+        `numpy.ndarray`
+            The prepared array.
+
+        '''
+        g = self.write_vars
+
         # Convert data type
         new_dtype = g['datatype'].get(array.dtype)
         if new_dtype is not None:
@@ -2762,14 +3163,7 @@ class NetCDFWrite(IOWrite):
             # https://github.com/Unidata/netcdf4-python/pull/465
             array = array.filled('')
 
-        if g['warn_valid']:
-            # Check for out-of-range values
-            warned = self._check_valid(cfvar, array, attributes)
-
-        # Copy the array into the netCDF variable
-        g['nc'][ncvar][...] = array
-
-        self._aaa(ncvar, array)
+        return array
 
     def _check_valid(self, cfvar, array, attributes):
         '''Check array for out-of-range values, as defined by the
@@ -4041,6 +4435,9 @@ class NetCDFWrite(IOWrite):
                         "that needs to be read: {}".format(filename))
         # --- End: if
 
+        # Close the file if it is being kept open for reading data
+        close_files(filename)
+
         if self.write_vars['overwrite']:
             os.remove(filename)
 
@@ -4241,6 +4638,10 @@ class NetCDFWrite(IOWrite):
             # dimensions keyed by items of the field (such as a
             # coordinate or a coordinate reference)
             'seen': {},
+            # The variables in 'seen', grouped by their
+            # type-independent structure (see `_index_seen`)
+            'seen_index': {},
+            'seen_n_indexed': 0,
             # Set of all netCDF dimension and netCDF variable names.
             'ncvar_names': set(()),
             # Set of global or non-standard CF properties which have
@@ -1,5 +1,7 @@
 import os
 
+from concurrent.futures import ProcessPoolExecutor
+
 from ..cfdmimplementation import implementation
 
 from .netcdf import NetCDFRead
@@ -308,3 +310,288 @@ def read(filename, external=None, extra=None, verbose=None,
     # Return the field constructs
     # ----------------------------------------------------------------
     return fields
+
+
+def read_many(filenames, external=None, extra=None, verbose=None,
+              warnings=False, warn_valid=False, mask=True, workers=None,
+              executor=None, _implementation=_implementation):
+    '''Read field constructs from many datasets concurrently.
+
+    Each dataset is read with `cfdm.read`, and the datasets are read
+    concurrently by a pool of worker processes. Reading many datasets
+    in this way is faster than reading them one after another when
+    the time taken is dominated by parsing the netCDF metadata and
+    creating the field constructs.
+
+    The returned field constructs are in the same order as the
+    datasets given by the *filenames* parameter, and for each dataset
+    are sorted by the netCDF variable names of their corresponding
+    data variables, i.e. the result is the same as concatenating the
+    outputs of `cfdm.read` for each dataset in turn.
+
+    CDL files are converted to netCDF files before the worker
+    processes are started, so that the temporary netCDF files persist
+    until the end of the Python session (see `cfdm.read` for details).
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `cfdm.read`
+
+    :Parameters:
+
+        filenames: (sequence of) `str`
+            The file names or OPenDAP URLs of the datasets.
+
+            Relative paths are allowed, and standard tilde and shell
+            parameter expansions are applied to the strings.
+
+        external: (sequence of) `str`, optional
+            Read external variables from the given external files. See
+            `cfdm.read` for details.
+
+        extra: (sequence of) `str`, optional
+            Create extra, independent fields from netCDF variables
+            that correspond to particular types metadata
+            constructs. See `cfdm.read` for details.
+
+        verbose: `int` or `str` or `None`, optional
+            Set the verboseness level of displayed output (log)
+            messages. See `cfdm.read` for details.
+
+        warnings: `bool`, optional
+            If True then print warnings when an output field construct
+            is incomplete due to structural non-compliance of the
+            dataset. See `cfdm.read` for details.
+
+        warn_valid: `bool`, optional
+            If True then print a warning for the presence of
+            ``valid_min``, ``valid_max`` or ``valid_range``
+            properties. See `cfdm.read` for details.
+
+        mask: `bool`, optional
+            If False then do not mask by convention when reading the
+            data of field or metadata constructs from disk. See
+            `cfdm.read` for details.
+
+        workers: `int`, optional
+            The maximum number of worker processes. By default the
+            number of processors on the machine is used. If *workers*
+            is ``1``, or there is only one dataset, then the datasets
+            are read in the current process without a pool of worker
+            processes. Ignored if the *executor* parameter is set.
+
+        executor: `concurrent.futures.ProcessPoolExecutor`, optional
+            An existing pool of worker processes with which to read
+            the datasets. By default a new
+            `concurrent.futures.ProcessPoolExecutor` is created for
+            the duration of the call. An executor that is provided is
+            not shut down.
+
+            Executors that run the reads in threads of the current
+            process, such as `concurrent.futures.ThreadPoolExecutor`,
+            are not supported, because neither the netCDF library nor
+            the caches of open files and data blocks are thread-safe.
+
+        _implementation: (subclass of) `CFDMImplementation`, optional
+            Define the CF data model implementation that provides the
+            returned field constructs.
+
+    :Returns:
+
+        `list`
+            The field constructs found in the datasets. The list may
+            be empty.
+
+    **Examples:**
+
+    >>> x = cfdm.read_many(['file1.nc', 'file2.nc'])
+    >>> y = cfdm.read_many(glob.glob('data/*.nc'), workers=4)
+
+    Use an existing pool of worker processes:
+
+    >>> from concurrent.futures import ProcessPoolExecutor
+    >>> with ProcessPoolExecutor(max_workers=8) as executor:
+    ...     x = cfdm.read_many(filenames, executor=executor)
+    ...     y = cfdm.read_many(other_filenames, executor=executor)
+
+    '''
+    if executor is not None and not isinstance(executor,
+                                               ProcessPoolExecutor):
+        raise ValueError(
+            "Can't read datasets with executor {!r}: Only a "
+            "concurrent.futures.ProcessPoolExecutor is supported".format(
+                executor))
+
+    if isinstance(filenames, str):
+        filenames = (filenames,)
+
+    filenames = [os.path.expanduser(os.path.expandvars(filename))
+                 for filename in filenames]
+
+    # Convert CDL files in this process, so that the temporary
+    # netCDF files are not deleted when the worker processes exit
+    netcdf = NetCDFRead(_implementation)
+    for i, filename in enumerate(filenames):
+        if os.path.isfile(filename) and netcdf.is_cdl_file(filename):
+            filenames[i] = netcdf.cdl_to_netcdf(filename)
+    # --- End: for
+
+    kwargs = {'external': external,
+              'extra': extra,
+              'verbose': verbose,
+              'warnings': warnings,
+              'warn_valid': warn_valid,
+              'mask': mask,
+              '_implementation': _implementation}
+
+    if executor is None:
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        if workers < 1:
+            raise ValueError(
+                "Can't read datasets with {} worker processes".format(
+                    workers))
+
+        workers = min(workers, len(filenames))
+        if workers <= 1:
+            out = [read(filename, **kwargs) for filename in filenames]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                out = _read_many(executor, filenames, kwargs)
+    else:
+        out = _read_many(executor, filenames, kwargs)
+
+    return [f for fields in out for f in fields]
+
+
+def _read_many(executor, filenames, kwargs):
+    '''Read datasets with an executor.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        executor: `concurrent.futures.Executor`
+            The executor with which to read the datasets.
+
+        filenames: sequence of `str`
+            The file names or OPenDAP URLs of the datasets.
+
+        kwargs: `dict`
+            Keyword arguments to `cfdm.read`.
+
+    :Returns:
+
+        `list`
+            For each dataset, in the same order as *filenames*, the
+            list of field constructs returned by `cfdm.read`.
+
+    '''
+    futures = [executor.submit(read, filename, **kwargs)
+               for filename in filenames]
+
+    return [future.result() for future in futures]
+
+
+def scan(filename, verbose=None, _implementation=_implementation):
+    '''Summarise the field constructs in a dataset without reading them.
+
+    Only the netCDF header of the dataset is inspected, so no data
+    arrays are read and no field or metadata constructs are
+    created. This is much faster than `cfdm.read` when only the
+    description of the field constructs is required, for example when
+    searching for particular fields amongst many datasets.
+
+    The netCDF variables that are summarised are those that would be
+    returned as field constructs by `cfdm.read`, and the summaries are
+    sorted by their netCDF variable names.
+
+    Each summary is a dictionary with the following keys:
+
+    ================  ================================================
+    Key               Value
+    ================  ================================================
+    ``'ncvar'``       The netCDF variable name of the data variable.
+
+    ``'identity'``    The identity of the field construct, as would
+                      be returned by its `~Field.identity` method.
+
+    ``'shape'``       The shape of the field construct's data, as a
+                      `tuple`.
+
+    ``'dimensions'``  The netCDF dimension names of the field
+                      construct's data, as a `tuple`.
+
+    ``'properties'``  The field construct's properties, as a `dict`.
+    ================  ================================================
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `cfdm.read`
+
+    :Parameters:
+
+        filename: `str`
+            The file name or OPenDAP URL of the dataset. A CDL file
+            is converted to a netCDF file as described by `cfdm.read`.
+
+            Relative paths are allowed, and standard tilde and shell
+            parameter expansions are applied to the string.
+
+        verbose: `int` or `str` or `None`, optional
+            Set the verboseness level of displayed output (log)
+            messages. See `cfdm.read` for details.
+
+        _implementation: (subclass of) `CFDMImplementation`, optional
+            Define the CF data model implementation that provides the
+            returned field constructs.
+
+    :Returns:
+
+        `list` of `dict`
+            The summaries of the field constructs found in the
+            dataset. The list may be empty.
+
+    **Examples:**
+
+    >>> for x in cfdm.scan('file.nc'):
+    ...     print(x['identity'], x['shape'])
+    ...
+    specific_humidity (5, 8)
+    air_temperature (10, 9)
+
+    >>> x = cfdm.scan('file.nc')[0]
+    >>> x['ncvar'], x['dimensions']
+    ('q', ('lat', 'lon'))
+    >>> x['properties']['units']
+    '1'
+
+    '''
+    filename = os.path.expanduser(os.path.expandvars(filename))
+
+    if os.path.isdir(filename):
+        raise IOError("Can't read directory {}".format(filename))
+
+    if not os.path.isfile(filename):
+        raise IOError("Can't read non-existent file {}".format(filename))
+
+    netcdf = NetCDFRead(_implementation)
+
+    cdl = False
+    if netcdf.is_cdl_file(filename):
+        # Create a temporary netCDF file from input CDL
+        cdl = True
+        cdl_filename = filename
+        filename = netcdf.cdl_to_netcdf(filename)
+
+    if netcdf.is_netcdf_file(filename):
+        return netcdf.scan(filename, verbose=verbose)
+
+    if cdl:
+        raise IOError(
+            "Can't determine format of file {} "
+            "generated from CDL file {}".format(
+                filename, cdl_filename))
+
+    raise IOError("Can't determine format of file {}".format(filename))
@@ -1,6 +1,7 @@
 import datetime
 import inspect
 import os
+import re
 import unittest
 
 import numpy
@@ -265,6 +266,237 @@ class ConstructsTest(unittest.TestCase):
         self.assertTrue(d.unfilter(1).equals(c, verbose=3))
         self.assertTrue(c.unfilter(1).equals(c, verbose=3))
 
+    def test_Constructs_equals_fingerprints(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        f = self.f.copy()
+        c = f.constructs
+        d = c.copy()
+
+        fingerprints = c._equals_fingerprints()
+        self.assertEqual(set(fingerprints), set(c.filter_by_data()))
+        self.assertEqual(d._equals_fingerprints(), fingerprints)
+        self.assertEqual(d._equals_fingerprints(digest=True),
+                         c._equals_fingerprints(digest=True))
+
+        # Non-string property values are not recorded, since they may
+        # be compared with a tolerance
+        key = c('latitude').key()
+        d[key].set_property('valid_max', 1000)
+        c[key].set_property('valid_max', 1000.0000001)
+        self.assertEqual(d._equals_fingerprints(), c._equals_fingerprints())
+        self.assertTrue(d.equals(c, rtol=1e-6, verbose=3))
+
+        # String property values are recorded
+        d[key].set_property('comment', 'qwerty')
+        self.assertNotEqual(d._equals_fingerprints()[key],
+                            c._equals_fingerprints()[key])
+        self.assertFalse(d.equals(c))
+        self.assertFalse(c.equals(d))
+
+        c[key].set_property('comment', numpy.array('qwerty'))
+        self.assertEqual(d._equals_fingerprints()[key],
+                         c._equals_fingerprints()[key])
+        self.assertTrue(d.equals(c, rtol=1e-6, verbose=3))
+
+        # Fill values are ignored, if requested
+        d[key].set_property('_FillValue', -99)
+        self.assertEqual(
+            d._equals_fingerprints(ignore_fill_value=True)[key],
+            c._equals_fingerprints(ignore_fill_value=True)[key])
+        self.assertFalse(d.equals(c))
+        self.assertTrue(d.equals(c, rtol=1e-6, ignore_fill_value=True))
+
+        # Data types are ignored, if requested
+        d[key].set_data(cfdm.Data(d[key].data.array.astype('float32'),
+                                  units=d[key].data.get_units()))
+        self.assertNotEqual(d._equals_fingerprints()[key],
+                            c._equals_fingerprints()[key])
+        self.assertEqual(
+            d._equals_fingerprints(ignore_data_type=True,
+                                   ignore_fill_value=True)[key],
+            c._equals_fingerprints(ignore_data_type=True,
+                                   ignore_fill_value=True)[key])
+
+        # Digests record the missing values
+        key = c('grid_latitude').key()
+        d[key].data[0] = cfdm.masked
+        self.assertEqual(d._equals_fingerprints()[key],
+                         c._equals_fingerprints()[key])
+        self.assertNotEqual(d._equals_fingerprints(digest=True)[key],
+                            c._equals_fingerprints(digest=True)[key])
+
+        # Constructs that can only be distinguished by their data are
+        # matched
+        def field(order):
+            f = cfdm.Field()
+            axis = f.set_construct(cfdm.DomainAxis(4))
+            for i in order:
+                f.set_construct(
+                    cfdm.AuxiliaryCoordinate(
+                        data=cfdm.Data(
+                            numpy.ma.masked_equal(numpy.arange(4), i))),
+                    axes=axis)
+            # --- End: for
+
+            return f
+
+        f = field(range(4))
+        g = field(range(3, -1, -1))
+        self.assertTrue(f.equals(g, verbose=3))
+
+        aux = g.construct('key%auxiliarycoordinate0')
+        aux.data[...] = aux.data.array + 1
+        self.assertFalse(f.equals(g))
+
+    def test_Constructs_index(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        f = self.f.copy()
+        c = f.constructs
+
+        def keys(d):
+            return sorted(d.keys())
+
+        def index(c):
+            holder = c._construct_index
+            if holder is not None:
+                return holder[0]
+
+        # Indexed lookups agree with unindexed (regular expression)
+        # lookups
+        for identity in ('latitude', 'grid_latitude', 'ncvar%a',
+                         'measure:area', 'key%cellmethod0',
+                         'units=degrees', 'qwerty'):
+            self.assertEqual(
+                keys(c(identity)),
+                keys(c(re.compile('^{}$'.format(re.escape(identity))))))
+
+        for ncvar in ('areacella', 'a', 'qwerty'):
+            self.assertEqual(
+                keys(c.filter_by_ncvar(ncvar)),
+                keys(c.filter_by_ncvar(re.compile('^{}$'.format(ncvar)))))
+
+        self.assertEqual(keys(c.filter_by_method('mean', 'maximum')),
+                         keys(c.filter_by_method(re.compile('^m'))))
+        self.assertEqual(keys(c.filter_by_ncdim('grid_latitude')),
+                         keys(c.filter_by_ncdim(re.compile('^grid_lat'))))
+
+        self.assertEqual(
+            keys(c.filter_by_property(standard_name='latitude',
+                                      units='degrees_N')),
+            keys(c.filter_by_property(
+                standard_name=re.compile('^latitude$'),
+                units=re.compile('^degrees_N$'))))
+        self.assertEqual(
+            len(c.filter_by_property('or', standard_name='latitude',
+                                     units='degrees')), 3)
+        self.assertEqual(
+            len(c.filter_by_property('and', standard_name='latitude',
+                                     units='degrees')), 0)
+
+        # The index is shared with the results of filters
+        index0 = index(c)
+        self.assertIsNotNone(index0)
+        d = c.filter_by_type('auxiliary_coordinate')
+        self.assertEqual(len(d('latitude')), 1)
+        self.assertEqual(len(d('grid_latitude')), 0)
+        self.assertIs(index(c), index0)
+
+        # Changing a construct in-place is detected
+        key = c('latitude').key()
+        lat = c[key]
+        lat.set_property('standard_name', 'qwerty')
+        self.assertEqual(len(c('latitude')), 0)
+        self.assertEqual(c('qwerty').key(), key)
+
+        lat.nc_set_variable('qwerty_var')
+        self.assertEqual(c.filter_by_ncvar('qwerty_var').key(), key)
+
+        x = c('grid_longitude').value()
+        x.bounds.set_property('qwerty_bounds', 'bar')
+        self.assertIs(c('qwerty_bounds=bar').value(), x)
+
+        # Setting and deleting constructs invalidate the index
+        self.assertIsNotNone(index(c))
+        x_key = c('grid_longitude').key()
+        key = f.set_construct(
+            cfdm.AuxiliaryCoordinate(
+                properties={'standard_name': 'latitude'},
+                data=cfdm.Data(numpy.arange(9))),
+            axes=f.get_data_axes(x_key))
+        self.assertIsNone(index(c))
+        self.assertEqual(c('latitude').key(), key)
+
+        f.del_construct(key)
+        self.assertIsNone(index(c))
+        self.assertEqual(len(c('latitude')), 0)
+
+        # Views of the same constructs are not invalidated, but the
+        # change is detected
+        domain = f.domain
+        self.assertEqual(len(domain.constructs('qwerty')), 1)
+        f.del_construct(c('qwerty').key())
+        self.assertEqual(len(domain.constructs('qwerty')), 0)
+
+    def test_Constructs_chained_filters(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        f = self.f.copy()
+        c = f.constructs
+
+        # Chained filters select the same constructs as filters that
+        # are applied one at a time
+        e = c.filter_by_type('auxiliary_coordinate', 'dimension_coordinate')
+        e = e.filter_by_naxes(1).filter_by_identity('grid_latitude')
+        self.assertEqual(len(e), 1)
+        self.assertEqual(len(e.filters_applied()), 3)
+
+        d2 = c.filter_by_type('auxiliary_coordinate', 'dimension_coordinate')
+        e2 = d2.filter_by_naxes(1)
+        self.assertGreater(len(d2), len(e2))
+        e2 = e2.filter_by_identity('grid_latitude')
+        self.assertTrue(e2.equals(e, verbose=3))
+        self.assertEqual(e2.filters_applied(), e.filters_applied())
+
+        for depth in (None, 0, 1, 2, 3, 4):
+            self.assertTrue(
+                e.unfilter(depth).equals(e2.unfilter(depth), verbose=3))
+            self.assertTrue(
+                e.inverse_filter(depth).equals(e2.inverse_filter(depth),
+                                               verbose=3))
+
+        # Filters are applied when they are called, and so are
+        # unaffected by subsequent changes to the constructs
+        key = c('latitude').key()
+        d = c.filter_by_identity('latitude')
+        e = c.filter_by_property(units='degree_N')
+        lat = f.construct('latitude')
+        lat.set_property('standard_name', 'foo')
+        lat.set_property('units', 'degrees_north')
+        self.assertEqual(list(d), [key])
+        self.assertEqual(list(e), [key])
+
+        # Construct types that are ignored remain ignored
+        self.assertFalse(
+            f.domain.constructs.filter_by_type('cell_method'))
+
+        f.del_construct(key)
+        self.assertEqual(list(d), [key])
+        self.assertEqual(len(d.unfilter()), len(c) + 1)
+
+        with self.assertRaises(ValueError):
+            c.filter_by_axis('qwerty', 'domainaxis0')
+
+        with self.assertRaises(ValueError):
+            c.filter_by_property('qwerty', units='K')
+
+        with self.assertRaises(ValueError):
+            c.filter_by_property('or', 'and', units='K')
+
 # --- End: class
 
 
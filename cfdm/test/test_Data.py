@@ -6,6 +6,8 @@ import os
 import unittest
 
 
+import cftime
+import netCDF4
 import numpy
 
 import cfdm
@@ -74,6 +76,25 @@ class DataTest(unittest.TestCase):
             _ = repr(d)
             _ = str(d)
 
+        # Cached string representation
+        d = cfdm.Data([[6, 7, 8, 9], [6, 7, 8, 9]], units='km')
+        self.assertEqual(str(d), '[[6, ..., 9]] km')
+        self.assertIs(str(d), str(d))
+        d[-1, -1] = 99
+        self.assertEqual(str(d), '[[6, ..., 99]] km')
+        d.set_units('m')
+        self.assertEqual(str(d), '[[6, ..., 99]] m')
+        d[0, 0] = cfdm.masked
+        self.assertEqual(str(d), '[[--, ..., 99]] m')
+        d[0, 0] = 6
+        d.set_units('days since 2000-01-01')
+        d.set_calendar('360_day')
+        self.assertEqual(str(d),
+                         '[[2000-01-07 00:00:00, ..., 2000-04-10 00:00:00]] '
+                         '360_day')
+        e = d.transpose()
+        self.assertEqual(str(e), str(d))
+
 #    def test_Data__getitem__(self):
 #        if self.test_only and inspect.stack()[0][3] not in self.test_only:
 #            return
@@ -191,6 +212,56 @@ class DataTest(unittest.TestCase):
         self.assertTrue((b == e.array).all())
         self.assertTrue((b.mask == e.mask.array).all())
 
+        # The data values are not copied
+        self.assertTrue(numpy.shares_memory(e.view_array(), d.view_array()))
+
+        self.assertIsNone(d.apply_masking(fill_values=True, inplace=True))
+        self.assertTrue(
+            (d.mask.array == numpy.ma.getmaskarray(a) | (a == 7)).all())
+
+    def test_Data_apply_masking_blocks(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        a = numpy.ma.arange(120.0).reshape(4, 5, 6)
+        a[1, 1, 1] = numpy.ma.masked
+        a[3, 0, 2] = -99
+
+        # Mask the array in many small blocks, including arrays that
+        # are not contiguous in memory
+        org = cfdm.data.mixin.arraymixin._masking_buffer_size
+        cfdm.data.mixin.arraymixin._masking_buffer_size = 7
+        try:
+            for x in (a, a.transpose(2, 0, 1), a[::2, :, ::-3]):
+                d = cfdm.Data(x)
+                e = d.apply_masking(fill_values=[-99, 50], valid_range=[3, 97])
+                b = numpy.ma.masked_where(
+                    (x == -99) | (x == 50) | (x < 3) | (x > 97), x)
+                self.assertTrue((e.mask.array == b.mask).all())
+                self.assertTrue((e.array == b).all())
+        finally:
+            cfdm.data.mixin.arraymixin._masking_buffer_size = org
+
+        # Masking of lazy netCDF data is applied to each block of the
+        # data as it is read
+        org = cfdm.lazy(True)
+        org_block_size = cfdm.reduction_block_size(40)
+        try:
+            d = cfdm.read(self.filename)[0].data
+            self.assertIsInstance(d._get_Array(), cfdm.NetCDFArray)
+            e = d.apply_masking(valid_range=[250, 270])
+            self.assertIsInstance(e._get_Array(), cfdm.DeferredArray)
+            self.assertIsNotNone(e._reduction_blocks())
+
+            b = d.array
+            b = numpy.ma.masked_where((b < 250) | (b > 270), b)
+            self.assertTrue((e.array.mask == b.mask).all())
+            self.assertEqual(e.maximum().array, b.max())
+            self.assertEqual(e.minimum().array, b.min())
+        finally:
+            cfdm.lazy(org)
+            cfdm.reduction_block_size(org_block_size)
+
 #    def test_Data_astype(self):
 #        if self.test_only and inspect.stack()[0][3] not in self.test_only:
 #            return
@@ -258,6 +329,43 @@ class DataTest(unittest.TestCase):
         self.assertTrue((a2 == b).all())
         self.assertFalse((a2 == a).all())
 
+    def test_Data_view_array(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        a = numpy.ma.arange(12.0).reshape(3, 4)
+        a[1, 1] = numpy.ma.masked
+        d = cfdm.Data(a, units='km', fill_value=-99)
+
+        v = d.view_array()
+        self.assertTrue((v == a).all())
+        self.assertTrue((v.mask == a.mask).all())
+        self.assertEqual(v.fill_value, -99)
+        self.assertFalse(v.flags.writeable)
+        with self.assertRaises(ValueError):
+            v[0, 0] = -1
+
+        with self.assertRaises(ValueError):
+            v[0, 0] = numpy.ma.masked
+
+        self.assertEqual(d.array[0, 0], 0)
+        self.assertTrue(d.array.flags.writeable)
+
+        # Scalar array
+        d = cfdm.Data(9, units='km')
+        v = d.view_array()
+        self.assertEqual(v.shape, ())
+        self.assertEqual(v, numpy.array(9))
+
+        # New data created from a view is independent of the original
+        d = cfdm.Data(a, units='km')
+        e = d.transpose()
+        e[0, 0] = -1
+        self.assertEqual(d.array[0, 0], 0)
+        f = d.filled()
+        f[0, 0] = -1
+        self.assertEqual(d.array[0, 0], 0)
+
     def test_Data_datetime_array(self):
         if self.test_only and inspect.stack()[0][3] not in self.test_only:
             return
@@ -280,6 +388,66 @@ class DataTest(unittest.TestCase):
         dt = d.datetime_array
         self.assertIs(dt[()], numpy.ma.masked)
 
+    def test_Data_datetime_array_cache(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        d = cfdm.Data(numpy.arange(48.0), units='hours since 2000-01-01')
+        dt = d.datetime_array
+        cached = d._custom['datetime_array'][-1]
+        self.assertIsNot(dt, cached)
+
+        # The cached date-times are reused, but a modified copy can't
+        # change them
+        dt[0] = None
+        dt = d.datetime_array
+        self.assertIs(d._custom['datetime_array'][-1], cached)
+        self.assertEqual(dt[0], datetime.datetime(2000, 1, 1))
+        self.assertEqual(list(d.datetime_as_string[-2:]),
+                         ['2000-01-02 22:00:00', '2000-01-02 23:00:00'])
+
+        # Changing the calendar, units or data gives new date-times
+        d.set_calendar('360_day')
+        self.assertEqual(d.datetime_array[-1],
+                         cftime.Datetime360Day(2000, 1, 2, 23))
+
+        d.set_units('days since 2000-01-01')
+        self.assertEqual(d.datetime_array[-1],
+                         cftime.Datetime360Day(2000, 2, 18))
+
+        d[-1] = 0
+        self.assertEqual(d.datetime_array[-1],
+                         cftime.Datetime360Day(2000, 1, 1))
+
+    def test_Data__num2date(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        bounds = numpy.empty((100, 2))
+        bounds[:, 0] = numpy.arange(-1.5, 298.5, 3)
+        bounds[:, 1] = bounds[:, 0] + 3
+
+        for units, array in itertools.product(
+                ('days since 2000-02-28',
+                 'hours since 1582-10-16 06:00:00',
+                 'seconds since 1970-01-01 00:00:00.5',
+                 'minutes since 0001-01-01'),
+                (bounds,
+                 numpy.array([-100, 1, 10000], dtype='int32'),
+                 numpy.array([0.1, 2.6]),
+                 numpy.array(3.0))):
+            for calendar in ('standard', 'proleptic_gregorian', 'noleap',
+                             'all_leap', '360_day', 'julian'):
+                dt = cfdm.Data._num2date(array, units, calendar)
+                self.assertEqual(numpy.shape(dt), array.shape)
+
+                expected = netCDF4.num2date(array, units, calendar,
+                                            only_use_cftime_datetimes=True)
+                for x, y in zip(numpy.ravel(dt), numpy.ravel(expected)):
+                    self.assertEqual(x, y)
+                    self.assertEqual(repr(x), repr(y))
+        # --- End: for
+
     def test_Data_flatten(self):
         if self.test_only and inspect.stack()[0][3] not in self.test_only:
             return
@@ -388,6 +556,50 @@ class DataTest(unittest.TestCase):
         self.assertTrue(d.equals(e, verbose=3))
         self.assertTrue(e.equals(d, verbose=3))
 
+        # Block by block comparisons
+        org = cfdm.reduction_block_size()
+        try:
+            d = cfdm.read(self.filename)[0].data
+            a = d.array
+            e = cfdm.Data(a.copy(), units=d.get_units(None))
+
+            cfdm.reduction_block_size(d.dtype.itemsize * d.size // 3)
+            self.assertIsNotNone(d._reduction_blocks())
+            self.assertIsNone(e._reduction_blocks())
+            self.assertTrue(d.equals(e, verbose=3))
+            self.assertTrue(e.equals(d, verbose=3))
+
+            e[(-1,) * e.ndim] = a.item(-1) + 1
+            self.assertFalse(d.equals(e))
+            self.assertFalse(e.equals(d))
+            self.assertTrue(d.equals(e, atol=2))
+
+            e[(-1,) * e.ndim] = cfdm.masked
+            self.assertFalse(d.equals(e, atol=2))
+        finally:
+            cfdm.reduction_block_size(org)
+
+        # Compressed arrays
+        for filename in ('DSG_timeSeries_contiguous.nc',
+                         'DSG_timeSeries_indexed.nc',
+                         'DSG_timeSeriesProfile_indexed_contiguous.nc',
+                         'gathered.nc'):
+            filename = os.path.join(
+                os.path.dirname(os.path.abspath(__file__)), filename)
+            for f, g in zip(cfdm.read(filename), cfdm.read(filename)):
+                d = f.data
+                e = g.data
+                self.assertTrue(d._equals_compression(e))
+                self.assertTrue(d.equals(e, ignore_compression=False,
+                                         verbose=3))
+
+                e = cfdm.Data(d.array, units=d.get_units(None),
+                              calendar=d.get_calendar(None),
+                              fill_value=d.get_fill_value(None))
+                self.assertTrue(d.equals(e, verbose=3))
+                self.assertFalse(d.equals(e, ignore_compression=False))
+        # --- End: for
+
     def test_Data_maximum_minimum_sum_squeeze(self):
         if self.test_only and inspect.stack()[0][3] not in self.test_only:
             return
@@ -465,6 +677,136 @@ class DataTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             d.maximum(axes=0)
 
+    def test_Data_reduction_blocks(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        gathered = os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), 'gathered.nc')
+        dsg = os.path.join(
+            os.path.dirname(os.path.abspath(__file__)),
+            'DSG_timeSeries_contiguous.nc')
+
+        org = cfdm.reduction_block_size()
+        try:
+            for f in (cfdm.read(self.filename) + cfdm.read(gathered)
+                      + cfdm.read(dsg)):
+                d = f.data
+                a = d.array
+                e = cfdm.Data(a, units=d.get_units(None),
+                              fill_value=d.get_fill_value(None))
+
+                cfdm.reduction_block_size(d.dtype.itemsize * d.size // 3)
+                self.assertIsNotNone(d._reduction_blocks())
+                self.assertIsNone(e._reduction_blocks())
+
+                for axes in [None] + [
+                        axes
+                        for n in range(1, d.ndim + 1)
+                        for axes in itertools.combinations(range(d.ndim), n)
+                ]:
+                    for method in ('maximum', 'minimum', 'sum'):
+                        x = getattr(d, method)(axes=axes)
+                        y = getattr(e, method)(axes=axes)
+                        self.assertEqual(x.shape, y.shape)
+                        self.assertTrue(
+                            x.equals(y, rtol=0, atol=0, verbose=3),
+                            '{}, {}, {}'.format(f, method, axes))
+                # --- End: for
+
+                # A floating point sum is identical to a single pass
+                # sum
+                self.assertEqual(d.sum().array.item(),
+                                 numpy.sum(a).item())
+
+                self.assertTrue(d.unique().equals(e.unique(), verbose=3))
+                self.assertEqual(d.any(), e.any())
+
+                cfdm.reduction_block_size(0)
+                self.assertIsNone(d._reduction_blocks())
+        finally:
+            cfdm.reduction_block_size(org)
+
+    def test_Data_mask_digest(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        gathered = os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), 'gathered.nc')
+        dsg = os.path.join(
+            os.path.dirname(os.path.abspath(__file__)),
+            'DSG_timeSeries_contiguous.nc')
+
+        org = cfdm.reduction_block_size()
+        try:
+            for f in (cfdm.read(self.filename) + cfdm.read(gathered)
+                      + cfdm.read(dsg)):
+                d = f.data
+                a = d.array
+                positions = numpy.flatnonzero(numpy.ma.getmaskarray(a))
+                digest = (positions.size, int(positions.sum()))
+
+                cfdm.reduction_block_size(d.dtype.itemsize * d.size // 3)
+                self.assertIsNotNone(d._reduction_blocks())
+                self.assertEqual(d._mask_digest(), digest)
+
+                cfdm.reduction_block_size(0)
+                e = cfdm.Data(a, units=d.get_units(None))
+                self.assertEqual(e._mask_digest(), digest)
+                self.assertEqual(
+                    e._equals_fingerprint(ignore_compression=True,
+                                          digest=True),
+                    d._equals_fingerprint(ignore_compression=True,
+                                          digest=True))
+
+                # The cached digest is discarded when the data change
+                e[(0,) * e.ndim] = cfdm.masked
+                e[(-1,) * e.ndim] = cfdm.masked
+                self.assertNotEqual(e._mask_digest(), digest)
+                self.assertNotEqual(
+                    e._equals_fingerprint(ignore_compression=True,
+                                          digest=True),
+                    d._equals_fingerprint(ignore_compression=True,
+                                          digest=True))
+                self.assertFalse(e.equals(d))
+        finally:
+            cfdm.reduction_block_size(org)
+
+    def test_Data_lazy(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        def chain(d):
+            d = d[0, 1:9, 2:9].transpose().insert_dimension(1)
+            d = d[::2, :, [1, 3, 4]].squeeze()
+            d = d.apply_masking(fill_values=[38.0], valid_max=60)
+            return d.flatten()
+
+        org = cfdm.lazy(False)
+        try:
+            d = cfdm.read(self.filename)[0].data
+            e = chain(d)
+            self.assertIsInstance(e._get_Array(), cfdm.NumpyArray)
+
+            cfdm.lazy(True)
+            d = cfdm.read(self.filename)[0].data
+            x = chain(d)
+            self.assertIsInstance(x._get_Array(), cfdm.DeferredArray)
+            self.assertEqual(x.shape, e.shape)
+            self.assertTrue(x.equals(e, verbose=3))
+            self.assertTrue((x.array.mask == e.array.mask).all())
+            self.assertEqual(x.get_filenames(), d.get_filenames())
+
+            self.assertTrue(x[2:5].equals(e[2:5], verbose=3))
+            self.assertTrue(x.max().equals(e.max(), verbose=3))
+
+            # Data in memory is never deferred
+            d = cfdm.Data(numpy.arange(12).reshape(3, 4))
+            self.assertIsInstance(d[1:].transpose()._get_Array(),
+                                  cfdm.NumpyArray)
+        finally:
+            cfdm.lazy(org)
+
     def test_Data_dtype_mask(self):
         if self.test_only and inspect.stack()[0][3] not in self.test_only:
             return
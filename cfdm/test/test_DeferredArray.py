@@ -0,0 +1,140 @@
+import datetime
+import itertools
+import numpy
+import unittest
+
+import cfdm
+
+
+class DeferredArrayTest(unittest.TestCase):
+    def setUp(self):
+        # Disable log messages to silence expected warnings
+        cfdm.LOG_LEVEL('DISABLE')
+        # Note: to enable all messages for given methods, lines or
+        # calls (those without a 'verbose' option to do the same)
+        # e.g. to debug them, wrap them (for methods, start-to-end
+        # internally) as follows: cfdm.LOG_LEVEL('DEBUG')
+        #
+        # < ... test code ... >
+        # cfdm.log_level('DISABLE')
+
+        self.a = numpy.arange(60.0).reshape(3, 4, 5)
+
+    def test_DeferredArray__getitem__(self):
+        x = cfdm.DeferredArray(cfdm.NumpyArray(self.a))
+        self.assertEqual(x.shape, self.a.shape)
+        self.assertEqual(x.dtype, self.a.dtype)
+        self.assertEqual(x.get_compression_type(), '')
+        self.assertTrue((x.array == self.a).all())
+        self.assertTrue((numpy.array(x) == self.a).all())
+
+        for indices in itertools.product(
+                (slice(None), slice(1, 3), [0, 2]),
+                (slice(None, None, -1), [3, 0, 1], slice(2, 3)),
+                (slice(None, None, 2), [-1, 1])):
+            n = cfdm.NumpyArray(self.a)
+            self.assertTrue((x[indices] == n[indices]).all())
+
+        # Boolean lists select the positions where they are True
+        for indices in (
+                (slice(None), [True, False, False, True], slice(None)),
+                ([False, True, True], slice(None), slice(None)),
+                (slice(None), slice(None), [True, True, False, False, True])):
+            b = self.a[indices]
+            self.assertEqual(x[indices].shape, b.shape, indices)
+            self.assertTrue((x[indices] == b).all(), indices)
+
+    def test_DeferredArray_operations(self):
+        x = cfdm.DeferredArray(cfdm.NumpyArray(self.a))
+        a = self.a
+
+        y = x.transpose([2, 0, 1])
+        b = numpy.transpose(a, [2, 0, 1])
+        self.assertEqual(y.shape, b.shape)
+        self.assertTrue((y.array == b).all())
+
+        # The subspace is moved to before the transpose
+        y = y.subspace([slice(1, 4), [2], slice(None, None, -1)])
+        b = b[1:4, [2], ::-1]
+        indices = y._get_component('indices')
+        self.assertEqual(indices[0], slice(2, 3))
+        self.assertEqual(list(indices[1]), [3, 2, 1, 0])
+        self.assertEqual(indices[2], slice(1, 4, 1))
+        self.assertEqual(y._get_component('operations'),
+                         (('transpose', (2, 0, 1)),))
+        self.assertEqual(y.shape, b.shape)
+        self.assertTrue((y.array == b).all())
+
+        y = y.squeeze([1])
+        b = numpy.squeeze(b, 1)
+        self.assertEqual(y.shape, b.shape)
+        self.assertTrue((y.array == b).all())
+
+        y = y.insert_dimension(2)
+        b = numpy.expand_dims(b, 2)
+        self.assertEqual(y.shape, b.shape)
+        self.assertTrue((y.array == b).all())
+
+        y = y.apply_masking(fill_values=[17], valid_max=55)
+        b = numpy.ma.masked_where((b == 17) | (b > 55), b)
+        self.assertEqual(y.shape, b.shape)
+        self.assertTrue((y.array.mask == b.mask).all())
+        self.assertTrue((y.array == b).all())
+
+        y = y[[0, 2], 1:]
+        b = b[[0, 2], 1:]
+        self.assertTrue((y.mask == b.mask).all())
+        self.assertTrue((y == b).all())
+
+        # Operations after a reshape are carried out in order
+        y = x.reshape((12, 5))
+        self.assertEqual(y.shape, (12, 5))
+        y = y.subspace([slice(2, 9, 3), slice(1, 2)]).transpose([1, 0])
+        b = a.reshape(12, 5)[2:9:3, 1:2].T
+        self.assertEqual(y.shape, b.shape)
+        self.assertTrue((y.array == b).all())
+
+        # The original deferred array is unchanged
+        self.assertEqual(x.shape, a.shape)
+        self.assertTrue((x.array == a).all())
+
+    def test_DeferredArray_boolean_index(self):
+        x = cfdm.DeferredArray(cfdm.NumpyArray(self.a))
+        mask = [True, False, False, True]
+
+        y = x.subspace([slice(None), mask, slice(None)])
+        b = self.a[:, mask]
+        self.assertEqual(y.shape, b.shape)
+        self.assertTrue((y.array == b).all())
+
+        y = x.transpose([1, 0, 2]).subspace([mask, slice(None),
+                                             slice(None)])
+        b = numpy.transpose(self.a, [1, 0, 2])[mask]
+        self.assertEqual(y.shape, b.shape)
+        self.assertTrue((y.array == b).all())
+
+        # Lazy data
+        org = cfdm.lazy(True)
+        try:
+            d = cfdm.Data(x)
+            e = d[:, mask]
+            self.assertIsInstance(e._get_Array(), cfdm.DeferredArray)
+            self.assertEqual(e.shape, (3, 2, 5))
+            self.assertTrue((e.array == self.a[:, mask]).all())
+        finally:
+            cfdm.lazy(org)
+
+    def test_DeferredArray_to_memory(self):
+        x = cfdm.DeferredArray(cfdm.NumpyArray(self.a))
+        y = x.transpose([1, 0, 2]).to_memory()
+        self.assertIsInstance(y, cfdm.NumpyArray)
+        self.assertTrue((y.array == numpy.transpose(self.a, [1, 0, 2])).all())
+
+# --- End: class
+
+
+if __name__ == "__main__":
+    print('Run date:', datetime.datetime.now())
+    cfdm.environment()
+    print('')
+    unittest.main(verbosity=2)
@@ -165,6 +165,65 @@ class FieldTest(unittest.TestCase):
         self.assertEqual(c.data.shape, (4,))
         self.assertEqual(b.data.shape, (4, 2))
 
+    def test_Field___getitem___slicing_plan(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        f = self.f.squeeze()
+        data_axes = f.get_data_axes()
+
+        plan = f._slicing_plan(data_axes)
+        self.assertEqual(
+            set([key for key, _ in plan]),
+            set(f.constructs.filter_by_axis('or', *data_axes)))
+
+        for indices in ((slice(3, 7), slice(2, 5)),
+                        ([1, 4, 7], slice(6, 2, -1)),
+                        (2, [0, 3, 8])):
+            g = f[indices]
+            self.assertEqual(set(g.constructs), set(f.constructs))
+
+            for key, construct in f.constructs.filter_by_data().items():
+                axes = f.get_data_axes(key)
+                dice = [slice(None)] * len(axes)
+                for i, axis in enumerate(axes):
+                    if axis in data_axes:
+                        dice[i] = indices[data_axes.index(axis)]
+                # --- End: for
+
+                self.assertTrue(
+                    g.constructs[key].equals(construct[tuple(dice)],
+                                             verbose=3),
+                    '{}, {!r}'.format(indices, key))
+        # --- End: for
+
+        # Constructs that do not span the data axes are unchanged
+        g = f[0]
+        for key in f.constructs.filter_by_data():
+            if key not in dict(plan):
+                self.assertTrue(g.constructs[key].equals(f.constructs[key]))
+                self.assertIsNot(g.constructs[key], f.constructs[key])
+        # --- End: for
+
+        # Changing the subspace does not change the original
+        g.data[...] = -1
+        for key in dict(plan):
+            g.constructs[key].set_property('long_name', 'changed')
+            self.assertNotEqual(
+                f.constructs[key].get_property('long_name', None),
+                'changed')
+        # --- End: for
+        self.assertFalse((f.data.array == -1).any())
+
+        # A new metadata construct is in the plan
+        a = cfdm.AuxiliaryCoordinate(
+            data=cfdm.Data(numpy.arange(f.data.shape[1])))
+        a.set_property('long_name', 'new')
+        key = f.set_construct(a, axes=data_axes[1])
+        new_plan = f._slicing_plan(data_axes)
+        self.assertEqual(dict(new_plan)[key], (1,))
+        self.assertTrue((f[:, 3:5].constructs[key].data.array == [3, 4]).all())
+
 #    def test_Field___setitem__(self):
 #        if self.test_only and inspect.stack()[0][3] not in self.test_only:
 #            return
@@ -614,6 +673,66 @@ class FieldTest(unittest.TestCase):
                     self.assertTrue(f.equals(c, verbose=3), message)
         # --- End: for
 
+    def test_Field_compress_ragged(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        # Features with interior missing values, no values, and no
+        # missing values
+        a = numpy.ma.masked_all((4, 5))
+        a[0, :3] = [1, 2, 3]
+        a[0, 1] = cfdm.masked
+        a[2, :5] = [4, 5, 6, 7, 8]
+        a[3, :1] = 9
+
+        f = cfdm.Field()
+        S = f.set_construct(cfdm.DomainAxis(4))
+        T = f.set_construct(cfdm.DomainAxis(5))
+        f.set_data(cfdm.Data(a), axes=[S, T])
+
+        t = a * 10
+        t.mask = a.mask
+        b = numpy.ma.stack([t - 1, t + 1], axis=-1)
+        f.set_construct(
+            cfdm.AuxiliaryCoordinate(data=cfdm.Data(t),
+                                     bounds=cfdm.Bounds(data=cfdm.Data(b))),
+            axes=[S, T], key='auxiliarycoordinate0')
+
+        compressed = [1, -99, 3, 4, 5, 6, 7, 8, 9]
+
+        c = f.compress('contiguous')
+        self.assertEqual(
+            c.data.compressed_array.filled(-99).tolist(), compressed)
+        self.assertEqual(c.data.get_count().data.array.tolist(),
+                         [3, 0, 5, 1])
+        self.assertTrue(c.equals(f, verbose=3))
+
+        c = f.compress('indexed')
+        self.assertEqual(
+            c.data.compressed_array.filled(-99).tolist(), compressed)
+        self.assertEqual(c.data.get_index().data.array.tolist(),
+                         [0, 0, 0, 2, 2, 2, 2, 2, 3])
+        self.assertTrue(c.equals(f, verbose=3))
+
+        aux = c.constructs['auxiliarycoordinate0']
+        self.assertEqual(aux.data.get_compression_type(), 'ragged indexed')
+        self.assertEqual(
+            aux.bounds.data.compressed_array.filled(-99)[:, 1].tolist(),
+            [11, -99, 31, 41, 51, 61, 71, 81, 91])
+
+        # Treat the features as the profiles of two stations
+        g = cfdm.Field()
+        axes = [g.set_construct(cfdm.DomainAxis(n)) for n in (2, 2, 5)]
+        g.set_data(cfdm.Data(a.reshape(2, 2, 5)), axes=axes)
+        c = g.compress('indexed_contiguous')
+        self.assertEqual(
+            c.data.compressed_array.filled(-99).tolist(), compressed)
+        self.assertEqual(c.data.get_count().data.array.tolist(),
+                         [3, 5, 1])
+        self.assertEqual(c.data.get_index().data.array.tolist(),
+                         [0, 1, 1])
+        self.assertTrue(c.equals(g, verbose=3))
+
     def test_Field_creation_commands(self):
         if self.test_only and inspect.stack()[0][3] not in self.test_only:
             return
@@ -34,6 +34,19 @@ class NumpyArrayTest(unittest.TestCase):
         b = numpy.array(x)
         self.assertTrue((b == a).all())
 
+    def test_NumpyArray_view_array(self):
+        a = numpy.ma.array([1, 2, 3, 4], mask=[0, 1, 0, 0])
+
+        x = cfdm.NumpyArray(a)
+
+        v = x.view_array()
+        self.assertTrue((v == a).all())
+        self.assertTrue((v.mask == a.mask).all())
+        self.assertFalse(v.flags.writeable)
+        self.assertFalse(v.mask.flags.writeable)
+        self.assertTrue(a.flags.writeable)
+        self.assertTrue(a.mask.flags.writeable)
+
 # --- End: class
 
 
@@ -1,6 +1,8 @@
 import datetime
 import unittest
 
+import numpy
+
 import cfdm
 
 
@@ -21,6 +23,27 @@ class RaggedContiguousArrayTest(unittest.TestCase):
                                             size=6, ndim=2,
                                             count_variable=count)
 
+    def test_RaggedContiguousArray__getitem__(self):
+        r = self.r
+        a = r[...]
+        self.assertTrue((a.mask == [[False, True, True],
+                                    [False, False, False]]).all())
+        self.assertTrue((a[0, :1] == [280.0]).all())
+        self.assertTrue((a[1] == [281.0, 279.0, 278.0]).all())
+
+        self.assertTrue((r[(slice(1, 2), slice(0, 2))] == [[281.0,
+                                                            279.0]]).all())
+
+        # Missing values in the compressed data are retained
+        compressed_data = cfdm.Data(
+            numpy.ma.array([280.0, 281.0, 279.0, 278.0, 279.5],
+                           mask=[0, 1, 0, 0, 0]))
+        r = cfdm.RaggedContiguousArray(compressed_data, shape=(2, 3),
+                                       size=6, ndim=2,
+                                       count_variable=self.r.get_count())
+        self.assertTrue((r.array.mask == [[False, True, True],
+                                          [True, False, False]]).all())
+
     def test_RaggedContiguousArray_to_memory(self):
         self.assertIsInstance(self.r.to_memory(), cfdm.RaggedContiguousArray)
 
@@ -1,6 +1,8 @@
 import datetime
 import unittest
 
+import numpy
+
 import cfdm
 
 
@@ -21,6 +23,73 @@ class RaggedIndexedArrayTest(unittest.TestCase):
                                          size=6, ndim=2,
                                          index_variable=index)
 
+    def test_RaggedIndexedArray__getitem__(self):
+        compressed_data = cfdm.Data([280.0, 281.0, 279.0, 278.0, 279.5])
+        index = cfdm.Index(data=[1, 0, 1, 0, 1])
+        r = cfdm.RaggedIndexedArray(compressed_data, shape=(2, 3),
+                                    size=6, ndim=2,
+                                    index_variable=index)
+
+        self.assertEqual(
+            [list(i) for i in r._uncompressed_indices()],
+            [[1, 0, 1, 0, 1], [0, 0, 1, 1, 2]])
+
+        a = r[...]
+        self.assertTrue((a.mask == [[False, False, True],
+                                    [False, False, False]]).all())
+        self.assertTrue((a[0, :2] == [281.0, 278.0]).all())
+        self.assertTrue((a[1] == [280.0, 279.0, 279.5]).all())
+
+        b = r[[1, 0], slice(1, 3)]
+        self.assertTrue((b.mask == [[False, False], [False, True]]).all())
+        self.assertTrue((b[0] == [279.0, 279.5]).all())
+        self.assertTrue((b[1, :1] == [278.0]).all())
+
+    def test_RaggedIndexedArray_index_tables(self):
+        compressed_data = cfdm.Data([280.0, 281.0, 279.0, 278.0, 279.5])
+        index = cfdm.Index(data=[1, 0, 1, 0, 1])
+        r = cfdm.RaggedIndexedArray(compressed_data, shape=(2, 3),
+                                    size=6, ndim=2,
+                                    index_variable=index)
+
+        expected = r[...]
+        self.assertEqual(list(r._get_component('index_tables')), ['flat'])
+
+        org = cfdm.index_cache_size()
+        try:
+            for size in (0, 2**20):
+                cfdm.index_cache_size(size)
+                r._set_compressed_Array(compressed_data)
+                for i in range(2):
+                    for j in range(3):
+                        self.assertEqual(r[[i], [j]].filled(-1),
+                                         expected.filled(-1)[i, j])
+
+                tables = r._get_component('index_tables')
+                if size:
+                    self.assertEqual(sorted(tables), ['flat', 'lookup'])
+                else:
+                    self.assertEqual(tables, {})
+
+                self.assertTrue((r[...].mask == expected.mask).all())
+                self.assertTrue((r[...] == expected).all())
+            # --- End: for
+
+            # Setting a new compressed array discards the tables
+            r._set_compressed_Array(cfdm.Data([1.0, 2.0, 3.0, 4.0, 5.0]))
+            self.assertIsNone(r._get_component('index_tables', None))
+            self.assertTrue((r[[1], :] == [1.0, 3.0, 5.0]).all())
+        finally:
+            cfdm.index_cache_size(org)
+
+    def test_RaggedIndexedArray__element_positions(self):
+        self.assertEqual(
+            self.r._element_positions(numpy.array([1, 0, 1, 1, 0])).tolist(),
+            [0, 0, 1, 2, 1])
+        self.assertEqual(
+            self.r._element_positions(numpy.array([], dtype=int)).tolist(),
+            [])
+
     def test_RaggedIndexedArray_to_memory(self):
         self.assertIsInstance(self.r.to_memory(), cfdm.RaggedIndexedArray)
 
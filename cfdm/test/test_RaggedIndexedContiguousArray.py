@@ -15,6 +15,36 @@ class RaggedIndexedContiguousArrayTest(unittest.TestCase):
         # < ... test code ... >
         # cfdm.log_level('DISABLE')
 
+    def test_RaggedIndexedContiguousArray__getitem__(self):
+        compressed_data = cfdm.Data([0.0, 1.0, 2.0, 3.0, 4.0, 5.0])
+        index = cfdm.Index(data=[1, 0, 1])
+        count = cfdm.Count(data=[2, 1, 3])
+
+        r = cfdm.RaggedIndexedContiguousArray(compressed_data,
+                                              shape=(2, 2, 3),
+                                              size=12, ndim=3,
+                                              index_variable=index,
+                                              count_variable=count)
+
+        self.assertEqual(
+            [list(i) for i in r._uncompressed_indices()],
+            [[1, 1, 0, 1, 1, 1], [0, 0, 0, 1, 1, 1], [0, 1, 0, 0, 1, 2]])
+
+        a = r[...]
+        self.assertTrue((a.mask == [[[False, True, True],
+                                     [True, True, True]],
+                                    [[False, False, True],
+                                     [False, False, False]]]).all())
+        self.assertTrue((a[0, 0, :1] == [2.0]).all())
+        self.assertTrue((a[1, 0, :2] == [0.0, 1.0]).all())
+        self.assertTrue((a[1, 1] == [3.0, 4.0, 5.0]).all())
+
+        b = r[[1], [1, 0], slice(1, 3)]
+        self.assertTrue((b.mask == [[[False, False],
+                                     [False, True]]]).all())
+        self.assertTrue((b[0, 0] == [4.0, 5.0]).all())
+        self.assertTrue((b[0, 1, :1] == [1.0]).all())
+
     def test_RaggedIndexedContiguousArray_to_memory(self):
         compressed_data = cfdm.Data(
             [280.0, 281.0, 279.0, 278.0, 279.5,
@@ -360,6 +360,32 @@ class DSGTest(unittest.TestCase):
         for i in range(len(f)):
             self.assertTrue(g[i].equals(f[i], verbose=3))
 
+    def test_DSG_subspace(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        for f in (self.c, self.i, self.ic):
+            for g in f:
+                d = g.data
+                array = d.array
+                mask0 = [i % 2 == 0 for i in range(d.shape[0])]
+                mask1 = [i % 3 == 1 for i in range(d.shape[1])]
+                for indices in ((1,),
+                                (slice(None, None, -1),),
+                                ([2, 0, 1],),
+                                ([0, 2], slice(1, 3)),
+                                (slice(1, 3), [3, 0]),
+                                (mask0,),
+                                (slice(None), mask1)):
+                    indices = indices + (Ellipsis,)
+                    parsed = d._parse_indices(indices)
+                    self.assertTrue(
+                        g._equals(d[indices].array,
+                                  cfdm.NumpyArray.get_subspace(array,
+                                                               parsed)),
+                        '{!r}, {}'.format(g, indices))
+        # --- End: for
+
     def test_DSG_create_contiguous(self):
         if self.test_only and inspect.stack()[0][3] not in self.test_only:
             return
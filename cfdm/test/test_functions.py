@@ -7,6 +7,9 @@ import os
 import tempfile
 import unittest
 
+import netCDF4
+import numpy
+
 import cfdm
 
 
@@ -236,6 +239,103 @@ class FunctionsTest(unittest.TestCase):
         filename = 'https://test_file.nc'
         self.assertEqual(cfdm.abspath(filename), filename)
 
+    def test_open_files(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        f = cfdm.example_field(0)
+        cfdm.write(f, temp_file)
+        g = cfdm.read(temp_file)[0]
+        filename = cfdm.abspath(temp_file)
+
+        org = cfdm.max_open_files()
+        try:
+            cfdm.close_files()
+            stats = cfdm.open_files()
+            g.data.array
+            g.construct('latitude').data.array
+            g.construct('longitude').data.array
+
+            open_files = cfdm.open_files()
+            self.assertEqual(open_files['files'], [filename])
+            self.assertEqual(open_files['misses'], stats['misses'] + 1)
+            self.assertEqual(open_files['hits'], stats['hits'] + 2)
+
+            # Writing to a file closes it
+            cfdm.write(f, temp_file)
+            self.assertEqual(cfdm.open_files()['files'], [])
+            g = cfdm.read(temp_file)[0]
+            self.assertTrue(g.equals(f))
+            self.assertEqual(cfdm.open_files()['files'], [filename])
+
+            cfdm.close_files(temp_file)
+            self.assertEqual(cfdm.open_files()['files'], [])
+
+            # No files are kept open when the maximum is zero
+            cfdm.max_open_files(0)
+            self.assertTrue(g.equals(f))
+            self.assertEqual(cfdm.open_files()['files'], [])
+        finally:
+            cfdm.max_open_files(org)
+
+    def test_block_cache_size(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        # Create a file containing a chunked variable
+        array = numpy.arange(7 * 11 * 13.0).reshape(7, 11, 13)
+        nc = netCDF4.Dataset(temp_file, 'w')
+        for ncdim, size in zip(('z', 'y', 'x'), array.shape):
+            nc.createDimension(ncdim, size)
+
+        q = nc.createVariable('q', 'f8', ('z', 'y', 'x'),
+                              chunksizes=(2, 3, 4))
+        q.standard_name = 'specific_humidity'
+        q[...] = array
+        nc.close()
+
+        g = cfdm.read(temp_file)[0]
+        block_cache = cfdm.data.netcdfarray._block_cache
+
+        org = cfdm.block_cache_size()
+        try:
+            self.assertEqual(cfdm.block_cache_size(2**20), org)
+            self.assertEqual(cfdm.block_cache_size(), 2**20)
+            block_cache.clear()
+            for indices in ((Ellipsis,),
+                            (slice(1, 4), slice(2, 7)),
+                            (slice(None, None, -1), [7, 0, 3]),
+                            ([4, 1], slice(7, 0, -2)),
+                            (slice(None), [True] * 5 + [False] * 6),
+                            (2, 5, 6)):
+                parsed = g.data._parse_indices(indices)
+                self.assertTrue(
+                    (g.data[indices].array ==
+                     cfdm.NumpyArray.get_subspace(array, parsed)).all(),
+                    indices)
+            # --- End: for
+
+            self.assertEqual(g.data[:, [True] * 5 + [False] * 6].shape,
+                             (7, 5, 13))
+
+            # Blocks are taken from the cache when they are read again
+            self.assertTrue(block_cache)
+            blocks = {key: value[0] for key, value in block_cache.items()}
+            self.assertTrue((g.data[1:4].array == array[1:4]).all())
+            self.assertEqual(set(block_cache), set(blocks))
+            for key, value in block_cache.items():
+                self.assertIs(value[0], blocks[key])
+
+            with self.assertRaises(ValueError):
+                cfdm.block_cache_size(-1)
+
+            # A zero-sized cache is emptied when next used
+            cfdm.block_cache_size(0)
+            self.assertTrue((g.data[1:4].array == array[1:4]).all())
+            self.assertFalse(block_cache)
+        finally:
+            cfdm.block_cache_size(org)
+
     def test_configuration(self):
         if self.test_only and inspect.stack()[0][3] not in self.test_only:
             return
@@ -243,13 +343,27 @@ class FunctionsTest(unittest.TestCase):
         # Test getting of all config. and store original values to test on:
         org = cfdm.configuration()
         self.assertIsInstance(org, dict)
-        self.assertEqual(len(org), 3)
+        self.assertEqual(len(org), 10)
         org_atol = org['atol']
         self.assertIsInstance(org_atol, float)
         org_rtol = org['rtol']
         self.assertIsInstance(org_rtol, float)
         org_ll = org['log_level']  # will be 'DISABLE' as disable for test
         self.assertIsInstance(org_ll, str)
+        org_max_open_files = org['max_open_files']
+        self.assertIsInstance(org_max_open_files, int)
+        org_block_cache_size = org['block_cache_size']
+        self.assertIsInstance(org_block_cache_size, int)
+        org_write_block_size = org['write_block_size']
+        self.assertIsInstance(org_write_block_size, int)
+        org_cdl_cache_size = org['cdl_cache_size']
+        self.assertIsInstance(org_cdl_cache_size, int)
+        org_reduction_block_size = org['reduction_block_size']
+        self.assertIsInstance(org_reduction_block_size, int)
+        org_lazy = org['lazy']
+        self.assertIsInstance(org_lazy, bool)
+        org_index_cache_size = org['index_cache_size']
+        self.assertIsInstance(org_index_cache_size, int)
 
         # Store some sensible values to reset items to for testing,
         # ensure these are kept to be different to the defaults:
@@ -325,6 +439,60 @@ class FunctionsTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             cfdm.configuration(log_level=7)
 
+        with self.assertRaises(ValueError):
+            cfdm.configuration(max_open_files=-1)
+
+        # Test max_open_files separately, as its value is independent
+        # of the other items
+        cfdm.configuration(max_open_files=3)
+        self.assertEqual(cfdm.configuration()['max_open_files'], 3)
+        cfdm.configuration(max_open_files=org_max_open_files)
+        self.assertEqual(cfdm.max_open_files(), org_max_open_files)
+
+        cfdm.configuration(block_cache_size=2**20)
+        self.assertEqual(cfdm.configuration()['block_cache_size'], 2**20)
+        cfdm.configuration(block_cache_size=org_block_cache_size)
+        self.assertEqual(cfdm.block_cache_size(), org_block_cache_size)
+
+        cfdm.configuration(write_block_size=2**20)
+        self.assertEqual(cfdm.configuration()['write_block_size'], 2**20)
+        cfdm.configuration(write_block_size=org_write_block_size)
+        self.assertEqual(cfdm.write_block_size(), org_write_block_size)
+        with self.assertRaises(ValueError):
+            cfdm.write_block_size(-1)
+
+        cfdm.configuration(cdl_cache_size=2**20)
+        self.assertEqual(cfdm.configuration()['cdl_cache_size'], 2**20)
+        cfdm.configuration(cdl_cache_size=org_cdl_cache_size)
+        self.assertEqual(cfdm.cdl_cache_size(), org_cdl_cache_size)
+        with self.assertRaises(ValueError):
+            cfdm.cdl_cache_size(-1)
+        with self.assertRaises(ValueError):
+            cfdm.cdl_cache_size(True)
+
+        cfdm.configuration(reduction_block_size=2**20)
+        self.assertEqual(cfdm.configuration()['reduction_block_size'],
+                         2**20)
+        cfdm.configuration(reduction_block_size=org_reduction_block_size)
+        self.assertEqual(cfdm.reduction_block_size(),
+                         org_reduction_block_size)
+        with self.assertRaises(ValueError):
+            cfdm.reduction_block_size(-1)
+
+        cfdm.configuration(lazy=not org_lazy)
+        self.assertEqual(cfdm.configuration()['lazy'], not org_lazy)
+        cfdm.configuration(lazy=org_lazy)
+        self.assertEqual(cfdm.lazy(), org_lazy)
+        with self.assertRaises(ValueError):
+            cfdm.lazy(1)
+
+        cfdm.configuration(index_cache_size=2**20)
+        self.assertEqual(cfdm.configuration()['index_cache_size'], 2**20)
+        cfdm.configuration(index_cache_size=org_index_cache_size)
+        self.assertEqual(cfdm.index_cache_size(), org_index_cache_size)
+        with self.assertRaises(ValueError):
+            cfdm.index_cache_size(-1)
+
         # 4. Check invalid kwarg given logic processes **kwargs:
         with self.assertRaises(TypeError):
             cfdm.configuration(bad_kwarg=1e-15)
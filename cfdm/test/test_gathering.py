@@ -1,5 +1,6 @@
 import atexit
 import datetime
+import inspect
 import os
 import tempfile
 import unittest
@@ -161,6 +162,68 @@ class GatheredTest(unittest.TestCase):
         for i in range(len(f)):
             self.assertTrue(g[i].equals(f[i], verbose=3))
 
+    def test_GATHERING_subspace(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        for g in cfdm.read(self.gathered):
+            d = g.data
+            array = d.array
+            for indices in ((1,),
+                            (slice(None, None, -1),),
+                            (Ellipsis, [3, 0, 2]),
+                            ([0, 1], slice(1, 3)),
+                            (slice(0, 1), [2, 0], [3, 1]),
+                            (Ellipsis, [True, False, False, True, True],
+                             slice(None)),
+                            (slice(None), [True, False, True])):
+                parsed = d._parse_indices(indices)
+                self.assertTrue(
+                    g._equals(d[indices].array,
+                              cfdm.NumpyArray.get_subspace(array, parsed)),
+                    '{!r}, {}'.format(g, indices))
+        # --- End: for
+
+    def test_GATHERING_uncompress(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        # 2-d and 3-d compressed axes, with missing values in the
+        # compressed array
+        for shape, list_array in (((2, 3, 4), [1, 4, 5, 11]),
+                                  ((2, 2, 3, 2), [0, 3, 7, 8, 11])):
+            n = len(list_array)
+            compressed_array = numpy.ma.arange(2.0 * n).reshape(2, n)
+            compressed_array[1, 1] = numpy.ma.masked
+
+            array = cfdm.GatheredArray(
+                compressed_array=cfdm.Data(compressed_array),
+                compressed_dimension=1,
+                shape=shape, size=int(numpy.prod(shape)),
+                ndim=len(shape),
+                list_variable=cfdm.List(data=cfdm.Data(list_array)))
+
+            self.assertEqual(
+                [list(i) for i in array._uncompressed_indices()],
+                [list(i) for i in numpy.unravel_index(list_array,
+                                                      shape[1:])])
+
+            expected = numpy.ma.masked_all(shape)
+            expected.reshape(2, -1)[:, list_array] = compressed_array
+
+            uarray = array[...]
+            self.assertEqual(uarray.shape, shape)
+            self.assertTrue((uarray.mask == expected.mask).all())
+            self.assertTrue((uarray == expected).all())
+
+            # The whole array and subspaces are uncompressed in
+            # different ways, so check that they are consistent
+            indices = [slice(None)] * len(shape)
+            indices[-1] = list(range(shape[-1]))
+            self.assertTrue(cfdm.Data(array[tuple(indices)]).equals(
+                cfdm.Data(uarray), verbose=3))
+        # --- End: for
+
     def test_GATHERING_create(self):
         if self.test_only and inspect.stack()[0][3] not in self.test_only:
             return
@@ -222,6 +285,54 @@ class GatheredTest(unittest.TestCase):
         self.assertTrue((tas.data.get_list().data.array == numpy.array(
             [1, 4, 5])).all())
 
+    def test_GATHERING_compress(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        for f in cfdm.read(self.gathered):
+            data_axes = f.get_data_axes()
+            axes = [data_axes[i] for i in f.data.get_compressed_axes()]
+
+            u = f.uncompress()
+            c = u.compress('gathered', axes=axes)
+
+            self.assertEqual(c.data.get_compression_type(), 'gathered')
+            self.assertEqual(c.data.get_compressed_axes(),
+                             f.data.get_compressed_axes())
+            self.assertTrue((c.data.get_list().data.array ==
+                             f.data.get_list().data.array).all())
+            self.assertTrue(c.equals(f, verbose=3))
+            self.assertTrue(c.equals(u, verbose=3))
+
+            # Already compressed by the same method
+            self.assertIs(c.compress('gathered', axes=axes[::-1],
+                                     inplace=True), None)
+
+            cfdm.write(c, tempfile)
+            g = cfdm.read(tempfile)
+            self.assertEqual(len(g), 1)
+            self.assertEqual(g[0].data.get_compression_type(), 'gathered')
+            self.assertTrue(g[0].equals(f, verbose=3))
+        # --- End: for
+
+        # Metadata constructs which would lose non-missing values are
+        # not gathered
+        f = cfdm.example_field(0)
+        f.data[[0, 2]] = cfdm.masked
+        Y = f.get_data_axes()[0]
+        c = f.compress('gathered', axes=Y)
+        self.assertEqual(c.data.compressed_array.shape, (3, 8))
+        self.assertEqual(c.data.get_list().data.array.tolist(), [1, 3, 4])
+        self.assertFalse(
+            c.construct('latitude').data.get_compression_type())
+        self.assertTrue(c.equals(f, verbose=3))
+
+        with self.assertRaises(ValueError):
+            f.compress('gathered')
+
+        with self.assertRaises(ValueError):
+            f.compress('gathered', axes='domainaxis2')
+
 # --- End: class
 
 
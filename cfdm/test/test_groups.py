@@ -5,11 +5,12 @@ import tempfile
 import unittest
 
 import netCDF4
+import netcdf_flattener
 
 import cfdm
 
 
-n_tmpfiles = 8
+n_tmpfiles = 9
 tmpfiles = [tempfile.mkstemp('_test_groups.nc', dir=os.getcwd())[1]
             for i in range(n_tmpfiles)]
 (
@@ -21,6 +22,7 @@ tmpfiles = [tempfile.mkstemp('_test_groups.nc', dir=os.getcwd())[1]
     grouped_file2,
     grouped_file3,
     grouped_file4,
+    grouped_file5,
 ) = tmpfiles
 
 
@@ -405,6 +407,77 @@ class GroupsTest(unittest.TestCase):
         h = h[0]
         self.assertTrue(f.equals(h, verbose=3))
 
+    def test_groups_flatten_names(self):
+        f = cfdm.example_field(1)
+
+        f.nc_set_variable_groups(['forecast', 'model'])
+        for name in ('longitude', 'latitude', 'measure:area',
+                     'surface_altitude', 'time'):
+            f.construct(name).nc_set_variable_groups(['forecast'])
+
+        cfdm.write(f, grouped_file5)
+
+        nc = netCDF4.Dataset(grouped_file5, 'a')
+        nc.groups['forecast'].comment = 'forecast comment'
+        nc.close()
+
+        nc = netCDF4.Dataset(grouped_file5, 'r')
+        flat_nc = netCDF4.Dataset('flat', 'w', diskless=True, persist=False)
+        netcdf_flattener.flatten(nc, flat_nc, lax_mode=True,
+                                 _copy_data=False)
+
+        r = cfdm.read_write.netcdf.NetCDFRead(cfdm.implementation())
+        flat = r._flatten_names(nc)
+
+        self.assertEqual(list(flat['variables']), list(flat_nc.variables))
+        self.assertEqual(list(flat['dimensions']),
+                         list(flat_nc.dimensions))
+
+        for ncvar, variable in flat_nc.variables.items():
+            self.assertEqual(flat['variable_dimensions'][ncvar],
+                             variable.dimensions)
+            for attr, value in flat['references'][ncvar].items():
+                self.assertEqual(value, variable.getncattr(attr),
+                                 (ncvar, attr))
+        # --- End: for
+
+        self.assertEqual(flat['flattener_variables']['forecast__model__ta'],
+                         '/forecast/model/ta')
+        self.assertEqual(flat['flattener_variables']['x'], 'x')
+        self.assertEqual(
+            flat['flattener_attributes'][('forecast',)],
+            {'comment': 'forecast comment'})
+
+        # The names found from a flattened copy of the dataset are
+        # the same
+        copy = r._flatten_names_from_copy(nc)
+        for key in ('variable_dimensions', 'flattener_variables',
+                    'flattener_dimensions', 'flattener_attributes'):
+            self.assertEqual(copy[key], flat[key], key)
+
+        for key in ('variables', 'dimensions'):
+            self.assertEqual(list(copy[key]), list(flat[key]), key)
+            for name, x in copy[key].items():
+                self.assertIs(x, flat[key][name], (key, name))
+        # --- End: for
+
+        for ncvar, variable in flat['variables'].items():
+            attributes = {attr: variable.getncattr(attr)
+                          for attr in variable.ncattrs()}
+            attributes0 = attributes.copy()
+            attributes0.update(flat['references'][ncvar])
+            attributes.update(copy['references'][ncvar])
+            self.assertEqual(attributes, attributes0, ncvar)
+
+        flat_nc.close()
+        nc.close()
+
+        g = cfdm.read(grouped_file5)
+        self.assertEqual(len(g), 1)
+        g = g[0]
+        self.assertEqual(g.del_property('comment'), 'forecast comment')
+        self.assertTrue(f.equals(g, verbose=3))
+
 # --- End: class
 
 
@@ -1,15 +1,21 @@
 import atexit
+import contextlib
 import datetime
 import inspect
+import io
 import os
 import platform
 import subprocess
 import tempfile
 import unittest
 
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import netCDF4
 import numpy
 
 import cfdm
+from cfdm.read_write.netcdf import netcdfread
 
 warnings = False
 
@@ -131,6 +137,131 @@ class read_writeTest(unittest.TestCase):
                                        'domain_ancillary'), warnings=warnings)
         self.assertEqual(len(f), 14, '\n'+str(f))
 
+    def test_read_many(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        filenames = [self.filename, 'gathered.nc', 'geometry_1.nc']
+        fields = [f for filename in filenames for f in cfdm.read(filename)]
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            for kwargs in ({},
+                           {'workers': 1},
+                           {'workers': 2},
+                           {'executor': executor}):
+                g = cfdm.read_many(filenames, **kwargs)
+                self.assertEqual(len(g), len(fields), kwargs)
+                for f, h in zip(fields, g):
+                    self.assertTrue(f.equals(h, verbose=3), kwargs)
+            # --- End: for
+
+        self.assertEqual(len(cfdm.read_many(self.filename)),
+                         len(cfdm.read(self.filename)))
+        self.assertEqual(cfdm.read_many([]), [])
+
+        with self.assertRaises(IOError):
+            cfdm.read_many(['test_read_write.py', self.filename],
+                           workers=2)
+
+        with self.assertRaises(ValueError):
+            cfdm.read_many(filenames, workers=0)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            with self.assertRaises(ValueError):
+                cfdm.read_many(filenames, executor=executor)
+
+    def test_scan(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        for filename in (self.filename,
+                         'DSG_timeSeries_contiguous.nc',
+                         'DSG_timeSeries_indexed.nc',
+                         'DSG_timeSeriesProfile_indexed_contiguous.nc',
+                         'gathered.nc',
+                         'geometry_1.nc',
+                         'geometry_2.nc',
+                         'geometry_3.nc',
+                         'geometry_4.nc',
+                         'geometry_interior_ring.nc',
+                         'geometry_interior_ring_2.nc',
+                         'combined.nc',
+                         'external.nc',
+                         'external_missing.nc',
+                         'parent.nc',
+                         'string_char.nc'):
+            fields = cfdm.read(filename)
+            summaries = cfdm.scan(filename)
+            self.assertEqual(len(summaries), len(fields), filename)
+
+            for f, x in zip(fields, summaries):
+                self.assertEqual(x['ncvar'], f.nc_get_variable())
+                self.assertEqual(x['identity'], f.identity())
+                self.assertEqual(x['shape'], f.data.shape)
+                self.assertEqual(len(x['dimensions']), f.data.ndim)
+                self.assertEqual(sorted(x['properties']),
+                                 sorted(f.properties()))
+        # --- End: for
+
+        # Hierarchical groups
+        f = cfdm.example_field(1)
+        f.nc_set_variable_groups(['forecast', 'model'])
+        cfdm.write(f, tmpfile)
+
+        (x,) = cfdm.scan(tmpfile)
+        self.assertEqual(x['ncvar'], '/forecast/model/ta')
+        self.assertEqual(x['identity'], 'air_temperature')
+        self.assertEqual(x['shape'], f.data.shape)
+
+        with self.assertRaises(IOError):
+            cfdm.scan('test_read_write.py')
+
+    def test_write_block_size(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        fields = [cfdm.example_field(n) for n in range(8)]
+
+        # An unlimited dimension is chunked in the file, with chunks
+        # that span the other dimensions. The blocks written along
+        # the unlimited dimension do not always divide its size.
+        f = fields[0]
+        f.data[1, 2] = cfdm.masked
+        axis = f.get_data_axes(f.construct_key('longitude'))[0]
+        f.constructs[axis].nc_set_unlimited(True)
+
+        org = cfdm.write_block_size()
+        try:
+            for size in (0, 80, 100, 100000):
+                cfdm.write_block_size(size)
+                for x in fields:
+                    cfdm.write(x, tmpfile)
+                    g = cfdm.read(tmpfile)
+                    self.assertEqual(len(g), 1)
+                    self.assertTrue(g[0].equals(x), size)
+
+                cfdm.write(f, tmpfile)
+                nc = netCDF4.Dataset(tmpfile, 'r')
+                self.assertEqual(nc.variables['q'].chunking(), [5, 1])
+                nc.close()
+
+                # Out-of-range values are only reported once
+                h = f.copy()
+                h.set_property('valid_max', 0.1)
+                with contextlib.redirect_stdout(io.StringIO()) as stdout:
+                    cfdm.write(h, tmpfile, warn_valid=True)
+
+                self.assertEqual(stdout.getvalue().count('WARNING'), 1,
+                                 size)
+
+                # Unmasked missing values are detected in any block
+                h = f.copy()
+                h.set_property('missing_value', h.data[-1, -1].array.item())
+                with self.assertRaises(ValueError):
+                    cfdm.write(h, tmpfile)
+        finally:
+            cfdm.write_block_size(org)
+
     def test_read_write_format(self):
         if self.test_only and inspect.stack()[0][3] not in self.test_only:
             return
@@ -322,6 +453,86 @@ class read_writeTest(unittest.TestCase):
 
 #        subprocess.run(' '.join(['head', tmpfileh]),  shell=True, check=True)
 
+    def test_read_CDL_cache(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        subprocess.run(' '.join(['ncdump', self.filename, '>', tmpfile]),
+                       shell=True, check=True)
+
+        netcdf = cfdm.read_write.netcdf.NetCDFRead(cfdm.implementation())
+
+        # An unchanged CDL file is only converted once per session
+        x = netcdf.cdl_to_netcdf(tmpfile)
+        self.assertEqual(netcdf.cdl_to_netcdf(tmpfile), x)
+
+        # Use a private cache directory, so that the shared cache is
+        # left untouched
+        org_cache = netcdfread._cdl_cache_directory
+        tmpdir = tempfile.TemporaryDirectory()
+        cache = os.path.join(tmpdir.name, 'cfdm_cdl_cache')
+
+        org = cfdm.cdl_cache_size()
+        try:
+            netcdfread._cdl_cache_directory = cache
+            cfdm.cdl_cache_size(2**30)
+
+            # Convert the CDL file again, as if in a new session, and
+            # check that the converted file is cached on disk
+            netcdfread._cdl_netcdf_files.clear()
+            y = netcdf.cdl_to_netcdf(tmpfile)
+            self.assertNotEqual(y, x)
+            self.assertTrue(
+                any(filename.endswith('.nc')
+                    for filename in os.listdir(cache)))
+
+            # Read the converted file from the disk cache
+            netcdfread._cdl_netcdf_files.clear()
+            z = netcdf.cdl_to_netcdf(tmpfile)
+            self.assertNotEqual(z, y)
+            f0 = cfdm.read(self.filename)[0]
+            self.assertTrue(f0.equals(cfdm.read(z)[0], verbose=3))
+
+            # Evict everything from the cache when another file is
+            # added to it
+            subprocess.run(
+                ' '.join(['ncdump', '-h', self.filename, '>', tmpfileh]),
+                shell=True, check=True
+            )
+            cfdm.cdl_cache_size(1)
+            self.assertEqual(len(cfdm.read(tmpfileh)), 1)
+            self.assertFalse(
+                any(filename.endswith('.nc')
+                    for filename in os.listdir(cache)))
+
+            # A cache directory that other users can write to is not
+            # used, so a file placed in it is not read
+            cfdm.cdl_cache_size(2**30)
+            netcdfread._cdl_netcdf_files.clear()
+            netcdf.cdl_to_netcdf(tmpfile)
+            (cached_file,) = [os.path.join(cache, filename)
+                              for filename in os.listdir(cache)
+                              if filename.endswith('.nc')]
+            with open(cached_file, 'wb') as fh:
+                fh.write(b'not a netCDF file')
+
+            os.chmod(cache, 0o777)
+            netcdfread._cdl_netcdf_files.clear()
+            z = netcdf.cdl_to_netcdf(tmpfile)
+            self.assertTrue(f0.equals(cfdm.read(z)[0], verbose=3))
+
+            # Nor is a cache directory owned by another user
+            if hasattr(os, 'getuid') and os.getuid() == 0:
+                os.chmod(cache, 0o700)
+                os.chown(cache, 1, -1)
+                netcdfread._cdl_netcdf_files.clear()
+                z = netcdf.cdl_to_netcdf(tmpfile)
+                self.assertTrue(f0.equals(cfdm.read(z)[0], verbose=3))
+        finally:
+            cfdm.cdl_cache_size(org)
+            netcdfread._cdl_cache_directory = org_cache
+            tmpdir.cleanup()
+
     def test_read_write_string(self):
         if self.test_only and inspect.stack()[0][3] not in self.test_only:
             return
@@ -448,6 +659,51 @@ class read_writeTest(unittest.TestCase):
         self.assertEqual(len(g), 1)
         self.assertTrue(g[0].equals(f))
 
+    def test_write_shared_metadata(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        f = cfdm.example_field(0)
+
+        fields = []
+        for n in range(4):
+            g = f.copy()
+            g.set_property('test_id', str(n))
+            g.nc_set_variable('q{}'.format(n))
+            g.construct('time').data[...] = n // 2
+            fields.append(g)
+
+        # Differences within the numerical tolerance do not prevent
+        # metadata from being shared
+        lat = fields[-1].construct('latitude')
+        lat.data[...] = lat.data.array * (1 + cfdm.rtol() / 4)
+        self.assertTrue(lat.equals(f.construct('latitude')))
+
+        # Differences beyond the numerical tolerance do prevent
+        # metadata from being shared
+        lon = fields[-1].construct('longitude')
+        lon.data[0] = lon.data[0].array + 1
+
+        cfdm.write(fields, tmpfile)
+
+        nc = netCDF4.Dataset(tmpfile, 'r')
+        variables = set(nc.variables)
+        nc.close()
+
+        # 4 data variables, 1 latitude and 2 longitude coordinates
+        # (each with bounds), and 2 time coordinates
+        self.assertEqual(len(variables), 12)
+        self.assertTrue(variables.issuperset(('lat', 'lat_bnds')))
+        self.assertEqual(len([v for v in variables
+                              if v.startswith('lat')]), 2)
+
+        g = cfdm.read(tmpfile)
+        self.assertEqual(len(g), len(fields))
+        for x in fields:
+            self.assertTrue(
+                any([x.equals(y) for y in g]),
+                x.get_property('test_id'))
+
 # --- End: class
 
 